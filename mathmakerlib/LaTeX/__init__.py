@@ -25,6 +25,7 @@
 from .attr_list import AttrList, OptionsList
 from .commands import Command, DocumentClass, UsePackage, UseTikzLibrary
 from .environment import Environment, TikZPicture
+from .preamble import Preamble
 
 DEFAULT_FONT_SIZES = [r'\tiny', r'\scriptsize', r'\footnotesize', r'\small',
                       r'\normalsize', r'\large', r'\Large', r'\LARGE',
@@ -95,4 +96,4 @@ DASHPATTERN_VALUES = ['solid', 'dotted', 'densely dotted', 'loosely dotted',
                       'loosely dash dot dot']
 
 __all__ = [AttrList, OptionsList, Command, DocumentClass, UsePackage,
-           UseTikzLibrary, Environment, TikZPicture]
+           UseTikzLibrary, Environment, TikZPicture, Preamble]
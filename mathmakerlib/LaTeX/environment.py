@@ -20,6 +20,12 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 from . import OptionsList
+from mathmakerlib.templates import _placeholders_plan
+
+PLACEHOLDERS = ('NAME', 'OPTIONS', 'CONTENT')
+
+# Environments' templates, split into (literal, placeholder) segments
+_plans = {}
 
 
 class Environment(object):
@@ -49,10 +55,31 @@ class Environment(object):
 CONTENT
 \end{NAME}'''
 
+    def _chunks(self):
+        """Yield the parts of the environment, in the order of its template."""
+        template = self.template
+        plan = _plans.get(template)
+        if plan is None:
+            plan = _plans[template] = _placeholders_plan(template,
+                                                         PLACEHOLDERS)
+        values = {'NAME': self.name, 'OPTIONS': str(self.options),
+                  'CONTENT': self.content}
+        for literal, placeholder in plan:
+            yield literal
+            if placeholder is not None:
+                yield values[placeholder]
+
     def __str__(self):
-        return self.template.replace('NAME', self.name)\
-            .replace('CONTENT', self.content)\
-            .replace('OPTIONS', str(self.options))
+        return ''.join(self._chunks())
+
+    def imprint_to(self, fp):
+        """
+        Write the environment to the text stream fp, part by part.
+
+        Same output as str(self), without building the whole string first.
+        """
+        for chunk in self._chunks():
+            fp.write(chunk)
 
 
 class TikZPicture(Environment):
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+from mathmakerlib import required
+from . import UsePackage, UseTikzLibrary
+
+# xcolor must be loaded before tikz (that loads it too), otherwise its options
+# would clash
+LOADED_FIRST = ['xcolor']
+
+
+def _ordered(keys, known_keys):
+    """Sort keys as in known_keys; unknown keys go last, alphabetically."""
+    known_keys = list(known_keys)
+    return sorted(keys, key=lambda k: (0, known_keys.index(k), '')
+                  if k in known_keys else (1, 0, k))
+
+
+class Preamble(object):
+    """
+    The minimal preamble matching some requirements.
+
+    Preambles built from the same requirements are equal, have the same hash
+    and the same content, whatever the order the requirements were set in.
+    """
+
+    def __init__(self, requirements=None):
+        """
+        Initialize Preamble
+
+        :param requirements: the requirements to match. Default is the
+        requirements collected so far in the current context.
+        :type requirements: None or required.RequirementsCollector or an
+        iterable of (name, key, value) tuples, as returned by
+        RequirementsCollector.requirements()
+        """
+        if requirements is None:
+            requirements = required.current()
+        if isinstance(requirements, required.RequirementsCollector):
+            requirements = requirements.requirements()
+        requirements = set(requirements)
+        for r in requirements:
+            if (not isinstance(r, tuple) or len(r) != 3
+                or r[0] not in required.REQUIREMENTS):
+                raise ValueError('Requirements must be (name, key, value) '
+                                 'tuples, name belonging to {}; got {} '
+                                 'instead.'
+                                 .format(required.REQUIREMENTS, repr(r)))
+        self._requirements = tuple(sorted(r for r in requirements if r[2]))
+
+    def __repr__(self):
+        return 'Preamble({})'.format(repr(self._requirements))
+
+    def __eq__(self, other):
+        return isinstance(other, Preamble) \
+            and self._requirements == other._requirements
+
+    def __hash__(self):
+        return hash(self._requirements)
+
+    @property
+    def requirements(self):
+        return self._requirements
+
+    def _keys(self, name):
+        return {key for n, key, _ in self._requirements if n == name}
+
+    @property
+    def packages(self):
+        """The UsePackage commands, in loading order."""
+        options = {}
+        for name, key, value in self._requirements:
+            if name == 'options':
+                options.setdefault(key, []).append(value)
+        names = self._keys('package') | set(options)
+        if any(self._keys(name)
+               for name in ['tikz_library', 'tikzset', 'callout_style']):
+            names.add('tikz')
+        known = LOADED_FIRST \
+            + list(required.RequirementsCollector().package)
+        return [UsePackage(name, options=options.get(name))
+                for name in _ordered(names, known)]
+
+    @property
+    def tikz_libraries(self):
+        """The UseTikzLibrary command, or None if no library is required."""
+        libraries = _ordered(self._keys('tikz_library'),
+                             required.RequirementsCollector().tikz_library)
+        if not libraries:
+            return None
+        return UseTikzLibrary(libraries)
+
+    @property
+    def tikzsets(self):
+        r"""The \tikzset commands."""
+        from mathmakerlib import config
+        from mathmakerlib.LaTeX import TIKZSET
+        known = required.RequirementsCollector()
+        tikzsets = [TIKZSET[key].strip()
+                    for key in _ordered(self._keys('tikzset'), known.tikzset)]
+        tikzsets += [r'\tikzset{' + key + '/.style={'
+                     + config.callout_styles[key] + '}}'
+                     for key in _ordered(self._keys('callout_style'),
+                                         known.callout_style)]
+        return tikzsets
+
+    def __str__(self):
+        lines = [str(p) for p in self.packages]
+        if self.tikz_libraries is not None:
+            lines.append(str(self.tikz_libraries))
+        return '\n'.join(lines + self.tikzsets)
@@ -22,11 +22,11 @@
 
 from importlib.metadata import metadata
 
-from . import required, exceptions, config, shared
+from . import required, exceptions, config, shared, templates
 from . import calculus, core, geometry, LaTeX
 
-__all__ = ['required', 'config', 'shared', 'LaTeX', 'exceptions',
-           'core', 'calculus', 'geometry']
+__all__ = ['required', 'config', 'shared', 'templates', 'LaTeX',
+           'exceptions', 'core', 'calculus', 'geometry']
 
 __lib_name__ = metadata(__name__)['Name']
 __version__ = metadata(__name__)['Version']
@@ -21,10 +21,12 @@
 
 from .tools import is_number, is_integer, is_natural, prime_factors
 from .tools import prime_decomposition, weighted_average
+from .tools import factorize, factorize_many
 from .exponented import Exponented
 from .number import Sign, Number, move_fracdigits_to, remove_fracdigits_from
-from .number import fix_fracdigits
+from .number import fix_fracdigits, convert_many, trig_table
 from .unit import Unit, physical_quantity, difference_of_orders_of_magnitude
+from .number_array import NumberArray
 from .fraction import Fraction
 from .clocktime import ClockTime
 from .table import Table
@@ -32,7 +34,8 @@ from . import equations
 
 __all__ = ['is_number', 'is_integer', 'is_natural', 'Exponented', 'Sign',
            'Number', 'move_fracdigits_to', 'remove_fracdigits_from',
-           'fix_fracdigits', 'Unit', 'physical_quantity',
-           'difference_of_orders_of_magnitude',
-           'Fraction', 'prime_factors', 'prime_decomposition',
-           'ClockTime', 'Table', 'equations', 'weighted_average']
+           'fix_fracdigits', 'convert_many', 'trig_table', 'Unit',
+           'physical_quantity', 'difference_of_orders_of_magnitude',
+           'NumberArray', 'Fraction', 'prime_factors', 'prime_decomposition',
+           'factorize', 'factorize_many', 'ClockTime', 'Table', 'equations',
+           'weighted_average']
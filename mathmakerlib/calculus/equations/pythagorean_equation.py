@@ -24,8 +24,10 @@ from gettext import translation
 
 from .equation import Equation
 from mathmakerlib.calculus.number import Number
-from mathmakerlib.shared import ROOTDIR, L10N_DOMAIN, LOCALEDIR
-from mathmakerlib import config
+from mathmakerlib.shared import L10N_DOMAIN, LOCALEDIR
+from mathmakerlib import config, templates
+
+TEMPLATES_DIR = 'calculus/equations/templates'
 
 
 class PythagoreanEquation(Equation):
@@ -52,8 +54,7 @@ class PythagoreanEquation(Equation):
 
     def calculate_square_hyp(self):
         template_fn = 'pythagorean_equation_calculate_square_hyp.tex'
-        template_path = ROOTDIR / 'calculus/equations/templates' / template_fn
-        template = template_path.read_text()
+        template = templates.get(f'{TEMPLATES_DIR}/{template_fn}')
         hyp_length = Number(self.rt.hyp.label_value, unit=None)
         square_hyp_length = hyp_length * hyp_length
         data = {'hyp_length': hyp_length.printed,
@@ -63,8 +64,7 @@ class PythagoreanEquation(Equation):
 
     def calculate_square_legs_sum(self):
         template_fn = 'pythagorean_equation_calculate_square_legs_sum.tex'
-        template_path = ROOTDIR / 'calculus/equations/templates' / template_fn
-        template = template_path.read_text()
+        template = templates.get(f'{TEMPLATES_DIR}/{template_fn}')
         leg0_length = Number(self.rt.leg0.label_value, unit=None)
         leg1_length = Number(self.rt.leg1.label_value, unit=None)
         square_leg0_length = leg0_length * leg0_length
@@ -100,8 +100,7 @@ class PythagoreanEquation(Equation):
         square_hyp_length = hyp_length * hyp_length
         right = square_hyp_length == square_legs_sum
         template_fn = 'pythagorean_equation_autotest.tex'
-        template_path = ROOTDIR / 'calculus/equations/templates' / template_fn
-        template = template_path.read_text()
+        template = templates.get(f'{TEMPLATES_DIR}/{template_fn}')
         data = {'on_one_hand': on_one_hand,
                 'calculate_square_hyp': self.calculate_square_hyp().rstrip(),
                 'on_the_other': on_the_other,
@@ -133,8 +132,7 @@ class PythagoreanEquation(Equation):
             if shortcut_mode and not unknown_side == 'hyp' else ''
         template_fn = f'pythagorean_equation_calculate_{unknown_side}'\
             f'{shortcut}{detailed}.tex'
-        template_path = ROOTDIR / 'calculus/equations/templates' / template_fn
-        template = template_path.read_text()
+        template = templates.get(f'{TEMPLATES_DIR}/{template_fn}')
         data = {'hyp': self.rt.hyp.length_name,
                 'leg0': self.rt.leg0.length_name,
                 'leg1': self.rt.leg1.length_name}
@@ -25,7 +25,10 @@
 from .equation import Equation
 from mathmakerlib.calculus.number import Number
 from mathmakerlib.core.printable import Printable
-from mathmakerlib.shared import ROOTDIR  # , L10N_DOMAIN, LOCALEDIR
+from mathmakerlib import templates
+# from mathmakerlib.shared import L10N_DOMAIN, LOCALEDIR
+
+TEMPLATES_DIR = 'calculus/equations/templates'
 
 EQUALITIES = \
     {'cos': r'\[\text{{cos}}(\text{{{angle}}})='
@@ -197,6 +200,5 @@ class TrigonometricEquation(Equation):
             div_or_frac = '_div'
         template_fn = f'trigonometric_equation_calculate_' \
             f'{template_id}{div_or_frac}.tex'
-        template_path = ROOTDIR / 'calculus/equations/templates' / template_fn
-        template = template_path.read_text()
+        template = templates.get(f'{TEMPLATES_DIR}/{template_fn}')
         return f'{self.formula.printed}\n{template.format(**data)}'
@@ -22,19 +22,41 @@
 """Fractions."""
 
 from math import gcd
+from decimal import Decimal
 
 from mathmakerlib.calculus.number import Sign, Number
 from mathmakerlib.calculus.tools import is_number, is_integer
-from mathmakerlib.calculus.tools import prime_factors
+from mathmakerlib.calculus.tools import factorize
 from mathmakerlib.core.signed import Signed
 from mathmakerlib.core.printable import Printable
 from mathmakerlib.core.evaluable import Evaluable
 from mathmakerlib.exceptions import StopFractionReduction
 
 
+def _ratio(value):
+    """
+    Return value as an exact (numerator, denominator) pair of ints.
+
+    The denominator is always positive. Return None if value is no number.
+    A float is taken as it is written (0.1 is 1/10), not as its binary value.
+    """
+    if isinstance(value, Fraction):
+        return value._ratio
+    if isinstance(value, Number) and value.unit is not None:
+        return None
+    if isinstance(value, (int, Decimal)):
+        return value.as_integer_ratio()
+    if isinstance(value, float):
+        return Decimal(str(value)).as_integer_ratio()
+    return None
+
+
 class Fraction(Signed, Printable, Evaluable):
     """Fractions."""
 
+    __slots__ = ('_sign', '_numerator', '_denominator', '_written', '_hash',
+                 '_gcd')
+
     # To keep Fraction immutable, use __new__ not __init__
     def __new__(cls, sign=None, numerator=None, denominator=None,
                 from_decimal=None):
@@ -51,7 +73,7 @@ class Fraction(Signed, Printable, Evaluable):
                 raise TypeError('Numerator and denominator must be numbers. '
                                 'Got {} and {} instead.'
                                 .format(type(numerator), type(denominator)))
-            if not(is_integer(numerator) and is_integer(denominator)):
+            if not (is_integer(numerator) and is_integer(denominator)):
                 raise TypeError('Numerator and denominator must be integers. '
                                 'Got {} and {} instead.'
                                 .format(numerator, denominator))
@@ -67,84 +89,229 @@ class Fraction(Signed, Printable, Evaluable):
             denominator = numerator
             numerator = sign
             sign = '+'
-        # some initialization
+        # Keep the numerator and denominator as they are written (e.g. 3.0)
+        # when it differs from their int value, in order to print them
+        written = None
+        if not (type(numerator) is int and type(denominator) is int):
+            n, d = Number(numerator), Number(denominator)
+            if str(n) != str(int(n)) or str(d) != str(int(d)):
+                written = (n, d)
+        return cls._from_ints(str(Sign(sign)), int(numerator),
+                              int(denominator), written=written)
+
+    @classmethod
+    def _from_ints(cls, sign, numerator, denominator, written=None):
+        """
+        Create a Fraction from its sign and its numerator's and denominator's
+        ints.
+
+        written, if not None, is the (numerator, denominator) pair of Numbers
+        to print instead of the ints. The ints are used for all calculations.
+        """
         self = object.__new__(cls)
-        self._sign = Sign(sign)
-        self._numerator = Number(numerator)
-        self._denominator = Number(denominator)
+        self._sign = sign
+        self._numerator = numerator
+        self._denominator = denominator
+        self._written = written
+        self._hash = hash((sign, numerator, denominator))
+        self._gcd = None
         return self
 
+    @classmethod
+    def _from_ratio(cls, numerator, denominator):
+        """Create the reduced Fraction matching numerator / denominator."""
+        if denominator == 0:
+            raise ZeroDivisionError('Fraction division by zero.')
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        g = gcd(numerator, denominator)
+        sign = '-' if numerator < 0 else '+'
+        return cls._from_ints(sign, abs(numerator) // g, denominator // g)
+
     def __hash__(self):
-        return hash(str(self.sign) + str(self.numerator)
-                    + str(self.denominator))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, Fraction):
             return False
-        return (self.sign == other.sign and self.numerator == other.numerator
-                and self.denominator == other.denominator)
+        return (self._sign == other._sign
+                and self._numerator == other._numerator
+                and self._denominator == other._denominator)
 
     def __ne__(self, other):
-        if not isinstance(other, Fraction):
-            return True
-        return (self.sign != other.sign or self.numerator != other.numerator
-                or self.denominator != other.denominator)
+        return not self.__eq__(other)
+
+    @property
+    def _ratio(self):
+        """self as (numerator, denominator) ints, denominator being > 0."""
+        n, d = self._numerator, self._denominator
+        if self._sign == '-':
+            n = -n
+        if d < 0:
+            n, d = -n, -d
+        return (n, d)
+
+    def _compare(self, other):
+        """
+        Return self's and other's numerators, on the same denominator.
+
+        Return None if other cannot be turned to a ratio (e.g. a Number having
+        a unit); then self's value is compared to other, as a Number.
+        """
+        r = _ratio(other)
+        if r is None:
+            return None
+        n, d = self._ratio
+        return (n * r[1], r[0] * d)
 
     def __lt__(self, other):
-        return self.evaluate().__lt__(other)
+        c = self._compare(other)
+        if c is None:
+            return self.evaluate().__lt__(other)
+        return c[0] < c[1]
 
     def __gt__(self, other):
-        return self.evaluate().__gt__(other)
+        c = self._compare(other)
+        if c is None:
+            return self.evaluate().__gt__(other)
+        return c[0] > c[1]
 
     def __le__(self, other):
-        return self.evaluate().__le__(other)
+        c = self._compare(other)
+        if c is None:
+            return self.evaluate().__le__(other)
+        return c[0] <= c[1]
 
     def __ge__(self, other):
-        return self.evaluate().__ge__(other)
+        c = self._compare(other)
+        if c is None:
+            return self.evaluate().__ge__(other)
+        return c[0] >= c[1]
+
+    def __add__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(n * r[1] + r[0] * d, d * r[1])
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(n * r[1] - r[0] * d, d * r[1])
+
+    def __rsub__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(r[0] * d - n * r[1], d * r[1])
+
+    def __mul__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(n * r[0], d * r[1])
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(n * r[1], d * r[0])
+
+    def __rtruediv__(self, other):
+        r = _ratio(other)
+        if r is None:
+            return NotImplemented
+        n, d = self._ratio
+        return Fraction._from_ratio(r[0] * d, r[1] * n)
+
+    def __neg__(self):
+        return Fraction._from_ints('+' if self._sign == '-' else '-',
+                                   self._numerator, self._denominator,
+                                   written=self._written)
+
+    def _terms(self):
+        """Numerator and denominator, as they are printed."""
+        if self._written is None:
+            return (self._numerator, self._denominator)
+        return self._written
 
     def __repr__(self):
-        if self.sign == '+':
-            return 'Fraction({}, {})'.format(self.numerator, self.denominator)
-        return 'Fraction(\'{}\', {}, {})'.format(self.sign, self.numerator,
-                                                 self.denominator)
+        n, d = self._terms()
+        if self._sign == '+':
+            return 'Fraction({}, {})'.format(n, d)
+        return 'Fraction(\'{}\', {}, {})'.format(self._sign, n, d)
 
     @property
     def sign(self):
-        return self._sign
+        return Sign(self._sign)
 
     @property
     def numerator(self):
         """Numerator of the Fraction."""
-        return self._numerator
+        return Number(self._terms()[0])
 
     @property
     def denominator(self):
         """Denominator of the Fraction."""
-        return self._denominator
+        return Number(self._terms()[1])
+
+    @property
+    def gcd(self):
+        """Greatest common divisor of numerator and denominator (cached)."""
+        if self._gcd is None:
+            self._gcd = gcd(self._numerator, self._denominator)
+        return self._gcd
 
     def imprint(self, start_expr=True, variant='latex'):
-        s = self.sign
+        s = self._sign
         if s == '+' and start_expr:
             s = ''
+        n, d = self._terms()
         if variant == 'latex':
             return r'{}\dfrac{}{}' \
-                .format(s, '{' + str(self.numerator) + '}',
-                        '{' + str(self.denominator) + '}')
+                .format(s, '{' + str(n) + '}', '{' + str(d) + '}')
         elif variant == 'user_input':
-            return '{}{}/{}'.format(s, self.numerator, self.denominator)
+            return '{}{}/{}'.format(s, n, d)
 
     def evaluate(self, **kwargs):
-        return self.sign.evaluate() \
-            * self.numerator.evaluate() / self.denominator.evaluate()
+        n = self.numerator if self._sign == '+' else -self.numerator
+        return n / self.denominator
 
     def is_reducible(self):
         """True if the Fraction is reducible."""
-        return gcd(int(self.numerator), int(self.denominator)) > 1
+        return self.gcd > 1
 
     def reduced(self):
         """Completely reduced Fraction (may return an integer number)."""
-        g = gcd(int(self.numerator), int(self.denominator))
-        return Fraction(self.sign, self.numerator / g, self.denominator / g)
+        return self._divided_by(self.gcd, to_number=False)
+
+    def _divided_by(self, n, to_number=True):
+        """
+        Divide numerator and denominator by n (n must divide both).
+
+        If to_number is True and the denominator becomes 1, return the matching
+        Number instead of a Fraction.
+        """
+        written = None
+        if self._written is not None:
+            written = (self._written[0] / n, self._written[1] / n)
+        result = Fraction._from_ints(self._sign, self._numerator // n,
+                                     self._denominator // n, written=written)
+        if to_number and result._denominator == 1:
+            return result.evaluate()
+        return result
 
     def reduced_by(self, n):
         """Return Fraction reduced by n (possibly return a Number)."""
@@ -154,18 +321,17 @@ class Fraction(Signed, Printable, Evaluable):
         if not is_integer(n):
             raise TypeError('A Fraction can be reduced only by an integer, '
                             'got {} instead.'.format(n))
-        if not is_integer(self.numerator / n):
+        k = abs(int(n))
+        if self._numerator % k:
             raise ValueError('Cannot divide {} by {} and get an integer.'
-                             .format(self.numerator, n))
-        if not is_integer(self.denominator / n):
+                             .format(self._numerator, n))
+        if self._denominator % k:
             raise ValueError('Cannot divide {} by {} and get an integer.'
-                             .format(self.denominator, n))
-        n = abs(n)
-        if self.denominator / n == 1:
-            return self.sign * self.numerator / n
-        if self.denominator / n == -1:
-            return Sign('-') * self.sign * self.numerator / n
-        return Fraction(self.sign, self.numerator / n, self.denominator / n)
+                             .format(self._denominator, n))
+        result = self._divided_by(k)
+        if isinstance(result, Fraction) and result._denominator == -1:
+            return result.evaluate()
+        return result
 
     def reduce(self):
         """
@@ -176,9 +342,5 @@ class Fraction(Signed, Printable, Evaluable):
         if not self.is_reducible():
             raise StopFractionReduction(self)
         # lowest prime common divisor
-        lpcd = prime_factors(gcd(int(self.numerator),
-                                 int(self.denominator)))[0]
-        if self.denominator / lpcd == 1:
-            return self.sign * self.numerator / lpcd
-        return Fraction(self.sign,
-                        self.numerator / lpcd, self.denominator / lpcd)
+        lpcd = factorize(self.gcd)[0][0]
+        return self._divided_by(lpcd)
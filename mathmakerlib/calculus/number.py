@@ -23,12 +23,13 @@ import copy
 import math
 import locale
 import random
+from functools import lru_cache
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
 
 from mathmakerlib import required
 from mathmakerlib.calculus.unit import physical_quantity
 from mathmakerlib.calculus.tools import is_number, is_integer
-from mathmakerlib.calculus.tools import prime_decomposition
+from mathmakerlib.calculus.tools import factorize
 from mathmakerlib.core.signed import Signed
 from mathmakerlib.core.printable import Printable
 from mathmakerlib.core.evaluable import Evaluable
@@ -119,7 +120,7 @@ class Number(Decimal, Signed, Printable, Evaluable):
         if isinstance(value, float):
             value = str(value)
         if isinstance(value, Number) and unit == 'undefined':
-            unit = copy.deepcopy(value.unit)
+            unit = value.unit
         if unit == 'undefined':
             unit = None
         self = super().__new__(cls, value=value, context=context)
@@ -137,10 +138,9 @@ class Number(Decimal, Signed, Printable, Evaluable):
             return self     # I'm immutable; therefore I am my own clone
         return self.__class__(self)
 
-    def __deepcopy__(self, memo):  # Similar to Decimal.__deepcopy__()...
+    def __deepcopy__(self, memo):  # Similar to Decimal.__deepcopy__()
         if type(self) is Number:
-            # ...but my components are *not* also immutable
-            return Number(value=self, unit=self.unit)
+            return self     # My Unit is immutable too
         return self.__class__(self, unit=self.unit)
 
     def __eq__(self, other):
@@ -209,9 +209,9 @@ class Number(Decimal, Signed, Printable, Evaluable):
         other = Number(other)
         u = None
         if self.unit is None:
-            u = copy.deepcopy(other.unit)
+            u = other.unit
         elif other.unit is None:
-            u = copy.deepcopy(self.unit)
+            u = self.unit
         elif self.unit.content == other.unit.content:
             if self.unit.exponent is None:
                 se = Number(1)
@@ -248,13 +248,12 @@ class Number(Decimal, Signed, Printable, Evaluable):
         if self.unit is None and other.unit is None:
             u = None
         elif self.unit is None:
-            u = copy.deepcopy(other.unit)
-            if u.exponent is None:
-                u.exponent = -Number(1)
+            if other.unit.exponent is None:
+                u = Unit(other.unit, exponent=-Number(1))
             else:
-                u.exponent = -u.exponent
+                u = Unit(other.unit, exponent=-other.unit.exponent)
         elif other.unit is None:
-            u = copy.deepcopy(self.unit)
+            u = self.unit
         elif self.unit.content == other.unit.content:
             if self.unit.exponent is None:
                 se = Number(1)
@@ -313,13 +312,13 @@ class Number(Decimal, Signed, Printable, Evaluable):
         return Number(Decimal(self).__rpow__(other))
 
     def __neg__(self):
-        return Number(-Decimal(self), unit=copy.deepcopy(self.unit))
+        return Number(-Decimal(self), unit=self.unit)
 
     def __pos__(self):
-        return Number(+Decimal(self), unit=copy.deepcopy(self.unit))
+        return Number(+Decimal(self), unit=self.unit)
 
     def __abs__(self):
-        return Number(abs(Decimal(self)), unit=copy.deepcopy(self.unit))
+        return Number(abs(Decimal(self)), unit=self.unit)
 
     def __str__(self):
         basic_str = Decimal.__str__(self)
@@ -342,99 +341,36 @@ class Number(Decimal, Signed, Printable, Evaluable):
 
     def cos(self):
         """Return the cosine of self degrees and handle special cases."""
-        d = abs(Decimal(self) % 360)
-        if d == Decimal(0):
-            return Number(1)
-        elif d in [Decimal(60), Decimal(300)]:
-            return Number('0.5')
-        elif d in [Decimal(90), Decimal(270)]:
-            return Number(0)
-        elif d in [Decimal(120), Decimal(240)]:
-            return Number('-0.5')
-        elif d == Decimal(180):
-            return Number(-1)
-        return Number(math.cos(math.radians(d)))
+        return _trigonometric_value('cos', abs(Decimal(self) % 360))
 
     def acos(self):
         """
         Return the arc cosine of self, in degrees, and handle special cases.
         The result is between 0 and 180.
         """
-        d = Decimal(self)
-        result = math.degrees(math.acos(d))
-        if d == 0:
-            result = 90
-        elif d == Decimal('0.5'):
-            result = 60
-        elif d == 1:
-            result = 0
-        elif d == Decimal('-0.5'):
-            result = 120
-        elif d == -1:
-            result = 180
-        return Number(result).standardized()
+        return _inverse_trigonometric_value('acos', Decimal(self))
 
     def sin(self):
         """Return the sine of self degrees and handle special cases."""
-        d = Decimal(self) % 360
-        if d in [Decimal(0), Decimal(180), Decimal(-180)]:
-            return Number(0)
-        elif d in [Decimal(30), Decimal(150), Decimal(-330), Decimal(-210)]:
-            return Number('0.5')
-        elif d in [Decimal(90), Decimal(-270)]:
-            return Number(1)
-        elif d in [Decimal(-30), Decimal(-150), Decimal(330), Decimal(210)]:
-            return Number('-0.5')
-        elif d in [Decimal(-90), Decimal(270)]:
-            return Number(-1)
-        return Number(math.sin(math.radians(d)))
+        return _trigonometric_value('sin', Decimal(self) % 360)
 
     def asin(self):
         """
         Return the arc sine of self, in degrees, and handle special cases.
         The result is between -90 and 90.
         """
-        d = Decimal(self)
-        result = math.degrees(math.asin(d))
-        if d == 0:
-            result = 0
-        elif d == Decimal('0.5'):
-            result = 30
-        elif d == 1:
-            result = 90
-        elif d == Decimal('-0.5'):
-            result = -30
-        elif d == -1:
-            result = -90
-        return Number(result).standardized()
+        return _inverse_trigonometric_value('asin', Decimal(self))
 
     def tan(self):
         """Return the tangent of self degrees and handle special cases."""
-        d = Decimal(self) % 360
-        if d in [Decimal(0), Decimal(180), Decimal(-180)]:
-            return Number(0)
-        elif d in [Decimal(45), Decimal(225)]:
-            return Number(1)
-        elif d in [Decimal(135), Decimal(315)]:
-            return Number(-1)
-        elif d in [Decimal(90), Decimal(-90), Decimal(270), Decimal(-270)]:
-            raise ValueError('Tangent of 90° or -90° is indefinite.')
-        return Number(math.tan(math.radians(d)))
+        return _trigonometric_value('tan', Decimal(self) % 360)
 
     def atan(self):
         """
         Return the arc tangent of self, in degrees, and handle special cases.
         The result is between -90 and 90.
         """
-        d = Decimal(self)
-        result = math.degrees(math.atan(d))
-        if d == 0:
-            result = 0
-        elif d == 1:
-            result = 45
-        elif d == -1:
-            result = -45
-        return Number(result).standardized()
+        return _inverse_trigonometric_value('atan', Decimal(self))
 
     def quantize(self, exp, rounding=None, context=None):
         return Number(Decimal(self).quantize(exp,
@@ -517,7 +453,7 @@ class Number(Decimal, Signed, Printable, Evaluable):
                                        'physical quantity'):
                 raise TypeError('Cannot convert {} into {}.'
                                 .format(self.uiprinted, unit.uiprinted))
-        return Number(self * factor, unit=unit)
+        return Number(Decimal(self) * factor, unit=unit)
 
     def lowest_nonzero_digit_index(self):
         """
@@ -712,7 +648,7 @@ class Number(Decimal, Signed, Printable, Evaluable):
 
     def split(self, operation='sum', dig=0, return_all=False,
               int_as_halves=False, int_as_quarters=False,
-              int_as_halves_or_quarters=False, at_unit=False):
+              int_as_halves_or_quarters=False, at_unit=False, rng=None):
         """
         Split self as a sum or difference, e.g. self = a + b or self = a - b
 
@@ -747,7 +683,66 @@ class Number(Decimal, Signed, Printable, Evaluable):
         two integers ± 0.5 or ±0.25 (randomly). Disabled if self is not
         integer.
         :type int_as_halves_or_quarters: bool
-        :rtype: tuple (of numbers)
+        :param return_all: if True, then all possibilities are returned, as a
+        list.
+        :type return_all: bool
+        :param rng: the random generator to use (default: the random module)
+        :type rng: random.Random
+        :rtype: tuple (of numbers) (or a list of tuples)
+        """
+        if rng is None:
+            rng = random
+        lo, hi, divisor, skip_tens, count = self._split_candidates(
+            operation, dig, return_all, int_as_halves, int_as_quarters,
+            int_as_halves_or_quarters, at_unit)
+        delta = self._split_delta(int_as_halves, int_as_quarters,
+                                  int_as_halves_or_quarters, rng)
+        if return_all:
+            return list(self._splits(operation, lo, hi, divisor, skip_tens,
+                                     delta))
+        n = self
+        # Pick the j-th candidate directly, instead of listing them all
+        k = _split_candidate(lo, rng.randrange(count), skip_tens)
+        if operation in ['sum', '+']:
+            a = Decimal(k) / divisor
+            b = n - a
+            a += delta
+            b -= delta
+        elif operation in ['difference', '-']:
+            b = Decimal(k) / divisor
+            a = n + b
+            a += delta
+            b += delta
+        return (Number(a), Number(b))
+
+    def iter_splits(self, operation='sum', dig=0, int_as_halves=False,
+                    int_as_quarters=False, int_as_halves_or_quarters=False,
+                    at_unit=False, rng=None):
+        """
+        Return an iterator over all the possible splits of self.
+
+        Same as split(return_all=True), but the splits are generated one at
+        a time, instead of being returned all together in a list.
+        """
+        if rng is None:
+            rng = random
+        lo, hi, divisor, skip_tens, _ = self._split_candidates(
+            operation, dig, True, int_as_halves, int_as_quarters,
+            int_as_halves_or_quarters, at_unit)
+        delta = self._split_delta(int_as_halves, int_as_quarters,
+                                  int_as_halves_or_quarters, rng)
+        return self._splits(operation, lo, hi, divisor, skip_tens, delta)
+
+    def _split_candidates(self, operation, dig, return_all, int_as_halves,
+                          int_as_quarters, int_as_halves_or_quarters,
+                          at_unit):
+        """
+        Define the candidates to split self.
+
+        The candidates are the k / divisor, for k ranging from lo to hi, and
+        skipping the multiples of 10 if skip_tens is True.
+
+        :rtype: tuple (lo, hi, divisor, skip_tens, number of candidates)
         """
         if operation not in ['sum', 'difference', '+', '-']:
             raise ValueError('Argument "operation" should be either \'sum\' '
@@ -772,48 +767,48 @@ class Number(Decimal, Signed, Printable, Evaluable):
         if start > end:
             start, end = end + 1, -1
         # default: all numbers, including integers
-        seq = [(Decimal(i) + 1) / Decimal(10) ** Decimal(depth)
-               for i in range(start, end)]
-        # then if decimals are wanted, we remove the results that do not match
-        # the wanted "depth" (if depth == 2, we remove 0.4 for instance)
-        if depth >= 1:
-            seq = [i for i in seq
-                   if not is_integer(i * (10 ** (depth - 1)))]
-        if not seq:
+        lo, hi = start + 1, end
+        # but if decimals are wanted, we skip the numbers that do not match
+        # the wanted "depth" (if depth == 2, we skip 0.4 for instance)
+        skip_tens = depth >= 1
+        if skip_tens:
+            count = _nonmultiples_of_10_rank(hi) \
+                - _nonmultiples_of_10_rank(lo - 1)
+        else:
+            count = hi - lo + 1
+        if count <= 0:
             raise RuntimeError(
                 f'Cannot split {self} (operation=\'{operation}\', dig={dig}, '
                 f'at_unit={at_unit}, int_as_halves={int_as_halves}, '
                 f'int_as_quarters= {int_as_quarters}, int_as_halves_or_quar'
                 f'ters={int_as_halves_or_quarters}, return_all={return_all})')
+        return (lo, hi, Decimal(10) ** Decimal(depth), skip_tens, count)
+
+    def _split_delta(self, int_as_halves, int_as_quarters,
+                     int_as_halves_or_quarters, rng):
         delta = 0
         if is_integer(self):
             if int_as_halves_or_quarters:
-                h, q = (True, False) if random.choice([True, False]) \
+                h, q = (True, False) if rng.choice([True, False]) \
                     else (False, True)
                 int_as_halves, int_as_quarters = h, q
             if int_as_halves:
                 delta = Number('0.5')
             if int_as_quarters:
                 delta = Number('0.25')
-        if return_all:
-            if operation in ['sum', '+']:
-                return [(Number(a) + delta, Number(n - a) - delta)
-                        for a in seq]
-            elif operation in ['difference', '-']:
-                return [(Number(n + b) + delta, Number(b) + delta)
-                        for b in seq]
-        else:
+        return delta
+
+    def _splits(self, operation, lo, hi, divisor, skip_tens, delta):
+        n = self
+        for k in range(lo, hi + 1):
+            if skip_tens and not k % 10:
+                continue
             if operation in ['sum', '+']:
-                a = random.choice(seq)
-                b = n - a
-                a += delta
-                b -= delta
+                a = Decimal(k) / divisor
+                yield (Number(a) + delta, Number(n - a) - delta)
             elif operation in ['difference', '-']:
-                b = random.choice(seq)
-                a = n + b
-                a += delta
-                b += delta
-            return (Number(a), Number(b))
+                b = Decimal(k) / divisor
+                yield (Number(n + b) + delta, Number(b) + delta)
 
     def is_perfect_square(self):
         """
@@ -823,9 +818,111 @@ class Number(Decimal, Signed, Printable, Evaluable):
         if power % 2:
             return False
         N = self * 10 ** power
-        pd = prime_decomposition(N)
         # check all powers are even
-        return all([not (e % 2) for (_, e) in pd])
+        return all(not (e % 2) for (_, e) in factorize(N))
+
+
+# Exact values of trigonometric functions, by angle in degrees (0 to 359).
+# None means the value is not defined.
+EXACT_TRIGONOMETRIC_VALUES = \
+    {'cos': {0: Number(1), 60: Number('0.5'), 90: Number(0),
+             120: Number('-0.5'), 180: Number(-1), 240: Number('-0.5'),
+             270: Number(0), 300: Number('0.5')},
+     'sin': {0: Number(0), 30: Number('0.5'), 90: Number(1),
+             150: Number('0.5'), 180: Number(0), 210: Number('-0.5'),
+             270: Number(-1), 330: Number('-0.5')},
+     'tan': {0: Number(0), 45: Number(1), 90: None, 135: Number(-1),
+             180: Number(0), 225: Number(1), 270: None, 315: Number(-1)}}
+
+# Exact values of inverse trigonometric functions (in degrees), by value.
+EXACT_INVERSE_TRIGONOMETRIC_VALUES = \
+    {'acos': {Decimal(0): Number(90), Decimal('0.5'): Number(60),
+              Decimal(1): Number(0), Decimal('-0.5'): Number(120),
+              Decimal(-1): Number(180)},
+     'asin': {Decimal(0): Number(0), Decimal('0.5'): Number(30),
+              Decimal(1): Number(90), Decimal('-0.5'): Number(-30),
+              Decimal(-1): Number(-90)},
+     'atan': {Decimal(0): Number(0), Decimal(1): Number(45),
+              Decimal(-1): Number(-45)}}
+
+TRIGONOMETRIC_FCTS = ['cos', 'sin', 'tan', 'acos', 'asin', 'atan']
+
+
+def _trigonometric_value(fct, d):
+    """Return fct(d), d being in degrees. Use exact values when possible."""
+    if d == d.to_integral_value():
+        try:
+            result = EXACT_TRIGONOMETRIC_VALUES[fct][int(d) % 360]
+        except KeyError:
+            pass
+        else:
+            if result is None:
+                raise ValueError('Tangent of 90° or -90° is indefinite.')
+            return result
+    return _approximate_trigonometric_value(fct, d)
+
+
+@lru_cache(maxsize=4096)
+def _approximate_trigonometric_value(fct, d):
+    return Number(getattr(math, fct)(math.radians(d)))
+
+
+def _inverse_trigonometric_value(fct, d):
+    """Return fct(d), in degrees. Use exact values when possible."""
+    try:
+        return EXACT_INVERSE_TRIGONOMETRIC_VALUES[fct][d]
+    except KeyError:
+        return _approximate_inverse_trigonometric_value(fct, d)
+
+
+@lru_cache(maxsize=4096)
+def _approximate_inverse_trigonometric_value(fct, d):
+    return Number(math.degrees(getattr(math, fct)(d))).standardized()
+
+
+@lru_cache(maxsize=4096)
+def _rounded_trigonometric_value(fct, n, precision):
+    return getattr(Number(n), fct)().rounded(precision)
+
+
+def trig_table(values, fct, precision=None):
+    """
+    Return fct(v) for all values v.
+
+    Exact values are used for notable angles (or notable values, for inverse
+    functions). Other results are cached, so that computing the same values
+    again is cheap.
+
+    :param values: the angles, in degrees (or values, for inverse functions)
+    :type values: iterable (of anything that can be turned to a Number)
+    :param fct: the function to use
+    :type fct: str (one of TRIGONOMETRIC_FCTS)
+    :param precision: if not None, the results will be rounded to it. Same as
+    Number.rounded()'s precision, e.g. Decimal('0.01').
+    :type precision: None or decimal.Decimal
+    :rtype: list (of Numbers)
+    """
+    if fct not in TRIGONOMETRIC_FCTS:
+        raise ValueError('fct must belong to {}; got {} instead.'
+                         .format(TRIGONOMETRIC_FCTS, repr(fct)))
+    if precision is None:
+        return [getattr(Number(v), fct)() for v in values]
+    precision = Decimal(precision)
+    return [_rounded_trigonometric_value(fct, Decimal(Number(v)), precision)
+            for v in values]
+
+
+def _nonmultiples_of_10_rank(k):
+    """Rank of k among the integers that are not multiples of 10."""
+    return k - k // 10
+
+
+def _split_candidate(lo, j, skip_tens):
+    """Return the j-th integer from lo (skipping multiples of 10 if asked)."""
+    if not skip_tens:
+        return lo + j
+    r = _nonmultiples_of_10_rank(lo - 1) + j + 1
+    return r + (r - 1) // 9
 
 
 def move_fracdigits_to(n, from_nb=None):
@@ -902,3 +999,31 @@ def fix_fracdigits(n1, *n2):
         n2[j] += random.choice([i for i in range(-4, 5) if i != 0])
         n1, *n2 = remove_fracdigits_from(n1, to=n2)
     return (n1, *n2)
+
+
+def convert_many(numbers, unit):
+    """
+    Convert all numbers into the same unit.
+
+    The conversion factor is looked up only once per distinct source unit.
+
+    :param numbers: the Numbers to convert
+    :type numbers: iterable (of Numbers)
+    :param unit: the unit to convert the numbers into
+    :type unit: str or Unit
+    :rtype: list (of Numbers)
+    """
+    if isinstance(unit, str):
+        unit = Unit(unit)
+    factors = {}
+    result = []
+    for n in numbers:
+        if n.unit not in factors:
+            try:
+                factors[n.unit] = difference_of_orders_of_magnitude(n.unit,
+                                                                    unit)
+            except TypeError:
+                raise TypeError('Cannot convert {} into {}.'
+                                .format(n.uiprinted, unit.uiprinted))
+        result.append(Number(Decimal(n) * factors[n.unit], unit=unit))
+    return result
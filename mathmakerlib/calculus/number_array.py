@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import math
+import locale
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+from mathmakerlib import required
+from mathmakerlib.calculus.unit import Unit, physical_quantity
+from mathmakerlib.calculus.number import Number, Sign
+
+OPERATIONS_NAMES = {'+': 'add', '-': 'subtract'}
+
+
+def _standardized(d, unit=None):
+    """
+    Same as Number.standardized(), for a Decimal and the unit it goes with.
+
+    A Number having a unit never equals its integral part (a plain Decimal),
+    so Number.standardized() only normalizes it (10 cm becomes 1E+1 cm and
+    -0 cm is left as is). The same is done here, to get identical results.
+    """
+    if unit is not None:
+        return d.normalize()
+    if d == d.to_integral():
+        d = d.quantize(Decimal(1))
+        if str(d) == '-0':
+            d = Decimal(0)
+        return d
+    else:
+        return d.normalize()
+
+
+def _fracdigits_nb(d, ignore_trailing_zeros=True):
+    """Same as Number.fracdigits_nb(), for a Decimal."""
+    d = abs(d)
+    if ignore_trailing_zeros:
+        d = _standardized(d)
+    temp = len(str(d - d.quantize(Decimal(1), rounding=ROUND_DOWN))) - 2
+    return temp if temp >= 0 else 0
+
+
+class NumberArray(object):
+    """
+    Sequence of values sharing one Unit.
+
+    All elementwise operations are done on the bare Decimal values, the Unit
+    of the result being determined only once for the whole array.
+    """
+
+    def __init__(self, values=None, unit='undefined'):
+        """
+        Initialize NumberArray
+
+        :param values: the values of the array. If they are Numbers and unit
+        is left to 'undefined', they must all share the same unit.
+        :type values: iterable (of anything that can be turned to a Number)
+        :param unit: the unit shared by all values
+        :type unit: None or str or Unit
+        """
+        if values is None:
+            values = []
+        values = list(values)
+        if unit == 'undefined':
+            units = {v.unit for v in values if isinstance(v, Number)}
+            if any(not isinstance(v, Number) for v in values):
+                units.add(None)
+            if len(units) > 1:
+                raise ValueError('All values of a NumberArray must share '
+                                 'the same unit.')
+            unit = units.pop() if units else None
+        self._unit = None if unit is None else Unit(unit)
+        self._values = [Decimal(v) if isinstance(v, Decimal)
+                        else Decimal(Number(v)) for v in values]
+
+    @classmethod
+    def from_numbers(cls, numbers):
+        """Create a NumberArray from a list of Numbers sharing one unit."""
+        return cls(numbers)
+
+    def to_numbers(self):
+        """Return the values as a list of Numbers."""
+        return [Number(v, unit=self._unit) for v in self._values]
+
+    def _new(self, values, unit):
+        result = NumberArray.__new__(NumberArray)
+        result._values = values
+        result._unit = unit
+        return result
+
+    def __repr__(self):
+        return 'NumberArray([{}])'.format(
+            ', '.join(repr(n) for n in self.to_numbers()))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        unit = self._unit
+        return (Number(v, unit=unit) for v in self._values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._new(self._values[i], self._unit)
+        return Number(self._values[i], unit=self._unit)
+
+    def __eq__(self, other):
+        if not isinstance(other, NumberArray):
+            return False
+        return self._unit == other._unit and self._values == other._values
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def values(self):
+        """The bare Decimal values."""
+        return list(self._values)
+
+    def _operand(self, other):
+        """Return the values and unit of other, broadcast to self's length."""
+        if isinstance(other, NumberArray):
+            if len(other) != len(self):
+                raise ValueError('Cannot operate on two NumberArrays of '
+                                 'different lengths ({} and {}).'
+                                 .format(len(self), len(other)))
+            return other._values, other._unit
+        if isinstance(other, Sign):
+            other = other.evaluate()
+        other = Number(other)
+        return [Decimal(other)] * len(self), other.unit
+
+    def _check_same_unit(self, ounit, operation):
+        if self._unit != ounit:
+            raise ValueError('Cannot {} two NumberArrays having different '
+                             'Units ({} and {}).'
+                             .format(OPERATIONS_NAMES[operation],
+                                     str(self._unit), str(ounit)))
+
+    def __add__(self, other):
+        ovalues, ounit = self._operand(other)
+        self._check_same_unit(ounit, '+')
+        return self._new([a + b for a, b in zip(self._values, ovalues)],
+                         self._unit)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        ovalues, ounit = self._operand(other)
+        self._check_same_unit(ounit, '-')
+        return self._new([a - b for a, b in zip(self._values, ovalues)],
+                         self._unit)
+
+    def __rsub__(self, other):
+        return -self.__sub__(other)
+
+    def __mul__(self, other):
+        ovalues, ounit = self._operand(other)
+        unit = (Number(1, unit=self._unit) * Number(1, unit=ounit)).unit
+        return self._new([a * b for a, b in zip(self._values, ovalues)],
+                         unit)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        ovalues, ounit = self._operand(other)
+        unit = (Number(1, unit=self._unit) / Number(1, unit=ounit)).unit
+        return self._new([a / b for a, b in zip(self._values, ovalues)],
+                         unit)
+
+    def __rtruediv__(self, other):
+        ovalues, ounit = self._operand(other)
+        return self._new(ovalues, ounit).__truediv__(self)
+
+    def __neg__(self):
+        return self._new([-v for v in self._values], self._unit)
+
+    def __abs__(self):
+        return self._new([abs(v) for v in self._values], self._unit)
+
+    def standardized(self):
+        """
+        Turn 8.0 to 8 and 1E+1 to 10, for all values.
+
+        Results are the same as each Number's standardized() (values having a
+        unit are only normalized).
+        """
+        return self._new([_standardized(v, self._unit) for v in self._values],
+                         self._unit)
+
+    def rounded(self, precision, rounding=ROUND_HALF_UP):
+        """
+        Round all values. Return standardized results.
+
+        :param precision: a Decimal (same as decimal.Decimal().quantize()).
+                          For instance, Decimal('1'), Decimal('1.0') etc.
+        """
+        if precision >= 10:
+            ndigits = -int(math.log10(precision))
+            values = [round(v, ndigits) for v in self._values]
+        else:
+            values = [v.quantize(precision, rounding=rounding)
+                      for v in self._values]
+        return self._new([_standardized(v, self._unit) for v in values],
+                         self._unit)
+
+    def fracdigits_nb(self, ignore_trailing_zeros=True):
+        """Return the numbers of fractional digits, as a list."""
+        return [_fracdigits_nb(v, ignore_trailing_zeros=ignore_trailing_zeros)
+                for v in self._values]
+
+    def imprint(self, start_expr=True, variant='latex', dot=False):
+        """
+        Return the LaTeX (or user input) strings of all values, as a list.
+
+        Each string is the same as what Number.imprint() would return.
+        """
+        if variant not in ['latex', 'siunitx', 'user_input']:
+            raise ValueError('variant must belong to [\'latex\', \'siunitx\', '
+                             '\'user_input\']; got \'{}\' instead.'
+                             .format(variant))
+        unit = self._unit
+        if unit is None:
+            before, after = '', ''
+            if variant == 'siunitx':
+                required.package['siunitx'] = True
+                before, after = r'\num{', '}'
+        elif variant == 'latex':
+            required.package['siunitx'] = True
+            if unit.content in ['€', r'\officialeuro']:
+                required.package['eurosym'] = True
+            if physical_quantity(unit) == 'angle':
+                before, after = r'\ang{', '}'
+            else:
+                before = r'\SI{'
+                after = '}{' + unit.imprint(standalone=False) + '}'
+        else:
+            before, after = '', ' ' + unit.uiprinted
+        decimal_point = locale.localeconv()['decimal_point']
+        result = []
+        for v in self._values:
+            if variant in ['latex', 'siunitx']:
+                v_str = locale.format_string(
+                    '%.{}f'.format(
+                        _fracdigits_nb(v, ignore_trailing_zeros=False)), v)
+            else:
+                v_str = Decimal.__str__(v)
+            if dot:
+                v_str = v_str.replace(decimal_point, '.')
+            extra_sign = ''
+            if not start_expr and v >= 0:
+                extra_sign = '+'
+            if unit is None or variant != 'latex':
+                result.append(before + extra_sign + v_str + after)
+            else:
+                result.append(extra_sign + before + v_str + after)
+        return result
+
+    @property
+    def printed(self):
+        return self.imprint(start_expr=True, variant='latex')
+
+    @property
+    def uiprinted(self):
+        return self.imprint(start_expr=True, variant='user_input')
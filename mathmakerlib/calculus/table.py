@@ -20,12 +20,13 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import copy
-from pathlib import Path
 
-from mathmakerlib import required
+from mathmakerlib import required, templates
 from mathmakerlib.core.printable import Printable
 from mathmakerlib.LaTeX import AttrList, TikZPicture
 
+TEMPLATES_DIR = 'calculus/templates'
+
 
 class Table(Printable):
 
@@ -66,8 +67,11 @@ class Table(Printable):
     @property
     def template(self):
         """The template matching self's size."""
-        fn = f'templates/table{self.size}{self.compact_suffix}.tikz'
-        return (Path(__file__).parent / fn).read_text()
+        return self._template().text
+
+    def _template(self):
+        fn = f'table{self.size}{self.compact_suffix}.tikz'
+        return templates.get(f'{TEMPLATES_DIR}/{fn}')
 
     @property
     def xoffset(self):
@@ -96,16 +100,21 @@ class Table(Printable):
                 text = r'\textcolor{{{color}}}{{{text}}}'\
                     .format(color=self.bubble_color, text=text)
             fn = f'table_bubble{self.compact_suffix}.tikz'
-            bubble_template = (Path(__file__).parent / f'templates/{fn}')\
-                .read_text()
-            return bubble_template.replace('BUBBLETEXT', text)\
-                .replace('XOFF', self.xoffset)
+            return templates.get(f'{TEMPLATES_DIR}/{fn}')\
+                .substitute({'BUBBLETEXT': text, 'XOFF': self.xoffset})
 
-    def imprint(self, start_expr=True, variant='latex'):
+    def tikzpicture(self):
+        """The TikZPicture environment holding the table."""
         required.package['tikz'] = True
-        content = self.template
-        for i in range(self.size):
-            content = content.replace(f'XVAL{i}', str(self.couples[i][0]))
-            content = content.replace(f'YVAL{i}', str(self.couples[i][1]))
-        content = content.replace('BUBBLE', self.bubble)
-        return str(TikZPicture(content, *self.options_list))
+        values = {'BUBBLE': self.bubble}
+        for i, (x, y) in enumerate(self.couples):
+            values[f'XVAL{i}'] = str(x)
+            values[f'YVAL{i}'] = str(y)
+        content = self._template().substitute(values)
+        return TikZPicture(content, *self.options_list)
+
+    def imprint(self, start_expr=True, variant='latex'):
+        return str(self.tikzpicture())
+
+    def imprint_to(self, fp, start_expr=True, variant='latex'):
+        self.tikzpicture().imprint_to(fp)
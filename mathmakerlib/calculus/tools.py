@@ -19,9 +19,16 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+from math import isqrt
 from decimal import Decimal
+from functools import lru_cache
 
-from sympy.ntheory import primefactors
+from sympy.ntheory import factorint
+
+# Integers up to SIEVE_LIMIT are factorized using a sieve
+SIEVE_LIMIT = 10 ** 6
+# Smallest prime factor of each integer, filled when needed
+_SPF = [0, 1]
 
 
 def is_number(n):
@@ -47,44 +54,74 @@ def is_natural(n):
     return is_integer(n) and n >= 0
 
 
-def prime_factors(n):
+def _grow_sieve(n):
+    """Extend the smallest prime factors' sieve up to n at least."""
+    size = min(max(n + 1, 2 * len(_SPF)), SIEVE_LIMIT + 1)
+    spf = list(range(size))
+    for i in range(2, isqrt(size - 1) + 1):
+        if spf[i] == i:
+            for j in range(i * i, size, i):
+                if spf[j] == j:
+                    spf[j] = i
+    _SPF[:] = spf
+
+
+@lru_cache(maxsize=4096)
+def _factorize(n):
+    if n > SIEVE_LIMIT:
+        return tuple(sorted(factorint(n).items()))
+    if n >= len(_SPF):
+        _grow_sieve(n)
+    decomposition = []
+    while n > 1:
+        p = _SPF[n]
+        e = 0
+        while n % p == 0:
+            n //= p
+            e += 1
+        decomposition.append((p, e))
+    return tuple(decomposition)
+
+
+def factorize(n):
     """
-    Return all the prime factors of a positive integer
+    Return the prime decomposition of abs(n), as a tuple of (prime, exponent).
 
-    Taken from https://stackoverflow.com/a/412942/3926735.
+    Integers up to SIEVE_LIMIT are factorized using a sieve of their smallest
+    prime factors, that grows as needed. The results are cached.
+
+    :param n: the integer to factorize
+    :type n: int (or anything that can be turned into an int)
+    :rtype: tuple
     """
     try:
         n = int(n)
     except ValueError:
         raise TypeError('The argument must be an integer.')
-    factors = []
-    d = 2
-    while n > 1:
-        while n % d == 0:
-            factors.append(d)
-            n //= d
-        d = d + 1
-        if d * d > n:
-            if n > 1:
-                factors.append(n)
-            break
-    return factors
-
-
-# TODO: this is a bit redundant with the previous method
+    return _factorize(abs(n))
+
+
+def factorize_many(numbers):
+    """Return the prime decompositions of all numbers, as a list."""
+    return [factorize(n) for n in numbers]
+
+
+def prime_factors(n):
+    """Return all the prime factors of a positive integer"""
+    try:
+        n = int(n)
+    except ValueError:
+        raise TypeError('The argument must be an integer.')
+    if n < 1:
+        return []
+    return [p for p, e in factorize(n) for _ in range(e)]
+
+
 def prime_decomposition(nn):
     """
     Return the prime decomposition of self (natural numbers only).
     """
-    primes_list = primefactors(nn)
-    decomposition = list()
-    for p in primes_list:
-        i = 0
-        while not (nn % p):
-            i += 1
-            nn = nn / p
-        decomposition.append((p, i))
-    return decomposition
+    return list(factorize(nn))
 
 
 def weighted_average(value1, value2, mass1, mass2, rounding_rank=3):
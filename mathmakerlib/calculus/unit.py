@@ -19,7 +19,6 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
-from copy import deepcopy
 from decimal import Decimal
 
 from mathmakerlib import required
@@ -53,100 +52,173 @@ PHYSICAL_QUANTITIES = {'length': LENGTH_UNITS,
                        'mass': MASS_UNITS,
                        'currency': CURRENCY_UNITS,
                        'angle': ANGLE_UNITS}
+# Filled at first call to difference_of_orders_of_magnitude()
+CONVERSION_FACTORS = {}
 
 
-def physical_quantity(u):
-    """
-    Return the physical quantity matching the given unit.
-
-    :param u: the unit
-    :type u: str or Unit
-    """
-    e = 1
-    if isinstance(u, Unit):
-        e = u.exponent
-        u = str(u.content)
+def _physical_quantity(content, exponent):
+    """Return the physical quantity matching given content and exponent."""
     for pq in PHYSICAL_QUANTITIES:
-        if u in PHYSICAL_QUANTITIES[pq]:
+        if content in PHYSICAL_QUANTITIES[pq]:
             if pq == 'length':
-                if e == 2:
+                if exponent == 2:
                     return 'area'
-                elif e == 3:
+                elif exponent == 3:
                     return 'volume'
             return pq
     return None
 
 
-def difference_of_orders_of_magnitude(unit1, unit2):
+def physical_quantity(u):
     """
-    Return the required power of 10 to multiply unit1 by, to get unit2.
+    Return the physical quantity matching the given unit.
 
-    :param unit1: the first unit
-    :type unit1: str or Unit
-    :param unit2: the second unit (to get from unit1)
-    :type unit2: str or Unit
-    :rtype: decimal.Decimal
+    :param u: the unit
+    :type u: str or Unit
     """
-    if isinstance(unit1, str):
-        unit1 = Unit(unit1)
-    if isinstance(unit2, str):
-        unit2 = Unit(unit2)
+    if isinstance(u, Unit):
+        return u.physical_quantity
+    return _physical_quantity(u, 1)
+
+
+def _orders_of_magnitude(unit1, unit2):
+    """Return the difference of orders of magnitude between two Units."""
     phq1 = physical_quantity(unit1)
     phq2 = physical_quantity(unit2)
     if phq1 == phq2:
         dimension = unit1.exponent
         if dimension is None:
             dimension = 1
-        magnitude_diff = (PHYSICAL_QUANTITIES[phq2].index(unit2.content)
-                          - PHYSICAL_QUANTITIES[phq1].index(unit1.content))\
-            * dimension
+        return (unit2.magnitude_index - unit1.magnitude_index) * dimension
     elif phq1 == 'volume' and phq2 == 'capacity':
-        magnitude_diff = PHYSICAL_QUANTITIES[phq2].index(unit2.content)\
+        return unit2.magnitude_index \
             - VOLUME_CAPACITY_MATCH.index(unit1.content)
     elif phq1 == 'capacity' and phq2 == 'volume':
-        magnitude_diff = VOLUME_CAPACITY_MATCH.index(unit2.content)\
-            - PHYSICAL_QUANTITIES[phq1].index(unit1.content)
+        return VOLUME_CAPACITY_MATCH.index(unit2.content) \
+            - unit1.magnitude_index
     else:
         raise TypeError('Cannot give the difference of orders of magnitude '
                         'between two units that do not belong to the same '
                         'physical quantity ({} and {}).'
                         .format(unit1, unit2))
-    return 10 ** (Decimal(str(magnitude_diff)))
+
+
+def difference_of_orders_of_magnitude(unit1, unit2):
+    """
+    Return the required power of 10 to multiply unit1 by, to get unit2.
+
+    Conversion factors between all known units are computed once (see
+    CONVERSION_FACTORS), so this is a mere lookup most of the time.
+
+    :param unit1: the first unit
+    :type unit1: str or Unit
+    :param unit2: the second unit (to get from unit1)
+    :type unit2: str or Unit
+    :rtype: decimal.Decimal
+    """
+    if isinstance(unit1, str):
+        unit1 = Unit(unit1)
+    if isinstance(unit2, str):
+        unit2 = Unit(unit2)
+    try:
+        return CONVERSION_FACTORS[(unit1, unit2)]
+    except KeyError:
+        if not CONVERSION_FACTORS:
+            CONVERSION_FACTORS.update(_conversion_factors())
+            return difference_of_orders_of_magnitude(unit1, unit2)
+        return 10 ** Decimal(_orders_of_magnitude(unit1, unit2))
 
 
 class Unit(Exponented):
+    """
+    Immutable unit, like cm or cm².
 
-    def __init__(self, content, exponent=None):
-        if isinstance(content, str):
-            Exponented.__init__(self, Word(content),
-                                exponent=deepcopy(exponent))
-        elif isinstance(content, Unit):
+    Units are interned: creating a Unit with the same content and exponent
+    (or an equal one, like 2.0 instead of 2) as an existing one returns the
+    very same instance. Hence Numbers share
+    their Units by reference, copying a Unit returns itself and equality is
+    an identity check.
+    """
+    registry = {}
+
+    def __new__(cls, content, exponent=None):
+        if isinstance(content, Unit):
             if exponent is None:
-                Exponented.__init__(self, deepcopy(content.content),
-                                    exponent=deepcopy(content.exponent))
-            else:
-                Exponented.__init__(self, deepcopy(content.content),
-                                    exponent=deepcopy(exponent))
-        else:
+                return content
+            content = content.content
+        elif not isinstance(content, str):
             raise TypeError('content must be a str or a Unit. Got {} instead.'
                             .format(str(type(content))))
+        from mathmakerlib.calculus import Number
+        if isinstance(exponent, int):
+            exponent = Number(exponent)
+        if exponent is None:
+            key = (str(content), None)
+        elif isinstance(exponent, Number):
+            # Equal exponents, like 2 and 2.0, must give the same Unit
+            key = (str(content), Number, exponent.standardized())
+        else:
+            key = (str(content), type(exponent), str(exponent))
+        try:
+            return cls.registry[key]
+        except KeyError:
+            pass
+        self = super().__new__(cls)
+        Exponented.__init__(self, Word(content), exponent=exponent)
+        self._physical_quantity = _physical_quantity(self._content,
+                                                     self._exponent)
+        self._magnitude_index = None
+        if self._physical_quantity is not None:
+            self._magnitude_index = PHYSICAL_QUANTITIES[
+                self._physical_quantity].index(self._content)
+        self._frozen = True
+        cls.registry[key] = self
+        return self
+
+    def __init__(self, content, exponent=None):
+        # Everything is done in __new__, that may return an already
+        # existing instance
+        pass
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError('Unit objects are immutable.')
+        super().__setattr__(name, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Unit, (str(self._content), self._exponent))
 
     def __repr__(self):
         return super().__repr__().replace('Exponented', 'Unit')
 
     def __eq__(self, other):
-        if not isinstance(other, Unit):
-            return False
-        else:
-            return (self.content == other.content
-                    and self.exponent == other.exponent)
+        return self is other
 
     def __ne__(self, other):
-        if not isinstance(other, Unit):
-            return True
-        else:
-            return not (self.content == other.content
-                        and self.exponent == other.exponent)
+        return self is not other
+
+    __hash__ = object.__hash__
+
+    @property
+    def physical_quantity(self):
+        """The physical quantity matching this Unit (or None)."""
+        return self._physical_quantity
+
+    @property
+    def magnitude_index(self):
+        """
+        Index of this Unit among the units of its physical quantity.
+
+        For instance, 'km' is 0, 'hm' is 1 etc. None if the Unit does not
+        belong to any known physical quantity.
+        """
+        return self._magnitude_index
 
     def imprint(self, start_expr=True, variant='latex', standalone=True):
         if standalone and variant == 'latex':
@@ -156,3 +228,19 @@ class Unit(Exponented):
             return r'\si{' + super().imprint(start_expr=start_expr) + '}'
         else:
             return super().imprint(start_expr=start_expr, variant=variant)
+
+
+def _conversion_factors():
+    """Build the conversion factors between all pairs of known units."""
+    units = [Unit(u) for u in LENGTH_UNITS + CAPACITY_UNITS + MASS_UNITS
+             + ANGLE_UNITS]
+    units += [Unit(u, exponent=e) for e in [2, 3] for u in LENGTH_UNITS]
+    factors = {}
+    for u1 in units:
+        for u2 in units:
+            try:
+                n = _orders_of_magnitude(u1, u2)
+            except (TypeError, ValueError):
+                continue
+            factors[(u1, u2)] = 10 ** Decimal(n)
+    return factors
@@ -24,6 +24,7 @@
 # import mathmakerlib.config
 # mathmakerlib.config.polygons.DEFAULT_WINDING = 'clockwise'
 
+from contextlib import contextmanager
 from decimal import Decimal
 
 from mathmakerlib.LaTeX import DASHPATTERN_VALUES
@@ -92,6 +93,41 @@ class PointsSetup(object):
         self._DEFAULT_POSITION_PRECISION = value
 
 
+GEOMETRY_BACKENDS = ['decimal', 'float']
+
+
+class GeometrySetup(object):
+
+    def __init__(self):
+        # BACKEND tells how the new coordinates are computed when rotating or
+        # projecting Points. 'decimal' computes them with Numbers; 'float'
+        # computes them with floats, only turned to Numbers at the end. Both
+        # produce the same TikZ pictures (coordinates are rounded anyway).
+        self.BACKEND = 'decimal'
+
+    @property
+    def BACKEND(self):
+        return self._BACKEND
+
+    @BACKEND.setter
+    def BACKEND(self, value):
+        if value not in GEOMETRY_BACKENDS:
+            raise ValueError('Incorrect geometry backend: \'{}\'. '
+                             'Available values belong to: {}.'
+                             .format(str(value), str(GEOMETRY_BACKENDS)))
+        self._BACKEND = value
+
+    @contextmanager
+    def use_backend(self, value):
+        """Use another BACKEND inside a with statement."""
+        previous = self.BACKEND
+        self.BACKEND = value
+        try:
+            yield
+        finally:
+            self.BACKEND = previous
+
+
 class AnglesSetup(object):
 
     def __init__(self):
@@ -186,6 +222,7 @@ SUPPORTED_LANGUAGES = ['en', 'en_US', 'en_GB', 'fr', 'fr_FR']
 
 def init():
     global polygons, angles, oblique_projection, language, points, clocktime
+    global geometry
     global callout_styles
     global initialized
 
@@ -198,6 +235,7 @@ def init():
         initialized = True
         polygons = PolygonsSetup()
         points = PointsSetup()
+        geometry = GeometrySetup()
         angles = AnglesSetup()
         oblique_projection = ObliqueProjectionSetup()
         clocktime = ClockTimeSetup()
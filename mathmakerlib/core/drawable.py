@@ -20,6 +20,8 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 from itertools import zip_longest
+from functools import wraps
+from contextvars import ContextVar
 from decimal import Decimal, InvalidOperation
 from abc import ABCMeta, abstractmethod
 
@@ -32,6 +34,12 @@ from mathmakerlib.calculus.tools import is_number
 from mathmakerlib.calculus.number import Number
 
 
+# Versioning is suspended while drawing, as drawing may set attributes that
+# only store intermediate results. This is set per thread (or asyncio task),
+# so that a modification made elsewhere during a drawing is not missed.
+_versioning_suspended = ContextVar('versioning_suspended', default=False)
+
+
 def check_color(value):
     if value is None:
         color_name = None
@@ -59,7 +67,7 @@ def check_scale(value, source_name):
 
 
 def tikz_approx_position(slope):
-    slope %= Number(360)
+    slope %= 360
     # Caution: modulo on negative Decimals does not behave as on ints.
     # So, it's necessary to add 360 in case of a negative result.
     if slope < 0:
@@ -109,7 +117,87 @@ def tikz_options_list(options_list, source=None):
         return ''
 
 
-class Labeled(object, metaclass=ABCMeta):
+def versions(obj):
+    """
+    Return the versions of obj and of all Versioned objects it holds.
+
+    The Versioned objects held directly, or in lists or tuples, are searched
+    recursively.
+
+    :rtype: list (of (object, version) tuples)
+    """
+    result = []
+    seen = set()
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, Versioned):
+            if id(o) not in seen:
+                seen.add(id(o))
+                result.append((o, o._version))
+                stack.extend(o.__dict__.values())
+        elif isinstance(o, (list, tuple)):
+            stack.extend(o)
+    return result
+
+
+def same_versions(v1, v2):
+    """
+    Tell whether two results of versions() match.
+
+    They match if they list the same objects, in the same order, at the
+    same versions.
+
+    :rtype: bool
+    """
+    return (len(v1) == len(v2)
+            and all(o1 is o2 and n1 == n2
+                    for (o1, n1), (o2, n2) in zip(v1, v2)))
+
+
+def _versioned_setter(fset):
+    """Wrap the setter fset so that it bumps the instance's version."""
+    suspended = _versioning_suspended.get
+
+    @wraps(fset)
+    def setter(self, value):
+        fset(self, value)
+        if not suspended():
+            self._version += 1
+    setter.bumps_version = True
+    return setter
+
+
+class Versioned(object):
+    """
+    Objects having a version counter, bumped by each of their setters.
+
+    Each property's setter of a Versioned class (including the ones it
+    inherits from other classes) is wrapped, at the class creation, to bump
+    the version of the instance it sets.
+    """
+    _version = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            attr = None
+            for klass in cls.__mro__:
+                if name in vars(klass):
+                    attr = vars(klass)[name]
+                    break
+            if (isinstance(attr, property) and attr.fset is not None
+                and not getattr(attr.fset, 'bumps_version', False)):
+                setattr(cls, name,
+                        attr.setter(_versioned_setter(attr.fset)))
+
+    @property
+    def version(self):
+        """The number of times self's setters have been called."""
+        return self._version
+
+
+class Labeled(Versioned, metaclass=ABCMeta):
 
     @property
     def label_value(self):
@@ -130,7 +218,7 @@ class Labeled(object, metaclass=ABCMeta):
             self._label = self._label_value = str(value)
 
 
-class Colored(object, metaclass=ABCMeta):
+class Colored(Versioned, metaclass=ABCMeta):
     @property
     def color(self):
         if not hasattr(self, '_color'):
@@ -144,7 +232,7 @@ class Colored(object, metaclass=ABCMeta):
         setattr(self, '_color', value)
 
 
-class Fillable(object, metaclass=ABCMeta):
+class Fillable(Versioned, metaclass=ABCMeta):
     @property
     def fillcolor(self):
         if not hasattr(self, '_fillcolor'):
@@ -158,7 +246,7 @@ class Fillable(object, metaclass=ABCMeta):
         setattr(self, '_fillcolor', value)
 
 
-class HasRadius(object, metaclass=ABCMeta):
+class HasRadius(Versioned, metaclass=ABCMeta):
     @property
     def radius(self):
         if not hasattr(self, '_radius'):
@@ -175,7 +263,7 @@ class HasRadius(object, metaclass=ABCMeta):
                             .format(str(type(value))))
 
 
-class HasThickness(object, metaclass=ABCMeta):
+class HasThickness(Versioned, metaclass=ABCMeta):
     @property
     def thickness(self):
         if not hasattr(self, '_thickness'):
@@ -192,7 +280,7 @@ class HasThickness(object, metaclass=ABCMeta):
                              .format(str(value), str(THICKNESS_VALUES)))
 
 
-class HasArrowTips(object, metaclass=ABCMeta):
+class HasArrowTips(Versioned, metaclass=ABCMeta):
     @property
     def arrow_tips(self):
         if not hasattr(self, '_arrow_tips'):
@@ -214,6 +302,24 @@ class HasArrowTips(object, metaclass=ABCMeta):
 
 
 class Drawable(Colored, Labeled, metaclass=ABCMeta):
+    # Sections of the tikzpicture, in order. Each name must match a
+    # tikzsection_<name>() method.
+    tikz_sections = ('declarations', 'drawing', 'labeling', 'boundingbox')
+    # Opt-in debugging: if set to a callable, it will be called for each
+    # drawn section, as debug_hook(drawable, section_name, output)
+    debug_hook = None
+    # Opt-in memoization of the tikzpicture sections (set it to True on a
+    # Drawable subclass, or on an instance). A section is drawn again only if
+    # the object, or any Versioned object it holds, has been modified (through
+    # a setter) since, or if the Versioned objects it holds have changed.
+    # Attributes assigned directly (not through a setter) are not detected.
+    render_cache = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._tikz_sections_methods = tuple(
+            (name, getattr(cls, 'tikzsection_' + name))
+            for name in cls.tikz_sections)
 
     def draw(self):
         """
@@ -223,23 +329,59 @@ class Drawable(Colored, Labeled, metaclass=ABCMeta):
         argument is required. First, setup the object (at initialization, or
         modify it later), once it's ready, draw it.
         """
+        return ''.join(self._draw_chunks())
+
+    def draw_to(self, fp):
+        """
+        Write the LaTeX (tikz) drawing of the object to the text stream fp.
+
+        Same output as self.draw(), written section by section, without
+        building the whole string first.
+        """
+        for chunk in self._draw_chunks():
+            fp.write(chunk)
+
+    def _draw_chunks(self):
+        """Yield the successive parts of the tikzpicture, in order."""
         required.package['tikz'] = True
-        body_format = {}
-        section_attr_prefix = 'tikzsection_'
-        sections = [attr for attr in dir(self)
-                    if attr.startswith(section_attr_prefix)]
-        for s in sections:
-            body_format.update({s[len(section_attr_prefix):] + '_section':
-                                getattr(self, s)()})
-        fontsizecomment = 'Text font size'
-        body_format.update({'fontsize': '\n% {}\n{}\n'.format(fontsizecomment,
-                                                              self.fontsize)
-                                        if self.fontsize
-                                        else ''})
-        return r"""\begin{{tikzpicture}}{pic_options}"""\
-            r"""{body}\end{{tikzpicture}}"""\
-            .format(pic_options=self.tikz_picture_options(),
-                    body=self.tikz_picture_body().format(**body_format))
+        yield r'\begin{tikzpicture}'
+        yield self.tikz_picture_options()
+        if self.fontsize:
+            yield f'\n% Text font size\n{self.fontsize}\n'
+        debug_hook = Drawable.debug_hook
+        if self.render_cache:
+            cache = self.__dict__.setdefault('_rendered_sections', {})
+            current_versions = versions(self)
+        for name, section in self._tikz_sections_methods:
+            if self.render_cache:
+                s = self._cached_section(cache, current_versions, name,
+                                         section)
+            else:
+                s = section(self)
+            if debug_hook is not None:
+                debug_hook(self, name, s)
+            yield s
+        yield r'\end{tikzpicture}'
+
+    def _cached_section(self, cache, current_versions, name, section):
+        """
+        Return the cached output of section, if self has not changed since.
+
+        Otherwise, draw the section and cache it, along with the requirements
+        it sets. These requirements are set again when the cache is used.
+        """
+        cached = cache.get(name)
+        if cached is not None and same_versions(cached[0], current_versions):
+            output, requirements = cached[1:]
+            required.replay(requirements)
+        else:
+            token = _versioning_suspended.set(True)
+            try:
+                output, requirements = required.record(section, self)
+            finally:
+                _versioning_suspended.reset(token)
+            cache[name] = (current_versions, output, requirements)
+        return output
 
     def tikz_picture_options(self):
         # Prepare possible picture's options
@@ -257,10 +399,6 @@ class Drawable(Colored, Labeled, metaclass=ABCMeta):
             pic_options = '[{}]'.format(pic_options)
         return pic_options
 
-    def tikz_picture_body(self):
-        return r"""{fontsize}{declarations_section}{drawing_section}"""\
-            r"""{labeling_section}{boundingbox_section}"""
-
     def tikzsection_declarations(self):
         output = ''
         declaring_comment = self.tikz_declaring_comment()
@@ -272,25 +410,14 @@ class Drawable(Colored, Labeled, metaclass=ABCMeta):
         return output
 
     def tikzsection_drawing(self):
-        drawing_section = []
         comments = [f'{cmt}' for cmt in self.tikz_drawing_comment()]
         if comments:
             comments[0] = '\n' + comments[0]
-        for (i, (c, d)) in enumerate(zip_longest(comments,
-                                                 self.tikz_draw(),
-                                                 fillvalue='')):
-            comment_string = ''
-            if c:
-                comment_string = '{{drawing_comment{}}}\n'.format(i)
-                comment_string = comment_string.format(
-                    **{'drawing_comment{}'.format(i): c})
-            drawing_section.append('{}{{drawing{}}}'
-                                   .format(comment_string, i)
-                                   .format(**{'drawing{}'.format(i): d}))
+        drawing_section = [f'{c}\n{d}' if c else d
+                           for c, d in zip_longest(comments, self.tikz_draw(),
+                                                   fillvalue='')]
         if drawing_section:
             drawing_section.append('')
-        import sys
-        sys.stderr.write(f'{drawing_section = }')
         return '\n'.join(drawing_section)
 
     def tikzsection_labeling(self):
@@ -23,6 +23,7 @@ from abc import ABCMeta, abstractmethod
 
 
 class Evaluable(object, metaclass=ABCMeta):
+    __slots__ = ()
 
     @abstractmethod
     def evaluate(self, **kwargs):
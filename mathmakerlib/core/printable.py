@@ -23,6 +23,7 @@ from abc import ABCMeta, abstractmethod
 
 
 class Printable(object, metaclass=ABCMeta):
+    __slots__ = ()
 
     @abstractmethod
     def imprint(self, start_expr=True, variant='latex'):
@@ -30,6 +31,12 @@ class Printable(object, metaclass=ABCMeta):
         Return the LaTeX (or user input version) string of the object.
         """
 
+    def imprint_to(self, fp, *args, **kwargs):
+        """
+        Write self.imprint(*args, **kwargs) to the text stream fp.
+        """
+        fp.write(self.imprint(*args, **kwargs))
+
     @property
     def printed(self):
         """
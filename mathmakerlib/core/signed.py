@@ -23,6 +23,7 @@ from abc import ABCMeta, abstractmethod
 
 
 class Signed(object, metaclass=ABCMeta):
+    __slots__ = ()
 
     @property
     @abstractmethod
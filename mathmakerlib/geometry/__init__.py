@@ -31,10 +31,11 @@ from .polygons import Triangle, RightTriangle, EquilateralTriangle
 from .polygons import IsoscelesTriangle
 from .polygons import Quadrilateral, Rectangle, Rhombus, Square
 from .angle import AngleDecoration, Angle, AnglesSet
-from .polyhedra import Polyhedron, RightCuboid
+from .polyhedra import Mesh, Polyhedron, RightCuboid
 from .projections import ObliqueProjection
 from .callout import Callout, callout_positioning
 from .rectangle_grid import RectangleGrid
+from .transforms import rotation_matrix, transform_points
 
 __all__ = ['convex_hull',
            'Point', 'Bipoint', 'Vector', 'LineSegment', 'DividedLineSegment',
@@ -44,5 +45,6 @@ __all__ = ['convex_hull',
            'IsoscelesTriangle',
            'Quadrilateral', 'Rectangle', 'Rhombus', 'Square',
            'AngleDecoration', 'Angle', 'AnglesSet',
-           'Polyhedron', 'RightCuboid',
-           'ObliqueProjection', 'Callout', 'callout_positioning']
+           'Mesh', 'Polyhedron', 'RightCuboid',
+           'ObliqueProjection', 'Callout', 'callout_positioning',
+           'rotation_matrix', 'transform_points']
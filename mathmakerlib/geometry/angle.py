@@ -19,12 +19,9 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
-from math import atan2, degrees
-
 from .callout import Callout, callout_positioning
 from mathmakerlib import required, config
 from mathmakerlib.LaTeX import MATHEMATICAL_NOTATIONS
-from mathmakerlib.exceptions import ZeroVector
 from mathmakerlib.core.oriented import Oriented
 from mathmakerlib.core.oriented import check_winding, shoelace_formula
 from mathmakerlib.core.drawable import Colored, HasThickness, HasRadius
@@ -33,8 +30,10 @@ from mathmakerlib.core.drawable import tikz_options_list, Drawable
 from mathmakerlib.core.drawable import tikz_approx_position
 from mathmakerlib.core.dimensional import Dimensional
 from mathmakerlib.geometry.point import Point
-from mathmakerlib.geometry.vector import Vector
 from mathmakerlib.geometry.bipoint import Bipoint
+from mathmakerlib.geometry.tools import delta, slope360, bisector_slope360
+from mathmakerlib.geometry.tools import angle_measure
+from mathmakerlib.geometry.transforms import rotation_matrix, transform_points
 from mathmakerlib.calculus import Number, is_number, weighted_average
 from mathmakerlib.core import surrounding_keys
 
@@ -308,7 +307,7 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
         self.thickness = thickness
         self.arrow_tips = arrow_tips
         self.naming_mode = naming_mode
-        self.midslope = 0
+        self._midslope = 0
         self.callout_text = callout_text  # auto setup for callout is made
         self.callout_fmt = callout_fmt  # somewhat below, for 2D angles only
         self.callout = None
@@ -364,26 +363,11 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
                 self.winding = 'anticlockwise'
 
         # Measure of the angle:
-        if self._three_dimensional:
-            u = Vector(self.points[1], self.points[0])
-            v = Vector(self.points[1], self.points[2])
-            self._measure = Number(str(degrees(atan2(u.cross(v).length,
-                                                     u.dot(v)))))
-        else:  # 2D angles measure
-            p0 = Point(self._points[0].x - self._points[1].x,
-                       self._points[0].y - self._points[1].y,
-                       None)
-            p2 = Point(self._points[2].x - self._points[1].x,
-                       self._points[2].y - self._points[1].y,
-                       None)
-            if self.winding == 'clockwise':
-                p0, p2 = p2, p0
-            α0 = Number(str(degrees(atan2(p0.y, p0.x))))
-            α2 = Number(str(degrees(atan2(p2.y, p2.x))))
-            self._measure = α2 - α0
-
-        if self._measure < 0:
-            self._measure += 360
+        u, v = self._arms_coordinates()
+        if self.winding == 'clockwise':
+            u, v = v, u
+        self._measure = Number(angle_measure(
+            u, v, three_dimensional=self._three_dimensional))
 
         # only to remember the positions that have been set, in case they're
         # needed when transforming the angle (rotating)
@@ -393,18 +377,25 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
 
         self.setup_labels_and_callout()
 
+    def _arms_coordinates(self):
+        """Coordinates of the arms' vectors, as tuples of Decimals."""
+        return (delta(self._points[1], self._points[0]),
+                delta(self._points[1], self._points[2]))
+
     def calculate_midslope(self):
-        p0, p2 = self._points[0], self._points[2]
+        u, v = self._arms_coordinates()
         if self.winding == 'clockwise':
-            p0, p2 = p2, p0
-        bisector = Vector(self.vertex, p0).bisector(Vector(self.vertex, p2),
-                                                    new_endpoint_name=None)
-        try:
-            midslope = bisector.slope360
-        except ZeroVector:
-            midslope = Bipoint(p0.rotate(self.vertex, -90, rename=None),
-                               self.vertex).slope360
-        self.midslope = midslope
+            u, v = v, u
+        self._midslope = bisector_slope360(u, v)
+
+    @property
+    def midslope(self):
+        """Slope of the Angle's bisector, from 0° to 360°."""
+        return Number(str(self._midslope)).standardized()
+
+    @midslope.setter
+    def midslope(self, value):
+        self._midslope = value
 
     def setup_callout(self):
         # (polar angle correction, radial distance,
@@ -412,7 +403,7 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
         pac, rd, s = callout_positioning(self._measure)
         # callout's polar angle
         f = 1
-        if 90 < self.midslope < 180 or 270 < self.midslope < 360:
+        if 90 < self._midslope < 180 or 270 < self._midslope < 360:
             f = -1
         pa = Number(round(self.midslope - f * pac, 0)).standardized()
         # dec radius
@@ -429,14 +420,15 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
         # Vertex' label positioning
         offset = 180 if self.winding == 'anticlockwise' else 0
         self._points[1].label_position = \
-            tikz_approx_position(self.midslope + offset)
+            tikz_approx_position(self._midslope + offset)
 
         # Endpoints labels positioning
         direction = 1 if self.winding == 'anticlockwise' else -1
+        u, v = self._arms_coordinates()
         self.endpoints[0].label_position = \
-            tikz_approx_position(self.arms[0].slope360 - direction * 55)
+            tikz_approx_position(slope360(u) - direction * 55)
         self.endpoints[1].label_position = \
-            tikz_approx_position(self.arms[1].slope360 + direction * 55)
+            tikz_approx_position(slope360(v) + direction * 55)
 
         # Armspoints labels positioning happens when setting armpoints only
 
@@ -504,10 +496,11 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
 
         # Armspoints labels positioning
         direction = 1 if self.winding == 'anticlockwise' else -1
+        arms = self._arms_coordinates()
         for i, ap in enumerate(self.armspoints):
             xdir = -1 if i == 0 else 1
             self.armspoints[i].label_position = \
-                tikz_approx_position(self.arms[i].slope360
+                tikz_approx_position(slope360(arms[i])
                                      + xdir * direction * 60)
 
     @property
@@ -699,10 +692,10 @@ class Angle(Drawable, Oriented, HasThickness, Dimensional, HasArrowTips):
 
     def rotate(self, measure):
         """Rotate angle around its own vertex."""
-        self._points[0] = self._points[0].rotate(self.vertex, measure,
-                                                 rename='keep_name')
-        self._points[2] = self._points[2].rotate(self.vertex, measure,
-                                                 rename='keep_name')
+        self._points[0], self._points[2] = transform_points(
+            [self._points[0], self._points[2]],
+            rotation_matrix(self.vertex, measure),
+            precision=Number('1.000'))
         self.setup_labels_and_callout()
         # reset armspoints too, if any
         if self.armspoints:
@@ -19,9 +19,13 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import heapq
 import string
-from decimal import InvalidOperation
-from math import cos, sin, radians
+import weakref
+from contextlib import contextmanager
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, ROUND_HALF_EVEN
+from functools import lru_cache
+from math import log10
 
 from mathmakerlib import config
 from mathmakerlib.core.drawable import Drawable, check_scale, tikz_options_list
@@ -39,28 +43,240 @@ OPPOSITE_LABEL_POSITIONS = {'right': 'left',
                             'below right': 'above left'}
 
 
+_UNIT = Decimal(1)
+
+
+def _quantum(precision):
+    """
+    Return the exponent and rounding matching Number.rounded(precision).
+
+    Rounding a Number at precision is then the same as rounding it, once
+    multiplied by 10 ** -exponent, to an integer.
+    """
+    if precision >= 10:
+        return (int(log10(precision)), ROUND_HALF_EVEN)
+    return (Decimal(precision).as_tuple().exponent, ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=4096)
+def _automatic_name(rank):
+    """
+    Return the automatic name of given rank.
+
+    The 26 first ranks are 'A', 'B'... 'Z', the 26 next ones are 'A$_1$',
+    'B$_1$'... 'Z$_1$' etc.
+    """
+    layer, index = divmod(rank, 26)
+    letter = string.ascii_uppercase[index]
+    if not layer:
+        return letter
+    return '{}$_{}$'.format(letter, layer)
+
+
+def _automatic_name_rank(name):
+    """
+    Return the rank of an automatic name, or None if it's not one.
+
+    For instance, 'B' is 1 and 'C$_2$' is 54.
+    """
+    index = string.ascii_uppercase.find(name[:1])
+    if index == -1:
+        return None
+    if len(name) == 1:
+        return index
+    layer = name[3:-1]
+    if (name[1:3] == '$_' and name[-1] == '$' and layer.isdigit()
+        and layer[0] != '0'):
+        return int(layer) * 26 + index
+    return None
+
+
+class NamesAllocator(object):
+    """
+    The names in use by living Points.
+
+    A name is released as soon as no Point uses it anymore: either the Points
+    have been renamed, or they have been garbage-collected.
+
+    The next automatic name is the free one of lowest rank (see
+    _automatic_name()). All ranks below the cursor have been used; the ones
+    that have been released since are kept in a heap. Hence getting the next
+    automatic name takes constant (amortized) time.
+
+    Like the set it replaces, it supports in, len(), iteration, add(),
+    discard() and clear().
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Release all names."""
+        self._counts = {}
+        # weak references to the named Points, and their names
+        self._refs = {}
+        self._cursor = 0
+        self._released = []
+        # names reserved for Points yet to be created
+        self._reserved = set()
+
+    def add(self, name):
+        """Mark name as in use, if it is not already."""
+        if name not in self._counts:
+            self.acquire(name)
+
+    def discard(self, name):
+        """Release name, whatever the number of Points using it."""
+        self._reserved.discard(name)
+        if name in self._counts:
+            self._counts[name] = 1
+            self.release(name)
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def next_name(self):
+        """Return the next automatic name (without using it)."""
+        released = self._released
+        while released:
+            name = _automatic_name(released[0])
+            if name not in self._counts:
+                return name
+            heapq.heappop(released)
+        name = _automatic_name(self._cursor)
+        while name in self._counts:
+            self._cursor += 1
+            name = _automatic_name(self._cursor)
+        return name
+
+    def reserve(self, n):
+        """
+        Reserve the n next automatic names.
+
+        They are in use until the first Point named after each of them gets
+        garbage-collected (or renamed).
+        """
+        names = []
+        for _ in range(n):
+            name = self.next_name()
+            self.acquire(name)
+            self._reserved.add(name)
+            names.append(name)
+        return names
+
+    def release_reserved(self, names):
+        """
+        Release the reservations of names no Point has taken over yet.
+
+        The names already used by a Point are left unchanged.
+        """
+        for name in names:
+            if name in self._reserved:
+                self._reserved.remove(name)
+                self.release(name)
+
+    def acquire(self, name):
+        """Register one more Point using name."""
+        if name in self._reserved:
+            # the Point takes the reservation over
+            self._reserved.remove(name)
+        else:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def register(self, point):
+        """Use point's name until it's changed or point garbage-collected."""
+        self.acquire(point.name)
+        ref = weakref.ref(point, self._release_ref)
+        self._refs[id(ref)] = (ref, point.name)
+        return ref
+
+    def unregister(self, ref):
+        """Stop using the name registered along with the weak reference."""
+        entry = self._refs.pop(id(ref), None)
+        if entry is not None:
+            self.release(entry[1])
+
+    def _release_ref(self, ref):
+        self.unregister(ref)
+
+    def release(self, name):
+        """Register one Point less using name."""
+        count = self._counts.get(name, 0) - 1
+        if count > 0:
+            self._counts[name] = count
+            return
+        self._counts.pop(name, None)
+        rank = _automatic_name_rank(name)
+        if rank is not None and rank < self._cursor:
+            heapq.heappush(self._released, rank)
+
+
 class Point(Drawable, Dimensional):
-    names_in_use = set()
+    names_in_use = NamesAllocator()
 
     @classmethod
     def automatic_names(cls):
+        """Return the free names of the lowest layer, the first one last."""
         use = Point.names_in_use
-        names = [letter
-                 for letter in string.ascii_uppercase
-                 if letter not in use][::-1]
-        if not names:
-            layer = 1
-            while not names:
-                names = ['{}$_{}$'.format(letter, layer)
-                         for letter in string.ascii_uppercase
-                         if '{}$_{}$'.format(letter, layer)
-                         not in use][::-1]
-                layer += 1
-        return names
+        first = _automatic_name_rank(use.next_name()) // 26 * 26
+        return [_automatic_name(rank)
+                for rank in range(first + 25, first - 1, -1)
+                if _automatic_name(rank) not in use]
+
+    @classmethod
+    def reserve_names(cls, n):
+        """
+        Reserve the n next automatic names, for Points yet to be created.
+
+        Each name remains in use until the first Point named after it is
+        garbage-collected (or renamed). The n names are found at once, so the
+        n Points will be named consecutively even if other Points get named
+        before they're all created.
+
+        :param n: the number of names to reserve
+        :type n: int
+        :rtype: list
+        """
+        return Point.names_in_use.reserve(n)
+
+    @classmethod
+    def release_names(cls, names):
+        """
+        Release names reserved by reserve_names() but not used by any Point.
+
+        For instance, if the creation of the Points has failed.
+
+        :param names: the reserved names
+        :type names: list
+        """
+        Point.names_in_use.release_reserved(names)
 
     @classmethod
     def reset_names(cls):
-        cls.names_in_use = set()
+        Point.names_in_use = NamesAllocator()
+
+    @classmethod
+    @contextmanager
+    def naming_scope(cls):
+        """
+        Name the Points created in the with block apart from any other.
+
+        The names used outside the block do not prevent Points created inside
+        the block to be named the same way (the first automatic name is 'A'
+        again), and vice versa.
+        """
+        previous = Point.names_in_use
+        Point.names_in_use = NamesAllocator()
+        try:
+            yield
+        finally:
+            Point.names_in_use = previous
 
     def __init__(self, x=None, y=None, z='undefined', name='automatic',
                  color=None, shape=r'$\times$', shape_scale=Number('0.67'),
@@ -96,9 +312,13 @@ class Point(Drawable, Dimensional):
         """
         self._three_dimensional = False
         self._name = None
+        self._names = None
+        self._name_ref = None
         self._x = None
         self._y = None
         self._z = None
+        self._position_key = None
+        self._float_coordinates = None
         self._shape = None
         self._label = None
         self._label_position = None
@@ -141,38 +361,69 @@ class Point(Drawable, Dimensional):
         return s
 
     def __hash__(self):
-        if not self.three_dimensional:
-            s = 'Point ({}, {})'.format(self.x, self.y)
-        else:
-            s = 'Point ({}, {}, {})'.format(self.x, self.y, self.z)
-        return hash(s)
+        return hash(self.position_key)
 
     def __eq__(self, other):
         if isinstance(other, Point):
-            p = config.points.DEFAULT_POSITION_PRECISION
-            return all([self.x.rounded(p) == other.x.rounded(p),
-                        self.y.rounded(p) == other.y.rounded(p),
-                        self.z.rounded(p) == other.z.rounded(p)])
+            return self.position_key == other.position_key
         else:
             return False
 
+    @property
+    def position_key(self):
+        """
+        The coordinates, rounded at config.points.DEFAULT_POSITION_PRECISION.
+
+        They're given as integers, counted in units of this precision. For
+        instance, if precision is Decimal('1.000'), the position_key of
+        Point(1, '0.5') is (1000, 500, 0). Two Points are equal if they have
+        the same position_key.
+
+        :rtype: tuple
+        """
+        precision = config.points.DEFAULT_POSITION_PRECISION
+        key = self._position_key
+        if key is None or key[0] is not precision:
+            exponent, rounding = _quantum(precision)
+            key = (precision,
+                   tuple(int(c.scaleb(-exponent).quantize(_UNIT,
+                                                          rounding=rounding))
+                         for c in (self._x, self._y, self._z)))
+            self._position_key = key
+        return key[1]
+
     @property
     def name(self):
         return self._name
 
     @name.setter
     def name(self, value):
-        if self._name is not None:
-            Point.names_in_use.discard(self._name)
+        if self._name_ref is not None:
+            self._names.unregister(self._name_ref)
+            self._name_ref = None
         if value is None:
             self._name = None
         else:
             value = str(value)
             if value == 'automatic':
-                self._name = Point.automatic_names().pop()
+                self._name = Point.names_in_use.next_name()
             else:
                 self._name = value
-            Point.names_in_use.add(self._name)
+            self._register_name()
+
+    def _register_name(self):
+        self._names = Point.names_in_use
+        self._name_ref = self._names.register(self)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_names'] = state['_name_ref'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._name is not None:
+            self._register_name()
 
     @property
     def x(self):
@@ -185,6 +436,8 @@ class Point(Drawable, Dimensional):
         except (TypeError, InvalidOperation):
             raise TypeError('Expected a number as abscissa, found {} '
                             'instead.'.format(repr(value)))
+        self._position_key = None
+        self._float_coordinates = None
 
     @property
     def y(self):
@@ -197,6 +450,8 @@ class Point(Drawable, Dimensional):
         except (TypeError, InvalidOperation):
             raise TypeError('Expected a number as ordinate, found {} '
                             'instead.'.format(repr(value)))
+        self._position_key = None
+        self._float_coordinates = None
 
     @property
     def z(self):
@@ -214,11 +469,21 @@ class Point(Drawable, Dimensional):
             raise TypeError('Expected a number as applicate, found {} '
                             'instead.'.format(repr(value)))
         self._three_dimensional = three_dimensional
+        self._position_key = None
+        self._float_coordinates = None
 
     @property
     def coordinates(self):
         return (self._x, self._y, self._z)
 
+    @property
+    def float_coordinates(self):
+        """The coordinates, as floats (calculated once)."""
+        if self._float_coordinates is None:
+            self._float_coordinates = (float(self._x), float(self._y),
+                                       float(self._z))
+        return self._float_coordinates
+
     @property
     def shape(self):
         return self._shape
@@ -266,6 +531,8 @@ class Point(Drawable, Dimensional):
         :rtype: Point
         """
         from mathmakerlib.geometry.vector import Vector
+        from mathmakerlib.geometry.transforms import rotation_matrix
+        from mathmakerlib.geometry.transforms import transform_points
         if not isinstance(center, Point):
             raise TypeError('Expected a Point as rotation center, got {} '
                             'instead.'.format(type(center)))
@@ -275,46 +542,11 @@ class Point(Drawable, Dimensional):
         if not (axis is None or isinstance(axis, Vector)):
             raise TypeError('Expected either None or a Vector as axis, '
                             'found {} instead.'.format(repr(axis)))
-        Δx = self.x - center.x
-        Δy = self.y - center.y
-        Δz = self.z - center.z
-        cosθ = Number(str(cos(radians(angle))))
-        sinθ = Number(str(sin(radians(angle))))
-        if axis is None:
-            rx = (Δx * cosθ - Δy * sinθ + center.x).rounded(Number('1.000'))
-            ry = (Δx * sinθ + Δy * cosθ + center.y).rounded(Number('1.000'))
-            rz = 'undefined'
-        else:
-            ux, uy, uz = axis.normalized().coordinates
-            rotation_matrix = [[cosθ + (1 - cosθ) * ux ** 2,
-                                ux * uy * (1 - cosθ) - uz * sinθ,
-                                ux * uz * (1 - cosθ) + uy * sinθ],
-                               [uy * ux * (1 - cosθ) + uz * sinθ,
-                                cosθ + (1 - cosθ) * uy ** 2,
-                                uy * uz * (1 - cosθ) - ux * sinθ],
-                               [uz * ux * (1 - cosθ) - uy * sinθ,
-                                uz * uy * (1 - cosθ) + ux * sinθ,
-                                cosθ + (1 - cosθ) * uz ** 2]]
-            rx = sum([rc * coord
-                      for rc, coord in zip(rotation_matrix[0], [Δx, Δy, Δz])])
-            ry = sum([rc * coord
-                      for rc, coord in zip(rotation_matrix[1], [Δx, Δy, Δz])])
-            rz = sum([rc * coord
-                      for rc, coord in zip(rotation_matrix[2], [Δx, Δy, Δz])])
-            rx += center.x
-            ry += center.y
-            rz += center.z
-            rx = rx.rounded(Number('1.000'))
-            ry = ry.rounded(Number('1.000'))
-            rz = rz.rounded(Number('1.000'))
-
-        if rename == 'keep_name':
-            rname = self.name
-        elif rename == 'auto':
-            rname = self.name + "'"
-        else:
-            rname = rename
-        return Point(rx, ry, rz, rname)
+        if rename not in ['keep_name', 'auto']:
+            rename = [rename]
+        return transform_points([self],
+                                rotation_matrix(center, angle, axis=axis),
+                                rename=rename, precision=Number('1.000'))[0]
 
     def belongs_to(self, other):
         """Check if the Point belongs to a LineSegment."""
@@ -29,8 +29,11 @@ class Equilateral(Drawable, metaclass=ABCMeta):
 
     def __init__(self, mark_equal_sides=True, use_mark='||'):
         if mark_equal_sides:
-            for s in self.sides:
-                s.mark = use_mark
+            self._setup_sides(Equilateral._mark_sides, use_mark)
+
+    def _mark_sides(self, use_mark):
+        for s in self.sides:
+            s.mark = use_mark
 
     @property
     @abstractmethod
@@ -89,7 +89,10 @@ class IsoscelesTriangle(Triangle):
                           sloped_sides_labels=sloped_sides_labels)
         self._type = 'IsoscelesTriangle'
         if mark_equal_sides:
-            self.sides[1].mark = self.sides[2].mark = use_mark
+            self._setup_sides(IsoscelesTriangle._mark_equal_sides, use_mark)
+
+    def _mark_equal_sides(self, use_mark):
+        self.sides[1].mark = self.sides[2].mark = use_mark
 
     @property
     def base_length(self):
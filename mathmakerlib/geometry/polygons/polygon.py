@@ -20,7 +20,7 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import warnings
-from copy import deepcopy
+from copy import copy
 from statistics import mean
 
 from mathmakerlib import config
@@ -35,6 +35,7 @@ from mathmakerlib.geometry.point import Point
 from mathmakerlib.geometry.linesegment import LineSegment
 from mathmakerlib.geometry.vector import Vector
 from mathmakerlib.geometry.angle import Angle
+from mathmakerlib.geometry.transforms import rotation_matrix, transform_points
 
 POLYGONS_TYPES = {3: 'Triangle', 4: 'Quadrilateral', 5: 'Pentagon',
                   6: 'Hexagon', 7: 'Heptagon', 8: 'Octogon',
@@ -148,40 +149,25 @@ class Polygon(Drawable, Colored, HasThickness, Oriented, Dimensional):
                                         label=lbl, color=v.color,
                                         shape_scale=v.shape_scale))
         if rotation_angle:
-            center = self.isobarycenter()
-            for i in range(len(self._vertices)):
-                self._vertices[i] = self._vertices[i].rotate(
-                    center=center,
-                    angle=rotation_angle,
-                    rename='keep_name')
-
-        self._sides = []
-        shifted_vertices = deepcopy(self._vertices)
-        shifted_vertices += [shifted_vertices.pop(0)]
-        for (v0, v1) in zip(self._vertices, shifted_vertices):
-            self._sides += [LineSegment(v0, v1, label_winding=self.winding,
-                                        locked_label=True)]
-        self._angles = []
-        left_shifted_vertices = deepcopy(self._vertices)
-        left_shifted_vertices = \
-            [left_shifted_vertices.pop(-1)] + left_shifted_vertices
-        for (v0, v1, v2) in zip(left_shifted_vertices,
-                                self._vertices,
-                                shifted_vertices):
-            self._angles += [Angle(v2, v1, v0)]
-        for i in range(len(self._vertices)):
-            u = Vector(self._vertices[i], left_shifted_vertices[i])
-            v = Vector(self._vertices[i], shifted_vertices[i])
-            if self.winding == 'clockwise':
-                u, v = v, u
-            self._vertices[i].label_position = \
-                tikz_approx_position(u.bisector(v).slope360)
-
-        if len(self._sides) in POLYGONS_TYPES:
-            self._type = POLYGONS_TYPES[len(self._sides)]
+            self._vertices = transform_points(
+                self._vertices,
+                rotation_matrix(self.isobarycenter(), rotation_angle),
+                precision=Number('1.000'))
+
+        # The sides, the angles and the vertices' labels positions are only
+        # calculated when they're needed.
+        self._sides = None
+        self._angles = None
+        self._label_positions_ready = False
+        # What to setup on the sides and angles, once they'll be built
+        self._sides_setups = []
+        self._angles_setups = []
+
+        if len(self._vertices) in POLYGONS_TYPES:
+            self._type = POLYGONS_TYPES[len(self._vertices)]
         else:
             self._type = \
-                '{n}-sided Polygon'.format(n=str(len(self._sides)))
+                '{n}-sided Polygon'.format(n=str(len(self._vertices)))
 
         self.sloped_sides_labels = sloped_sides_labels
 
@@ -194,33 +180,98 @@ class Polygon(Drawable, Colored, HasThickness, Oriented, Dimensional):
         return '{} {}'.format(self.type, self.name)
 
     def __eq__(self, other):
-        if isinstance(other, Polygon) and len(self.sides) == len(other.sides):
-            L = len(self.vertices)
+        if (isinstance(other, Polygon)
+            and len(self._vertices) == len(other._vertices)):
+            L = len(self._vertices)
             for offset in range(L):
-                if all([self.vertices[(i + offset) % L] == other.vertices[i]
+                if all([self._vertices[(i + offset) % L] == other._vertices[i]
                         for i in range(L)]):
                     return True
             for offset in range(L):
-                if all([self.vertices[(i + offset) % L] == other.vertices[-i]
+                if all([self._vertices[(i + offset) % L] == other._vertices[-i]
                         for i in range(L)]):
                     return True
         return False
 
     @property
     def vertices(self):
+        if not self._label_positions_ready:
+            self._setup_label_positions()
         return self._vertices
 
     @property
     def sides(self):
+        if self._sides is None:
+            self._build_sides_and_angles()
         return self._sides
 
     @property
     def angles(self):
+        if self._angles is None:
+            self._build_sides_and_angles()
         return self._angles
 
+    def _setup_label_positions(self):
+        """Set the vertices' labels positions, along the bisectors."""
+        self._label_positions_ready = True
+        vertices = self._vertices
+        L = len(vertices)
+        for i in range(L):
+            u = Vector(vertices[i], vertices[i - 1])
+            v = Vector(vertices[i], vertices[(i + 1) % L])
+            if self.winding == 'clockwise':
+                u, v = v, u
+            vertices[i].label_position = \
+                tikz_approx_position(u.bisector(v).slope360)
+
+    def _build_sides_and_angles(self):
+        """Build the sides and angles and apply the pending setups."""
+        vertices = self.vertices
+        # Building LineSegments and Angles modifies their Points' labels
+        # positions; the vertices' ones must be kept.
+        label_positions = [v.label_position for v in vertices]
+        shifted_vertices = [copy(v) for v in vertices[1:] + vertices[:1]]
+        left_shifted_vertices = [copy(v)
+                                 for v in vertices[-1:] + vertices[:-1]]
+        if self._sides is None:
+            self._sides = [LineSegment(v0, v1, label_winding=self.winding,
+                                       locked_label=True)
+                           for (v0, v1) in zip(vertices, shifted_vertices)]
+        if self._angles is None:
+            self._angles = [Angle(v2, v1, v0)
+                            for (v0, v1, v2) in zip(left_shifted_vertices,
+                                                    vertices,
+                                                    shifted_vertices)]
+        for v, position in zip(vertices, label_positions):
+            v.label_position = position
+        for setup, args in self._sides_setups:
+            setup(self, *args)
+        for setup, args in self._angles_setups:
+            setup(self, *args)
+        self._sides_setups = []
+        self._angles_setups = []
+
+    def _setup_sides(self, setup, *args):
+        """
+        Call setup(self, *args) once the sides are built (or now if they are).
+        """
+        if self._sides is None:
+            self._sides_setups.append((setup, args))
+        else:
+            setup(self, *args)
+
+    def _setup_angles(self, setup, *args):
+        """
+        Call setup(self, *args) once the angles are built (or now if they are).
+        """
+        if self._angles is None:
+            self._angles_setups.append((setup, args))
+        else:
+            setup(self, *args)
+
     @property
     def name(self):
-        return ''.join([v.name for v in self.vertices])
+        return ''.join([v.name for v in self._vertices])
 
     @property
     def type(self):
@@ -228,11 +279,11 @@ class Polygon(Drawable, Colored, HasThickness, Oriented, Dimensional):
 
     def isobarycenter(self, name='automatic'):
         if self.three_dimensional:
-            zval = mean([v.z for v in self.vertices])
+            zval = mean([v.z for v in self._vertices])
         else:
             zval = 'undefined'
-        return Point(mean([v.x for v in self.vertices]),
-                     mean([v.y for v in self.vertices]),
+        return Point(mean([v.x for v in self._vertices]),
+                     mean([v.y for v in self._vertices]),
                      z=zval,
                      name=name)
 
@@ -334,13 +385,16 @@ class Polygon(Drawable, Colored, HasThickness, Oriented, Dimensional):
     def sloped_sides_labels(self, value):
         if isinstance(value, bool):
             self._sloped_sides_labels = value
-            for s in self.sides:
-                s.sloped_label = value
-                s.label_position = 'automatic'
+            self._setup_sides(Polygon._slope_sides_labels, value)
         else:
             raise TypeError('sloped_sides_labels must be a boolean; '
                             'got {} instead.'.format(type(value)))
 
+    def _slope_sides_labels(self, value):
+        for s in self.sides:
+            s.sloped_label = value
+            s.label_position = 'automatic'
+
     @property
     def do_cycle(self):
         return self._do_cycle
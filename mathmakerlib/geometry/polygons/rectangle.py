@@ -97,9 +97,12 @@ class Rectangle(Quadrilateral):
                                sloped_sides_labels=sloped_sides_labels)
         self._type = 'Rectangle'
         if mark_right_angles:
-            for a in self.angles:
-                a.decoration = AngleDecoration(thickness=thickness)
-                a.mark_right = True
+            self._setup_angles(Rectangle._mark_right_angles, thickness)
+
+    def _mark_right_angles(self, thickness):
+        for a in self.angles:
+            a.decoration = AngleDecoration(thickness=thickness)
+            a.mark_right = True
 
     @property
     def width(self):
@@ -92,26 +92,29 @@ class RightTriangle(Triangle):
                           sloped_sides_labels=sloped_sides_labels)
         self._type = 'RightTriangle'
         if mark_right_angle:
-            self.right_angle.decoration = AngleDecoration(thickness=thickness)
-            self.right_angle.mark_right = True
+            self._setup_angles(RightTriangle._mark_right_angle, thickness)
         self._trigo_setup = ''
         self.length_unit = ''
 
+    def _mark_right_angle(self, thickness):
+        self.right_angle.decoration = AngleDecoration(thickness=thickness)
+        self.right_angle.mark_right = True
+
     @property
     def hypotenuse(self):
-        return self._sides[2]
+        return self.sides[2]
 
     @property
     def hyp(self):
-        return self._sides[2]
+        return self.sides[2]
 
     @property
     def leg0(self):
-        return self._sides[0]
+        return self.sides[0]
 
     @property
     def leg1(self):
-        return self._sides[1]
+        return self.sides[1]
 
     @property
     def right_angle(self):
@@ -19,7 +19,8 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+from .mesh import Mesh
 from .polyhedron import Polyhedron
 from .right_cuboid import RightCuboid
 
-__all__ = ['Polyhedron', 'RightCuboid']
+__all__ = ['Mesh', 'Polyhedron', 'RightCuboid']
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+class Mesh(object):
+    """
+    Vertices' coordinates and faces' vertices' indices of a Polyhedron.
+
+    The edges are deduced from the faces and indexed by the (unordered) pair
+    of their vertices' indices.
+    """
+
+    def __init__(self, coordinates, faces):
+        """
+        Initialize Mesh.
+
+        :param coordinates: the coordinates of the vertices
+        :type coordinates: iterable (of (x, y, z) tuples)
+        :param faces: the indices of the vertices of each face, in the order
+        they're joined
+        :type faces: iterable (of tuples of int)
+        """
+        self._coordinates = [tuple(c) for c in coordinates]
+        self._faces = [tuple(f) for f in faces]
+        n = len(self._coordinates)
+        for f, face in enumerate(self._faces):
+            if len(face) < 3:
+                raise ValueError('A face must have at least three vertices. '
+                                 'Found {} as face #{}.'.format(face, f))
+            if any(not (isinstance(i, int) and 0 <= i < n) for i in face):
+                raise ValueError('The vertices of face #{} must be '
+                                 'identified by their indices, between 0 and '
+                                 '{}. Found {} instead.'
+                                 .format(f, n - 1, face))
+        self._edges_keys = []
+        self._edges_index = {}
+        self._edges_faces = []
+        self._vertices_edges = [[] for _ in self._coordinates]
+        for f, face in enumerate(self._faces):
+            for i, j in zip(face, face[1:] + face[:1]):
+                key = frozenset((i, j))
+                e = self._edges_index.get(key)
+                if e is None:
+                    e = len(self._edges_keys)
+                    self._edges_index[key] = e
+                    self._edges_keys.append((i, j))
+                    self._edges_faces.append([])
+                    self._vertices_edges[i].append(e)
+                    self._vertices_edges[j].append(e)
+                self._edges_faces[e].append(f)
+
+    @property
+    def coordinates(self):
+        return self._coordinates
+
+    @property
+    def faces(self):
+        return self._faces
+
+    @property
+    def edges_keys(self):
+        """
+        The pairs of vertices' indices of the edges.
+
+        The edges are listed in the order they're met in the faces.
+
+        :rtype: list (of tuples)
+        """
+        return self._edges_keys
+
+    def edge_number(self, i, j):
+        """
+        Return the number of the edge joining vertices #i and #j.
+
+        :param i: the index of one vertex
+        :type i: int
+        :param j: the index of the other vertex
+        :type j: int
+        :rtype: int
+        """
+        try:
+            return self._edges_index[frozenset((i, j))]
+        except KeyError:
+            raise ValueError('Vertices #{} and #{} are not joined by an '
+                             'edge.'.format(i, j))
+
+    def adjacent_faces(self, i, j):
+        """
+        Return the indices of the faces sharing the edge joining #i and #j.
+
+        :rtype: list (of int)
+        """
+        return list(self._edges_faces[self.edge_number(i, j)])
+
+    def neighbours(self, i):
+        """
+        Return the indices of the vertices joined to vertex #i by an edge.
+
+        :rtype: list (of int)
+        """
+        return [j for e in self._vertices_edges[i]
+                for j in self._edges_keys[e] if j != i]
@@ -20,8 +20,12 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 from abc import ABCMeta, abstractmethod
+from copy import copy
 
 from mathmakerlib.geometry.point import Point
+from mathmakerlib.geometry.linesegment import LineSegment
+from mathmakerlib.geometry.polygons.polygon import Polygon
+from mathmakerlib.geometry.polyhedra.mesh import Mesh
 from mathmakerlib.core.drawable import HasThickness, Colored
 
 
@@ -97,28 +101,133 @@ class Polyhedron(Colored, HasThickness, metaclass=ABCMeta):
                                         shape=v.shape,
                                         label=lbl, color=v.color,
                                         shape_scale=v.shape_scale))
+        self._faces = None
+        self._faces_indices = None
+        self._edges = None
         self._init_faces()
-        self._edges = []
-        for F in self.faces:
-            for s in F.sides:
-                if s not in self._edges:
-                    self._edges.append(s)
+        if self._faces_indices is None:
+            # The faces have been defined as Polygons
+            index = {v: i for i, v in enumerate(self._vertices)}
+            self._faces_indices = [tuple(index[v] for v in F.vertices)
+                                   for F in self._faces]
+        self._mesh = Mesh([v.coordinates for v in self._vertices],
+                          self._faces_indices)
 
     @property
     def vertices(self):
         return self._vertices
 
+    @property
+    def mesh(self):
+        """The vertices' coordinates and the faces' vertices' indices."""
+        return self._mesh
+
     @property
     def edges(self):
+        """
+        The edges of the Polyhedron, built only when first needed.
+
+        :rtype: list (of LineSegments)
+        """
+        if self._edges is None:
+            self._edges = [LineSegment(copy(self._vertices[i]),
+                                       copy(self._vertices[j]),
+                                       locked_label=True)
+                           for i, j in self._mesh.edges_keys]
         return self._edges
 
     @property
     def faces(self):
+        """
+        The faces of the Polyhedron, built only when first needed.
+
+        :rtype: list (of Polygons)
+        """
+        if self._faces is None:
+            self._faces = [self._face_polygon(*[self._vertices[i]
+                                                for i in face])
+                           for face in self._mesh.faces]
         return self._faces
 
+    @property
+    def faces_indices(self):
+        """
+        The indices of the vertices of each face.
+
+        :rtype: list (of tuples)
+        """
+        return self._mesh.faces
+
+    @property
+    def edges_keys(self):
+        """
+        The pairs of vertices' indices of the edges, in the edges' order.
+
+        :rtype: list (of tuples)
+        """
+        return self._mesh.edges_keys
+
+    def edge(self, i, j):
+        """
+        Return the edge joining vertices #i and #j.
+
+        :param i: the index of one vertex (in self.vertices)
+        :type i: int
+        :param j: the index of the other vertex
+        :type j: int
+        :rtype: LineSegment
+        """
+        return self.edges[self._mesh.edge_number(i, j)]
+
+    def face_edge(self, f, s):
+        """
+        Return the edge joining vertices #s and #s + 1 of face #f.
+
+        :param f: the index of the face (in self.faces_indices)
+        :type f: int
+        :param s: the index of the vertex of the face, where the edge starts
+        :type s: int
+        :rtype: LineSegment
+        """
+        face = self._mesh.faces[f]
+        return self.edge(face[s], face[(s + 1) % len(face)])
+
+    def adjacent_faces(self, i, j):
+        """
+        Return the indices of the faces sharing the edge joining #i and #j.
+
+        :param i: the index of one vertex (in self.vertices)
+        :type i: int
+        :param j: the index of the other vertex
+        :type j: int
+        :rtype: list (of int)
+        """
+        return self._mesh.adjacent_faces(i, j)
+
+    def neighbours(self, i):
+        """
+        Return the indices of the vertices joined to vertex #i by an edge.
+
+        :param i: the index of the vertex (in self.vertices)
+        :type i: int
+        :rtype: list (of int)
+        """
+        return self._mesh.neighbours(i)
+
+    def _face_polygon(self, *vertices):
+        """Build the Polygon of one face."""
+        return Polygon(*vertices)
+
     @abstractmethod
     def _init_faces(self):
-        """Each new Polyhedron must define its faces."""
+        """
+        Each new Polyhedron must define its faces.
+
+        Either set self._faces_indices, the list of the indices of the
+        vertices of each face (the faces' Polygons will then be built by
+        _face_polygon(), only when needed); or set self._faces, the list of
+        the faces' Polygons.
+        """
 
     @property
     def name(self):
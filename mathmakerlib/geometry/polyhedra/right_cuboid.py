@@ -70,14 +70,21 @@ class RightCuboid(Polyhedron):
                             'instead.'.format(dimensions))
         x, y, z = start_vertex.coordinates
         width, depth, height = dimensions
-        vertices = [start_vertex,
-                    Point(x + width, y, z),
-                    Point(x + width, y + depth, z),
-                    Point(x, y + depth, z),
-                    Point(x, y, z + height),
-                    Point(x + width, y, z + height),
-                    Point(x + width, y + depth, z + height),
-                    Point(x, y + depth, z + height)]
+        coordinates = [(x + width, y, z),
+                       (x + width, y + depth, z),
+                       (x, y + depth, z),
+                       (x, y, z + height),
+                       (x + width, y, z + height),
+                       (x + width, y + depth, z + height),
+                       (x, y + depth, z + height)]
+        names = Point.reserve_names(7)
+        try:
+            vertices = [start_vertex] + [Point(*c, name)
+                                         for c, name in zip(coordinates,
+                                                            names)]
+        finally:
+            # Only releases the names no Point has taken over
+            Point.release_names(names)
         Polyhedron.__init__(self, *vertices, name=name,
                             draw_vertices=draw_vertices,
                             label_vertices=label_vertices,
@@ -88,19 +95,12 @@ class RightCuboid(Polyhedron):
 
     def _init_faces(self):
         """Faces of the RightCuboid."""
-        self._faces = [Rectangle(self.vertices[0], self.vertices[1],
-                                 self.vertices[2], self.vertices[3]),
-                       Rectangle(self.vertices[0], self.vertices[1],
-                                 self.vertices[5], self.vertices[4]),
-                       Rectangle(self.vertices[1], self.vertices[2],
-                                 self.vertices[6], self.vertices[5]),
-                       Rectangle(self.vertices[2], self.vertices[3],
-                                 self.vertices[7], self.vertices[6]),
-                       Rectangle(self.vertices[3], self.vertices[0],
-                                 self.vertices[4], self.vertices[7]),
-                       Rectangle(self.vertices[4], self.vertices[5],
-                                 self.vertices[6], self.vertices[7]),
-                       ]
+        self._faces_indices = [(0, 1, 2, 3), (0, 1, 5, 4), (1, 2, 6, 5),
+                               (2, 3, 7, 6), (3, 0, 4, 7), (4, 5, 6, 7)]
+
+    def _face_polygon(self, *vertices):
+        """Faces of the RightCuboid are Rectangles."""
+        return Rectangle(*vertices)
 
     def setup_labels(self, labels=None):
         """
@@ -24,12 +24,12 @@ from math import radians, sin, cos
 from mathmakerlib import config
 from mathmakerlib.core.drawable import Drawable, tikz_approx_position
 from mathmakerlib.core.drawable import HasThickness
-from mathmakerlib.geometry.tools import convex_hull
+from mathmakerlib.geometry.tools import convex_hull, point_in_hull
 from mathmakerlib.calculus.tools import is_number
-from mathmakerlib.geometry.point import Point
 from mathmakerlib.geometry.linesegment import LineSegment
 from mathmakerlib.geometry.vector import Vector
 from mathmakerlib.geometry.polyhedra import Polyhedron
+from mathmakerlib.geometry.transforms import transform_points
 
 DIRECTION_VALUES = ['top-left', 'top-right', 'bottom-left', 'bottom-right']
 
@@ -91,60 +91,40 @@ class ObliqueProjection(Drawable, HasThickness):
         if object3D.labels is not None:
             edges_to_label = object3D.edges_to_label['oblique_projection:{}'
                                                      .format(direction)]
-            w_coord, d_coord, h_coord = edges_to_label
-            object3D.faces[w_coord[0]].sides[w_coord[1]].unlock_label()
-            object3D.faces[w_coord[0]].sides[w_coord[1]].label_winding = \
-                w_coord[2]
-            object3D.faces[w_coord[0]].sides[w_coord[1]].label = \
-                object3D.labels[0]
-            object3D.faces[w_coord[0]].sides[w_coord[1]].lock_label()
-            object3D.faces[d_coord[0]].sides[d_coord[1]].unlock_label()
-            object3D.faces[d_coord[0]].sides[d_coord[1]].label_winding = \
-                d_coord[2]
-            object3D.faces[d_coord[0]].sides[d_coord[1]].label = \
-                object3D.labels[1]
-            object3D.faces[d_coord[0]].sides[d_coord[1]].lock_label()
-            object3D.faces[h_coord[0]].sides[h_coord[1]].unlock_label()
-            object3D.faces[h_coord[0]].sides[h_coord[1]].label_winding = \
-                h_coord[2]
-            object3D.faces[h_coord[0]].sides[h_coord[1]].label = \
-                object3D.labels[2]
-            object3D.faces[h_coord[0]].sides[h_coord[1]].lock_label()
-
-        matrix = {'top-right': [[1, 0, k * sin(radians(α))],
-                                [0, 1, k * cos(radians(α))]],
-                  'bottom-right': [[1, 0, k * sin(radians(α))],
-                                   [0, 1, -k * cos(radians(α))]],
-                  'bottom-left': [[1, 0, -k * sin(radians(α))],
-                                  [0, 1, -k * cos(radians(α))]],
-                  'top-left': [[1, 0, -k * sin(radians(α))],
-                               [0, 1, k * cos(radians(α))]]}[direction]
+            for (f, n, winding), label in zip(edges_to_label,
+                                              object3D.labels):
+                edge = object3D.face_edge(f, n)
+                edge.unlock_label()
+                edge.label_winding = winding
+                edge.label = label
+                edge.lock_label()
+
+        matrix = {'top-right': [[1, 0, k * sin(radians(α)), 0],
+                                [0, 1, k * cos(radians(α)), 0]],
+                  'bottom-right': [[1, 0, k * sin(radians(α)), 0],
+                                   [0, 1, -k * cos(radians(α)), 0]],
+                  'bottom-left': [[1, 0, -k * sin(radians(α)), 0],
+                                  [0, 1, -k * cos(radians(α)), 0]],
+                  'top-left': [[1, 0, -k * sin(radians(α)), 0],
+                               [0, 1, k * cos(radians(α)), 0]]}[direction]
         self._edges = []
-        self._edges3D = {}
-        self._vertices = []
+        # The 3D edge and the faces each projected edge comes from
+        self._edges3D = []
+        edges_faces = []
+        self._vertices = transform_points(object3D.vertices, matrix)
         self._vertices_match = {}
 
-        def project(point, matrix):
-            x = sum([pc * coord
-                     for pc, coord in zip(matrix[0],
-                                          point.coordinates)])
-            y = sum([pc * coord
-                     for pc, coord in zip(matrix[1],
-                                          point.coordinates)])
-            return Point(x, y, point.name)
-
-        for vertex in object3D.vertices:
-            projected_point = project(vertex, matrix)
-            self._vertices.append(projected_point)
+        for vertex, projected_point in zip(object3D.vertices, self._vertices):
             self._vertices_match[vertex.name] = (vertex, projected_point)
 
         # To store to which edges a vertex belongs
         vertices_connexions = {k: [] for k in self._vertices}
 
-        # Build the projected edges
-        for edge in object3D.edges:
-            p0 = self._vertices_match[edge.endpoints[0].name][1]
-            p1 = self._vertices_match[edge.endpoints[1].name][1]
+        # Build the projected edges. Two of them are the same if their
+        # endpoints are at the same positions.
+        projected_keys = set()
+        for edge, (i, j) in zip(object3D.edges, object3D.edges_keys):
+            p0, p1 = self._vertices[i], self._vertices[j]
             # TODO: check cases when the projected edge is a single point
             # (ZeroBipoint should be raised)
             projected_edge = LineSegment(p0, p1,
@@ -161,10 +141,12 @@ class ObliqueProjection(Drawable, HasThickness):
                                          sloped_label=False)
             vertices_connexions[p0].append(LineSegment(p0, p1))
             vertices_connexions[p1].append(LineSegment(p1, p0))
-            if projected_edge not in self._edges:  # TODO: else, what...?
+            key = frozenset((p0.position_key, p1.position_key))
+            if key not in projected_keys:  # TODO: else, what...?
+                projected_keys.add(key)
                 self._edges.append(projected_edge)
-            if projected_edge not in self._edges3D:  # TODO: else, what...?
-                self._edges3D[projected_edge] = edge
+                self._edges3D.append(edge)
+                edges_faces.append(set(object3D.adjacent_faces(i, j)))
         # Find out which edges are hidden.
         # The ones that belong to convex hull of the projected vertices are
         # considered visible. By default, they will remain visible (i.e. keep
@@ -172,21 +154,39 @@ class ObliqueProjection(Drawable, HasThickness):
         points_cloud = set()  # to avoid duplicates
         for edge in self.edges:
             points_cloud.update(edge.endpoints)
-        cvh = convex_hull(*points_cloud)
-        for edge in self.edges:
-            # Only edges not belonging to the convex hull may be hidden
-            if not (edge.endpoints[0] in cvh and edge.endpoints[1] in cvh):
-                m = self._edges3D[edge].midpoint()
-                pm = project(m, matrix)  # projected midpoint
-                # Check if the midpoint of the tested edge is behind (i.e.
-                # deeper) than a face while being inside it
-                for f in object3D.faces:
-                    pface = [project(v, matrix) for v in f.vertices]
-                    if (all([v.z <= m.z for v in f.vertices])
-                        and pm not in convex_hull(pm, *pface)
-                        and not any(m.belongs_to(s) for s in f.sides)):
-                        edge.dashpattern = \
-                            config.oblique_projection.DASHPATTERN
+        cvh = set(convex_hull(*points_cloud))
+        # Only edges not belonging to the convex hull may be hidden
+        candidates = [n for n, edge in enumerate(self.edges)
+                      if not (edge.endpoints[0] in cvh
+                              and edge.endpoints[1] in cvh)]
+        if candidates:
+            # The faces' projected hulls and highest applicates are
+            # calculated once, from the already projected vertices
+            coordinates = object3D.mesh.coordinates
+            faces = [(max(coordinates[i][2] for i in face),
+                      convex_hull(*[self._vertices[i] for i in face]))
+                     for face in object3D.faces_indices]
+            midpoints = [self._edges3D[n].midpoint(name=None)
+                         for n in candidates]
+            projected_midpoints = transform_points(midpoints, matrix)
+            own_faces = [edges_faces[n] for n in candidates]
+            hidden = [False for _ in candidates]
+            # An edge is hidden if its midpoint is behind (i.e. deeper) than
+            # a face (it does not belong to) while being inside it. Each face
+            # is checked at once against all remaining candidates.
+            for i, (zmax, hull) in enumerate(faces):
+                tested = [n for n, m in enumerate(midpoints)
+                          if not hidden[n] and zmax <= m.z
+                          and i not in own_faces[n]
+                          and projected_midpoints[n] not in hull]
+                inside = point_in_hull([projected_midpoints[n]
+                                        for n in tested], hull)
+                for n, is_inside in zip(tested, inside):
+                    hidden[n] = is_inside
+            for n, is_hidden in zip(candidates, hidden):
+                if is_hidden:
+                    self.edges[n].dashpattern = \
+                        config.oblique_projection.DASHPATTERN
 
         # Setup the vertices' labels
         for vertex in self.vertices:
@@ -19,50 +19,171 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+from decimal import Decimal
+from math import atan2, degrees, hypot
 
-def convex_hull(*points):
+from mathmakerlib.exceptions import ZeroVector
+
+# Below this length, a sum of unit vectors is considered to be a zero vector
+ZERO_LENGTH = 1e-9
+
+
+def delta(p, q):
     """
-    Compute the convex hull of a set of points belonging to plane Oxy.
+    Coordinates of the vector from p to q, as a tuple of three Decimals.
+
+    Unlike Vector(p, q), this creates no Number (nor any other object).
+
+    :param p: the start Point
+    :type p: Point
+    :param q: the end Point
+    :type q: Point
+    :rtype: tuple
+    """
+    return (Decimal.__sub__(q.x, p.x), Decimal.__sub__(q.y, p.y),
+            Decimal.__sub__(q.z, p.z))
+
+
+def slope360(u):
+    """
+    Slope between the vector u and X-axis, from 0° to 360°, as a float.
+
+    It is rounded to 0.001, like Vector.slope360. As with Vector.slope360, a
+    3D vector's slope is the angle between the vector and X-axis, oriented
+    by the sign of its second coordinate.
+
+    :param u: the vector's coordinates (two or three of them)
+    :type u: tuple
+    :rtype: float
+    """
+    x, y = float(u[0]), float(u[1])
+    z = float(u[2]) if len(u) > 2 else 0.0
+    if not x and not y and not z:
+        raise ZeroVector('Cannot calculate the slope of a zero-length '
+                         'Vector.')
+    theta = round(degrees(atan2(hypot(y, z), x)), 3)
+    return theta if y >= 0 else round(360 - theta, 3)
+
+
+def bisector_slope360(u, v):
+    """
+    Slope of the bisector of the vectors u and v, from 0° to 360°.
+
+    The bisector is oriented like Vector.bisector() orients it. If u and v
+    are opposite, the slope of u rotated by 90° (in the plane) is returned.
+
+    :param u: the first vector's coordinates (two or three of them)
+    :type u: tuple
+    :param v: the second vector's coordinates (two or three of them)
+    :type v: tuple
+    :rtype: float
+    """
+    u = [float(c) for c in u] + [0.0] * (3 - len(u))
+    v = [float(c) for c in v] + [0.0] * (3 - len(v))
+    lu, lv = hypot(*u), hypot(*v)
+    b = [cu / lu + cv / lv for cu, cv in zip(u, v)]
+    if hypot(*b) < ZERO_LENGTH:
+        return slope360((-u[1], u[0]))
+    if (slope360(v) - slope360(u)) % 360 > 180:
+        b = [-c for c in b]
+    return slope360(b)
+
+
+def angle_measure(u, v, three_dimensional=False):
+    """
+    Measure of the angle from u to v, in degrees, as a Decimal.
+
+    In 2D, the angle is oriented anticlockwise and the result lies between 0°
+    and 360°. In 3D, it is not oriented and the result lies between 0° and
+    180°.
+
+    :param u: the first vector's coordinates, as Decimals
+    :type u: tuple
+    :param v: the second vector's coordinates, as Decimals
+    :type v: tuple
+    :param three_dimensional: whether to take the third coordinates in account
+    :type three_dimensional: bool
+    :rtype: Decimal
+    """
+    if three_dimensional:
+        cx = u[1] * v[2] - u[2] * v[1]
+        cy = u[2] * v[0] - u[0] * v[2]
+        cz = u[0] * v[1] - u[1] * v[0]
+        return Decimal(str(degrees(atan2((cx * cx + cy * cy + cz * cz).sqrt(),
+                                         u[0] * v[0] + u[1] * v[1]
+                                         + u[2] * v[2]))))
+    # The slopes are subtracted as Decimals, so that, for instance, a right
+    # angle's measure is exactly 90.
+    result = Decimal(str(degrees(atan2(v[1], v[0])))) \
+        - Decimal(str(degrees(atan2(u[1], u[0]))))
+    return result + 360 if result < 0 else result
+
+
+def near_rounding_tie(value, digits=3):
+    """
+    Tell whether rounding value at digits might differ from the Decimal way.
+
+    A float calculation may end exactly on a tie (like 6.2675) when the same
+    calculation done with Decimals ends slightly aside, or vice versa. Such
+    values should be calculated again, with Decimals.
+
+    :param value: the value to check
+    :type value: float
+    :param digits: the number of decimal digits used when rounding value
+    :type digits: int
+    :rtype: bool
+    """
+    return abs(abs(value) * 10 ** digits % 1 - 0.5) < 1e-6
+
+
+def _turn(o, a, b):
+    """
+    z-component of the cross product of vectors oa and ob.
+
+    Positive if oab makes a counter-clockwise turn, negative for a clockwise
+    turn and zero if o, a and b are collinear.
+    """
+    return ((a[0] - o[0]) * (b[1] - o[1])
+            - (a[1] - o[1]) * (b[0] - o[0]))
+
+
+def convex_hull_coordinates(coordinates):
+    """
+    Compute the convex hull of a set of (x, y) coordinates.
 
     Mostly taken from:
     https://en.wikibooks.org/wiki/Algorithm_Implementation/Geometry
     /Convex_hull/Monotone_chain
 
-    Output: a list of vertices of the convex hull in counter-clockwise order,
-    starting from the vertex with the smallest coordinates.
+    Output: a list of the coordinates of the vertices of the convex hull in
+    counter-clockwise order, starting from the smallest ones.
 
-    Implements Andrew's monotone chain algorithm. O(n log n) complexity.
+    Implements Andrew's monotone chain algorithm. O(n log n) complexity. The
+    calculations are exact if the coordinates are integers.
 
-    :param points: a list of Points.
-    :type points: a list of Points.
+    :param coordinates: the coordinates of the points
+    :type coordinates: iterable (of (x, y) tuples)
+    :rtype: list
     """
     # Remove duplicates to detect the case we have just one unique point.
-    # Sort the points by abscissa, then ordinate, then applicate.
-    points = sorted(set(points), key=lambda point: point.coordinates)
+    coordinates = sorted(set(coordinates))
 
     # Boring case: no points or a single point, possibly repeated multiple
     # times.
-    if len(points) <= 1:
-        return points
-
-    # 2D cross product of OA and OB vectors, i.e. z-component of their 3D
-    # cross product.
-    # Returns a positive value, if OAB makes a counter-clockwise turn,
-    # negative for clockwise turn, and zero if the points are collinear.
-    def cross(o, a, b):
-        return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+    if len(coordinates) <= 1:
+        return coordinates
 
     # Build lower hull
     lower = []
-    for p in points:
-        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+    for p in coordinates:
+        while len(lower) >= 2 and _turn(lower[-2], lower[-1], p) <= 0:
             lower.pop()
         lower.append(p)
 
     # Build upper hull
     upper = []
-    for p in reversed(points):
-        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+    for p in reversed(coordinates):
+        while len(upper) >= 2 and _turn(upper[-2], upper[-1], p) <= 0:
             upper.pop()
         upper.append(p)
 
@@ -70,3 +191,67 @@ def convex_hull(*points):
     # Last point of each list is omitted because it is repeated at the
     # beginning of the other list.
     return lower[:-1] + upper[:-1]
+
+
+def convex_hull(*points):
+    """
+    Compute the convex hull of a set of points belonging to plane Oxy.
+
+    Output: a list of vertices of the convex hull in counter-clockwise order,
+    starting from the vertex with the smallest coordinates.
+
+    The Points' coordinates are turned to integers (their position_key), so
+    the hull is calculated by convex_hull_coordinates() with exact integer
+    arithmetic. Points having the same position are only listed once (the
+    first one is kept).
+
+    :param points: a list of Points.
+    :type points: a list of Points.
+    """
+    positions = {}
+    for p in points:
+        positions.setdefault(p.position_key[:2], p)
+    return [positions[xy] for xy in convex_hull_coordinates(positions)]
+
+
+def _in_hull(xy, hull):
+    """
+    Tell whether xy lies inside hull, boundary included.
+
+    :param xy: the coordinates of the point
+    :type xy: tuple
+    :param hull: the coordinates of the vertices of the hull, in
+    counter-clockwise order
+    :type hull: list (of tuples)
+    :rtype: bool
+    """
+    if len(hull) == 1:
+        return xy == hull[0]
+    if len(hull) == 2:
+        (ax, ay), (bx, by) = hull
+        return (not _turn(hull[0], hull[1], xy)
+                and min(ax, bx) <= xy[0] <= max(ax, bx)
+                and min(ay, by) <= xy[1] <= max(ay, by))
+    return all(_turn(hull[i - 1], hull[i], xy) >= 0
+               for i in range(len(hull)))
+
+
+def point_in_hull(points, hull):
+    """
+    Tell which points lie inside a convex hull, boundary included.
+
+    Only the abscissas and ordinates are taken into account. The calculation
+    is exact, done on the Points' position_keys.
+
+    :param points: the Points to check
+    :type points: iterable (of Points)
+    :param hull: the vertices of the convex hull, in counter-clockwise order,
+    like convex_hull() returns them. One or two vertices are accepted too (the
+    "hull" is then a single point or a line segment).
+    :type hull: list (of Points)
+    :rtype: list (of bools)
+    """
+    hull = [v.position_key[:2] for v in hull]
+    if not hull:
+        return [False for _ in points]
+    return [_in_hull(p.position_key[:2], hull) for p in points]
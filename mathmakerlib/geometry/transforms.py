@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+from decimal import Decimal
+from math import cos, sin, radians
+
+from mathmakerlib import config
+from mathmakerlib.calculus.number import Number
+from mathmakerlib.geometry.point import Point
+from mathmakerlib.geometry.tools import near_rounding_tie
+
+# Matrices are lists of rows. Each row holds the coefficients applied to the
+# three coordinates of a Point, then the translation term. A matrix of two
+# rows produces 2D Points, a matrix of three rows produces 3D Points.
+
+
+def rotation_matrix(center, angle, axis=None):
+    """
+    Matrix of the rotation around center (or axis going through center).
+
+    :param center: the center of the rotation
+    :type center: Point
+    :param angle: the angle of the rotation
+    :type angle: a number
+    :param axis: the axis of the rotation for 3D rotation. If left to None,
+    the rotation happens around the center, in the plane (and the transformed
+    Points will be 2D Points).
+    :type axis: None or Vector
+    :rtype: list
+    """
+    cosθ = Number(str(cos(radians(angle))))
+    sinθ = Number(str(sin(radians(angle))))
+    if axis is None:
+        linear = [[cosθ, -sinθ, 0], [sinθ, cosθ, 0]]
+    else:
+        ux, uy, uz = axis.normalized().coordinates
+        linear = [[cosθ + (1 - cosθ) * ux ** 2,
+                   ux * uy * (1 - cosθ) - uz * sinθ,
+                   ux * uz * (1 - cosθ) + uy * sinθ],
+                  [uy * ux * (1 - cosθ) + uz * sinθ,
+                   cosθ + (1 - cosθ) * uy ** 2,
+                   uy * uz * (1 - cosθ) - ux * sinθ],
+                  [uz * ux * (1 - cosθ) - uy * sinθ,
+                   uz * uy * (1 - cosθ) + ux * sinθ,
+                   cosθ + (1 - cosθ) * uz ** 2]]
+    c = center.coordinates
+    return [row + [c[i] - sum([m * coord for m, coord in zip(row, c)])]
+            for i, row in enumerate(linear)]
+
+
+def _decimal_transform(matrix, coordinates):
+    """Apply matrix to coordinates, using Decimal's (faster) arithmetic."""
+    result = []
+    for row in matrix:
+        value = Decimal(0)
+        for m, c in zip(row, coordinates):
+            value = Decimal.__add__(value, Decimal.__mul__(m, c))
+        result.append(Decimal.__add__(value, row[3]))
+    return result
+
+
+def _float_transform(matrix, coordinates):
+    """Apply matrix (made of floats) to coordinates."""
+    return [row[0] * coordinates[0] + row[1] * coordinates[1]
+            + row[2] * coordinates[2] + row[3]
+            for row in matrix]
+
+
+def transform_points(points, matrix, rename='keep_name', precision=None):
+    """
+    Apply the same matrix to all points, at once.
+
+    The matrix is prepared only once for all points. With the 'float' geometry
+    backend (see config.geometry.BACKEND), the coordinates are calculated as
+    floats and only the results are turned to Numbers; a result lying too
+    close to a rounding tie is calculated again with Decimals, so that both
+    backends create the same Points.
+
+    :param points: the Points to transform
+    :type points: iterable (of Points)
+    :param matrix: the transformation matrix, a list of two or three rows,
+    each row made of four numbers (three coefficients and a translation term)
+    :type matrix: list
+    :param rename: if set to 'keep_name' (default), the transformed Points
+    keep the original names. If set to 'auto', they're named after the
+    originals, adding a ' (like A'). If set to None, they have no name.
+    Otherwise, it must be the list of the names to use, one per Point.
+    :type rename: None or str or list
+    :param precision: if not None, the precision at which the coordinates are
+    rounded (like Number.rounded()).
+    :type precision: None or a number
+    :rtype: list (of Points)
+    """
+    points = list(points)
+    if rename == 'keep_name':
+        names = [p.name for p in points]
+    elif rename == 'auto':
+        names = [p.name + "'" for p in points]
+    elif rename is None:
+        names = [None] * len(points)
+    else:
+        names = list(rename)
+        if len(names) != len(points):
+            raise ValueError('Expected {} names to rename the transformed '
+                             'Points, got {} instead.'
+                             .format(len(points), len(names)))
+    if len(matrix) not in [2, 3] or any(len(row) != 4 for row in matrix):
+        raise ValueError('The matrix must have two or three rows of four '
+                         'numbers each.')
+    digits = 3
+    if precision is not None:
+        precision = Number(precision)
+        digits = max(-precision.as_tuple().exponent, 0)
+    decimal_matrix = [[Number(m) for m in row] for row in matrix]
+    float_matrix = None
+    if config.geometry.BACKEND == 'float':
+        float_matrix = [[float(m) for m in row] for row in decimal_matrix]
+
+    result = []
+    for p, name in zip(points, names):
+        coordinates = None
+        if float_matrix is not None:
+            coordinates = _float_transform(float_matrix, p.float_coordinates)
+            if any(near_rounding_tie(c, digits) for c in coordinates):
+                coordinates = None
+            else:
+                coordinates = [Number(str(c)) for c in coordinates]
+        if coordinates is None:
+            coordinates = [Number(c)
+                           for c in _decimal_transform(decimal_matrix,
+                                                       p.coordinates)]
+        if precision is not None:
+            coordinates = [c.rounded(precision) for c in coordinates]
+        if len(coordinates) == 2:
+            coordinates.append('undefined')
+        result.append(Point(*coordinates, name))
+    return result
@@ -19,9 +19,7 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
-from pathlib import Path
-
-from mathmakerlib import required
+from mathmakerlib import required, templates
 from mathmakerlib.calculus.number import Number
 from mathmakerlib.calculus.fraction import Fraction
 from mathmakerlib.core.drawable import Drawable, HasThickness
@@ -141,12 +139,10 @@ class XAxis(Drawable, HasThickness, Bipoint):
                 '__POINTS_DRAWN__': '\n'.join(points_drawn)
                 }
 
-    def draw(self):
+    def _draw_chunks(self):
         required.package['tikz'] = True
-        pic = (Path(__file__).parent / 'templates/xaxis.tex').read_text()
-        for placeholder in self.template_fmt:
-            pic = pic.replace(placeholder, self.template_fmt[placeholder])
-        return pic
+        yield templates.get('geometry/templates/xaxis.tex')\
+            .substitute(self.template_fmt)
 
     def _tikz_draw_options(self):
         pass
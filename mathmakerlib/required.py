@@ -20,9 +20,87 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import MutableMapping
+
+REQUIREMENTS = ('package', 'options', 'tikz_library', 'tikzset',
+                'callout_style')
+
+
+def _defaults():
+    """Return fresh requirements, where nothing is required yet."""
+    # It's difficult to track amssymb, that could show up almost anywhere.
+    # This is left to mathmakerlib's user. A (yet short) list of symbols is
+    # provided in LaTeX module.
+
+    # gensymb would be required to use \degree; as it is now, angles are
+    # produced by siunitx via \ang, so there's no need for gensymb
+    return {'package': {pkg_name: False
+                        for pkg_name in ['tikz', 'siunitx', 'xcolor',
+                                         'eurosym', 'amsmath', 'stackengine',
+                                         'scalerel', 'cancel', 'multicol',
+                                         'placeins', 'ulem', 'textcomp',
+                                         'array', 'graphicx', 'epstopdf',
+                                         'textpos', 'fancyvrb']},
+            'options': {'xcolor': set(), 'textpos': set()},
+            'tikz_library': {'angles': False,
+                             'decorations.markings': False,
+                             'quotes': False,
+                             'arrows': False,
+                             'shapes.geometric': False,
+                             'shapes.callouts': False,
+                             'arrows.meta': False,
+                             'positioning': False},
+            'tikzset': {'singledash_hatchmark': False,
+                        'doubledash_hatchmark': False,
+                        'tripledash_hatchmark': False},
+            'callout_style': {'callout_style1': False},
+            # 'hack': {'rightangle_mark': False}
+            }
+
+
+class RequirementsCollector(object):
+    """
+    The LaTeX requirements (packages, tikz libraries...) of one rendering.
+    """
+
+    def __init__(self):
+        for name, value in _defaults().items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return 'RequirementsCollector({})'.format(list(self.requirements()))
+
+    def requirements(self):
+        """
+        Return the requirements set so far, as (name, key, value) tuples.
+
+        :rtype: tuple
+        """
+        current = []
+        for name in REQUIREMENTS:
+            for key, value in getattr(self, name).items():
+                if name == 'options':
+                    current.extend((name, key, v) for v in sorted(value))
+                elif value:
+                    current.append((name, key, value))
+        return tuple(current)
+
+    def update(self, requirements):
+        """Set requirements, given as (name, key, value) tuples."""
+        for name, key, value in requirements:
+            if name == 'options':
+                getattr(self, name)[key].add(value)
+            else:
+                getattr(self, name)[key] = value
+
+
+_collector = ContextVar('mathmakerlib_requirements')
+
+
 def init():
-    global package, options, tikz_library, tikzset, callout_style
-    global required_initialized
+    global required_initialized, _default_collector
 
     try:
         required_initialized
@@ -31,29 +109,90 @@ def init():
 
     if not required_initialized:
         required_initialized = True
-        # It's difficult to track amssymb, that could show up almost anywhere.
-        # This is left to mathmakerlib's user. A (yet short) list of symbols is
-        # provided in LaTeX module.
-
-        # gensymb would be required to use \degree; as it is now, angles are
-        # produced by siunitx via \ang, so there's no need for gensymb
-        package = {pkg_name: False
-                   for pkg_name in ['tikz', 'siunitx', 'xcolor', 'eurosym',
-                                    'amsmath', 'stackengine', 'scalerel',
-                                    'cancel', 'multicol', 'placeins', 'ulem',
-                                    'textcomp', 'array', 'graphicx',
-                                    'epstopdf', 'textpos', 'fancyvrb']}
-        options = {'xcolor': set(), 'textpos': set()}
-        tikz_library = {'angles': False,
-                        'decorations.markings': False,
-                        'quotes': False,
-                        'arrows': False,
-                        'shapes.geometric': False,
-                        'shapes.callouts': False,
-                        'arrows.meta': False,
-                        'positioning': False}
-        tikzset = {'singledash_hatchmark': False,
-                   'doubledash_hatchmark': False,
-                   'tripledash_hatchmark': False}
-        callout_style = {'callout_style1': False}
-        # hack = {'rightangle_mark': False}
+        # Used outside of any collect() block, whatever the thread
+        _default_collector = RequirementsCollector()
+
+
+def current():
+    """Return the RequirementsCollector in use in the current context."""
+    return _collector.get(_default_collector)
+
+
+@contextmanager
+def collect():
+    """
+    Collect separately the requirements set inside a with block.
+
+    with required.collect() as reqs:
+        ...
+    reqs then contains exactly the requirements set in the block (by the
+    current thread or asyncio task), and the requirements collected outside
+    the block are left untouched.
+    """
+    reqs = RequirementsCollector()
+    token = _collector.set(reqs)
+    try:
+        yield reqs
+    finally:
+        _collector.reset(token)
+
+
+def record(fct, *args, **kwargs):
+    """
+    Call fct(*args, **kwargs) and return its result and its requirements.
+
+    The requirements set by fct are returned as a tuple of (name, key, value)
+    that can be set again later, using replay(). They're recorded starting
+    from fresh requirements, so that the ones that were already set before
+    are recorded too. They are set as usual, in the end.
+    """
+    outer = current()
+    try:
+        with collect() as reqs:
+            result = fct(*args, **kwargs)
+    finally:
+        recorded = reqs.requirements()
+        outer.update(recorded)
+    return result, recorded
+
+
+def replay(requirements):
+    """Set again requirements recorded by record()."""
+    current().update(requirements)
+
+
+class _RequirementsView(MutableMapping):
+    """One kind of the requirements of the RequirementsCollector in use."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def _requirements(self):
+        return getattr(current(), self._name)
+
+    def __getitem__(self, key):
+        return self._requirements()[key]
+
+    def __setitem__(self, key, value):
+        self._requirements()[key] = value
+
+    def __delitem__(self, key):
+        del self._requirements()[key]
+
+    def __iter__(self):
+        return iter(self._requirements())
+
+    def __len__(self):
+        return len(self._requirements())
+
+    def __repr__(self):
+        return repr(self._requirements())
+
+
+# Kept for backwards compatibility: they give access to the requirements of
+# the RequirementsCollector in use
+package = _RequirementsView('package')
+options = _RequirementsView('options')
+tikz_library = _RequirementsView('tikz_library')
+tikzset = _RequirementsView('tikzset')
+callout_style = _RequirementsView('callout_style')
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import re
+from string import Formatter
+
+try:
+    from importlib.resources import files
+except ImportError:  # python < 3.9
+    files = None
+
+from mathmakerlib.shared import ROOTDIR
+
+# Where the packaged templates are, relatively to mathmakerlib's root
+TEMPLATES_DIRS = ['calculus/templates', 'calculus/equations/templates',
+                  'geometry/templates']
+TEMPLATES_SUFFIXES = ('.tex', '.tikz')
+
+_registry = {}
+
+
+def _format_plan(text):
+    """
+    Parse a str.format() template into (literal, field, spec) segments.
+
+    Return None if the template cannot be handled this way (unbalanced
+    braces, fields using attributes, indices or conversions), then
+    str.format() will be used instead.
+    """
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError:
+        return None
+    plan = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (not field.isidentifier()
+                                  or conversion is not None
+                                  or '{' in spec):
+            return None
+        plan.append((literal, field, spec))
+    return plan
+
+
+def _placeholders_plan(text, placeholders):
+    """
+    Split text into (literal, placeholder) segments.
+
+    The last segment's placeholder is None. If several placeholders may
+    match at the same place (like BUBBLE and BUBBLETEXT), the longest one
+    wins.
+    """
+    pattern = re.compile('|'.join(re.escape(p)
+                                  for p in sorted(placeholders, key=len,
+                                                  reverse=True)))
+    plan = []
+    start = 0
+    for match in pattern.finditer(text):
+        plan.append((text[start:match.start()], match.group()))
+        start = match.end()
+    plan.append((text[start:], None))
+    return plan
+
+
+class Template(object):
+    """A template, read once and parsed once."""
+
+    def __init__(self, text):
+        """
+        Initialize Template
+
+        :param text: the content of the template
+        :type text: str
+        """
+        self._text = text
+        self._plan = _format_plan(text)
+        self._placeholders_plans = {}
+
+    def __repr__(self):
+        return 'Template({})'.format(repr(self._text))
+
+    @property
+    def text(self):
+        return self._text
+
+    def format(self, **data):
+        """
+        Return the text where the {fields} are replaced by their values.
+
+        Same result as self.text.format(**data), but the text is not parsed
+        again at each call.
+        """
+        if self._plan is None:
+            return self._text.format(**data)
+        output = []
+        for literal, field, spec in self._plan:
+            output.append(literal)
+            if field is not None:
+                output.append(format(data[field], spec))
+        return ''.join(output)
+
+    def substitute(self, values):
+        """
+        Return the text where the placeholders are replaced by their values.
+
+        All placeholders are replaced in one pass (a value containing a
+        placeholder is left as is). The text is split into literal and
+        placeholder segments only the first time a given set of
+        placeholders is used.
+
+        :param values: the placeholders (like 'XVAL0') and their values
+        :type values: dict (of str)
+        :rtype: str
+        """
+        if not values:
+            return self._text
+        placeholders = frozenset(values)
+        plan = self._placeholders_plans.get(placeholders)
+        if plan is None:
+            plan = _placeholders_plan(self._text, placeholders)
+            self._placeholders_plans[placeholders] = plan
+        output = []
+        for literal, placeholder in plan:
+            output.append(literal)
+            if placeholder is not None:
+                output.append(values[placeholder])
+        return ''.join(output)
+
+
+def _resource(name):
+    """The packaged file (or directory) name, relatively to mathmakerlib."""
+    if files is None:
+        return ROOTDIR / name
+    return files('mathmakerlib').joinpath(name)
+
+
+def get(name):
+    """
+    Return the packaged template name, read from disk only the first time.
+
+    :param name: the path of the template, relatively to mathmakerlib's root
+    directory, like 'geometry/templates/xaxis.tex'
+    :type name: str
+    :rtype: Template
+    """
+    template = _registry.get(name)
+    if template is None:
+        template = Template(_resource(name).read_text(encoding='utf-8'))
+        _registry[name] = template
+    return template
+
+
+def warm_up():
+    """
+    Read and parse all packaged templates at once (e.g. at startup).
+
+    :rtype: list (of the templates' names)
+    """
+    names = []
+    for directory in TEMPLATES_DIRS:
+        for entry in sorted(_resource(directory).iterdir(),
+                            key=lambda entry: entry.name):
+            if entry.name.endswith(TEMPLATES_SUFFIXES):
+                name = '{}/{}'.format(directory, entry.name)
+                get(name)
+                names.append(name)
+    return names
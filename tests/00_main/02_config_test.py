@@ -72,3 +72,19 @@ def test_points_setup_error():
         config.points.DEFAULT_POSITION_PRECISION = 'a'
     assert str(excinfo.value) == 'DEFAULT_POSITION_PRECISION must be a '\
         'number, found <class \'str\'> instead.'
+
+
+def test_geometry_setup():
+    """Check geometry backend setup."""
+    assert config.geometry.BACKEND == 'decimal'
+    with pytest.raises(ValueError) as excinfo:
+        config.geometry.BACKEND = 'numpy'
+    assert str(excinfo.value) == 'Incorrect geometry backend: \'numpy\'. '\
+        'Available values belong to: [\'decimal\', \'float\'].'
+    with config.geometry.use_backend('float'):
+        assert config.geometry.BACKEND == 'float'
+    assert config.geometry.BACKEND == 'decimal'
+    with pytest.raises(RuntimeError):
+        with config.geometry.use_backend('float'):
+            raise RuntimeError
+    assert config.geometry.BACKEND == 'decimal'
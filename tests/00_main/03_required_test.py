@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import asyncio
+import threading
+
+import pytest
+
+from mathmakerlib import required
+from mathmakerlib.calculus import Number
+
+
+def test_collect():
+    """Check requirements are collected apart, inside a with block."""
+    required.package['eurosym'] = False
+    with required.collect() as reqs:
+        assert not required.package['siunitx']
+        Number(4, unit='€').printed
+        assert required.package['siunitx']
+    assert not required.package['eurosym']
+    assert reqs.requirements() == (('package', 'siunitx', True),
+                                   ('package', 'eurosym', True))
+    assert isinstance(reqs, required.RequirementsCollector)
+    assert required.current() is not reqs
+
+
+def test_nested_collect():
+    """Check collect() blocks can be nested."""
+    with required.collect() as outer:
+        required.options['xcolor'].add('dvipsnames')
+        with required.collect() as inner:
+            required.tikzset['singledash_hatchmark'] = True
+        assert required.current() is outer
+    assert outer.requirements() == (('options', 'xcolor', 'dvipsnames'), )
+    assert inner.requirements() == (('tikzset', 'singledash_hatchmark',
+                                     True), )
+
+
+def test_collect_in_threads():
+    """Check concurrent renderings do not mix their requirements."""
+    results = {}
+    barrier = threading.Barrier(2)
+
+    def render(name, unit):
+        with required.collect() as reqs:
+            barrier.wait()
+            Number(1, unit=unit).printed
+            barrier.wait()
+        results[name] = reqs.requirements()
+
+    threads = [threading.Thread(target=render, args=('a', '€')),
+               threading.Thread(target=render, args=('b', None))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {'a': (('package', 'siunitx', True),
+                             ('package', 'eurosym', True)),
+                       'b': ()}
+
+
+def test_collect_in_asyncio_tasks():
+    """Check requirements are collected apart in asyncio tasks."""
+    async def render(package_name):
+        with required.collect() as reqs:
+            await asyncio.sleep(0)
+            required.package[package_name] = True
+            await asyncio.sleep(0)
+        return reqs.requirements()
+
+    async def main():
+        return await asyncio.gather(render('cancel'), render('ulem'))
+
+    assert asyncio.run(main()) == [(('package', 'cancel', True), ),
+                                   (('package', 'ulem', True), )]
+
+
+def test_record_and_replay():
+    """Check recorded requirements are set as usual, and can be replayed."""
+    with required.collect() as reqs:
+        required.package['array'] = True
+        result, recorded = required.record(
+            lambda: required.package.__setitem__('array', True) or 'ok')
+        assert result == 'ok'
+        assert recorded == (('package', 'array', True), )
+    with required.collect() as reqs:
+        required.replay(recorded)
+    assert reqs.requirements() == (('package', 'array', True), )
+    with pytest.raises(KeyError):
+        required.record(lambda: required.package['undefined'])
+
+
+def test_backwards_compatible_views():
+    """Check required.package etc. behave as the dicts they used to be."""
+    with required.collect():
+        assert len(required.tikzset) == 3
+        assert sorted(required.tikzset) == ['doubledash_hatchmark',
+                                            'singledash_hatchmark',
+                                            'tripledash_hatchmark']
+        assert 'callout_style1' in required.callout_style
+        assert not any(required.tikz_library.values())
+        assert required.options['xcolor'] == set()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import pytest
+
+from mathmakerlib import templates
+from mathmakerlib.templates import Template
+
+
+def test_template_format():
+    """Check Templates give the same results as str.format()."""
+    text = r'\[\text{{{hyp}}}^{{2}}={hyp_length:>4}^{{2}}\]'
+    t = Template(text)
+    assert t.text == text
+    assert t.format(hyp='AB', hyp_length='3') \
+        == text.format(hyp='AB', hyp_length='3')
+    with pytest.raises(KeyError):
+        t.format(hyp='AB')
+    t = Template('{a[0]} {b!r}')
+    assert t.format(a='xy', b='z') == "x 'z'"
+    t = Template('\\foreach \\x in {')
+    with pytest.raises(ValueError):
+        t.format()
+
+
+def test_registry():
+    """Check the packaged templates are read once."""
+    name = 'calculus/equations/templates/'\
+        'pythagorean_equation_calculate_square_hyp.tex'
+    t = templates.get(name)
+    assert templates.get(name) is t
+    assert t.format(hyp='AB', hyp_length='3', square_hyp_length='9') \
+        == '\\[\\text{AB}^{2}=3^{2}\\]\n\\[\\text{AB}^{2}=9\\]\n'
+    names = templates.warm_up()
+    assert name in names
+    assert 'calculus/templates/table2.tikz' in names
+    assert 'geometry/templates/xaxis.tex' in names
+    assert 'calculus/templates/notes' not in names
+    assert templates.get('geometry/templates/xaxis.tex') \
+        is templates.get('geometry/templates/xaxis.tex')
+
+
+def test_template_substitute():
+    """Check placeholders are replaced in one pass."""
+    t = Template('XVAL1/YVAL1,XVAL10 BUBBLE')
+    assert t.substitute({}) == t.text
+    values = {'XVAL1': 'YVAL1', 'YVAL1': 'b', 'XVAL10': 'c',
+              'BUBBLE': 'BUBBLE'}
+    assert t.substitute(values) == 'YVAL1/b,c BUBBLE'
+    assert t.substitute(values) == 'YVAL1/b,c BUBBLE'
+    assert len(t._placeholders_plans) == 1
+    assert Template('BUBBLETEXT BUBBLE')\
+        .substitute({'BUBBLE': 'a', 'BUBBLETEXT': 'b'}) == 'b a'
+    assert Template('no placeholder').substitute({'X': 'y'}) \
+        == 'no placeholder'
@@ -19,6 +19,8 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import io
+
 from mathmakerlib.LaTeX import Environment, TikZPicture
 
 
@@ -41,3 +43,26 @@ def test_preset_environments():
     assert str(tp) == r'''\begin{tikzpicture}[baseline=3pt, scale=1.5]
 \draw something
 \end{tikzpicture}'''
+
+
+def test_imprint_to():
+    """Check writing environments to a text stream."""
+    e = Environment('document', 'Some NAME and OPTIONS', 'option1')
+    fp = io.StringIO()
+    e.imprint_to(fp)
+    assert fp.getvalue() == str(e) == r'''\begin{document}[option1]
+Some NAME and OPTIONS
+\end{document}'''
+
+
+def test_template():
+    """Check the environments' output follows their template."""
+    class Tight(Environment):
+        @property
+        def template(self):
+            return r'\begin{NAME}OPTIONS CONTENT \end{NAME}'
+    e = Tight('center', 'Some text', 'option1')
+    fp = io.StringIO()
+    e.imprint_to(fp)
+    assert fp.getvalue() == str(e) \
+        == r'\begin{center}[option1] Some text \end{center}'
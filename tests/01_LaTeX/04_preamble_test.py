@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import pytest
+
+from mathmakerlib import required
+from mathmakerlib.LaTeX import Preamble, UsePackage
+
+
+def test_instanciation_errors():
+    """Check wrong requirements are rejected."""
+    with pytest.raises(ValueError) as excinfo:
+        Preamble([('packages', 'tikz', True)])
+    assert str(excinfo.value) == 'Requirements must be (name, key, value) '\
+        'tuples, name belonging to (\'package\', \'options\', '\
+        '\'tikz_library\', \'tikzset\', \'callout_style\'); '\
+        'got (\'packages\', \'tikz\', True) instead.'
+
+
+def test_empty_preamble():
+    """Check an empty preamble."""
+    with required.collect() as reqs:
+        p = Preamble()
+    assert p == Preamble(reqs) == Preamble([])
+    assert p.packages == []
+    assert p.tikz_libraries is None
+    assert p.tikzsets == []
+    assert str(p) == ''
+
+
+def test_preamble():
+    """Check the preamble is minimal and deterministic."""
+    with required.collect() as reqs:
+        required.tikzset['singledash_hatchmark'] = True
+        required.tikz_library['quotes'] = True
+        required.tikz_library['angles'] = True
+        required.options['xcolor'].add('dvipsnames')
+        required.package['eurosym'] = True
+        required.package['siunitx'] = True
+    p = Preamble(reqs)
+    assert [str(cmd) for cmd in p.packages] == \
+        [r'\usepackage[dvipsnames]{xcolor}', r'\usepackage{tikz}',
+         r'\usepackage{siunitx}', r'\usepackage{eurosym}']
+    assert isinstance(p.packages[0], UsePackage)
+    assert str(p.tikz_libraries) == r'\usetikzlibrary{angles, quotes}'
+    assert str(p) == r'''\usepackage[dvipsnames]{xcolor}
+\usepackage{tikz}
+\usepackage{siunitx}
+\usepackage{eurosym}
+\usetikzlibrary{angles, quotes}
+\tikzset{singledash/.style={decoration={ markings, mark= at position 0.5
+with { \draw (0pt,-2.5pt) -- (0pt,2.5pt);
+} }, pic actions/.append code=\tikzset{postaction=decorate}}}'''
+    q = Preamble(reversed(reqs.requirements()))
+    assert p == q
+    assert hash(p) == hash(q)
+    assert len({p, q, Preamble([])}) == 2
+    assert Preamble([('package', 'tikz', True), ('package', 'ulem', False)])\
+        == Preamble([('package', 'tikz', True)])
+
+
+def test_callout_styles_and_unknown_packages():
+    """Check callout styles and packages unknown to mathmakerlib."""
+    p = Preamble([('callout_style', 'callout_style1', True),
+                  ('package', 'zref', True), ('package', 'amsthm', True),
+                  ('package', 'amsmath', True)])
+    assert str(p) == r'''\usepackage{tikz}
+\usepackage{amsmath}
+\usepackage{amsthm}
+\usepackage{zref}
+\tikzset{callout_style1/.style={rectangle callout, rounded corners=0.4cm,
+minimum height=1.2cm, minimum width=1.6cm,
+inner xsep=0.3cm, inner ysep=0.1cm}}'''
@@ -19,11 +19,16 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import io
+import threading
+
 import pytest
 
 from mathmakerlib import required
 from mathmakerlib.calculus import Number
-from mathmakerlib.core.drawable import ARROW_TIPS
+from mathmakerlib.core.drawable import ARROW_TIPS, Drawable
+from mathmakerlib.core.drawable import Versioned, versions, same_versions
+from mathmakerlib.core.drawable import _versioning_suspended
 from mathmakerlib.core.drawable import HasRadius, HasThickness, HasArrowTips
 from mathmakerlib.core.drawable import tikz_options_list, tikz_approx_position
 from mathmakerlib.geometry import Point, LineSegment, Angle, AngleDecoration
@@ -258,3 +263,128 @@ def test_boundingbox(A, E):
 
 \useasboundingbox (-1,-1) rectangle (2,1);
 \end{tikzpicture}"""
+
+
+def test_sections_registry(A, E):
+    """Check sections are resolved once per class, in order."""
+    assert LineSegment._tikz_sections_methods[0][0] == 'declarations'
+    assert [name for name, _ in LineSegment._tikz_sections_methods] \
+        == list(LineSegment.tikz_sections)
+
+
+def test_debug_hook(A, E, capsys):
+    """Check drawing does not output anything, unless a hook is set."""
+    ls = LineSegment(A, E)
+    ls.drawn
+    assert capsys.readouterr().err == ''
+    drawn_sections = []
+    Drawable.debug_hook = lambda d, name, output: \
+        drawn_sections.append((d, name))
+    try:
+        ls.drawn
+    finally:
+        Drawable.debug_hook = None
+    assert drawn_sections == [(ls, 'declarations'), (ls, 'drawing'),
+                              (ls, 'labeling'), (ls, 'boundingbox')]
+
+
+def test_draw_to(A, E):
+    """Check drawing to a text stream, section by section."""
+    ls = LineSegment(A, E, label='4 cm')
+    required.package['tikz'] = False
+    fp = io.StringIO()
+    ls.draw_to(fp)
+    assert required.package['tikz']
+    assert fp.getvalue() == ls.drawn
+    written = []
+
+    class Stream(object):
+        def write(self, s):
+            written.append(s)
+
+    ls.draw_to(Stream())
+    assert len(written) == 2 + len(LineSegment.tikz_sections) + 1
+    assert written[0] == r'\begin{tikzpicture}'
+    assert written[-1] == r'\end{tikzpicture}'
+
+
+def test_render_cache(A, E, monkeypatch):
+    """Check memoized drawings are updated when the object is modified."""
+    drawn_sections = []
+
+    def counted(name, section):
+        def counted_section(self):
+            drawn_sections.append(name)
+            return section(self)
+        return counted_section
+
+    monkeypatch.setattr(Angle, '_tikz_sections_methods',
+                        tuple((name, counted(name, section))
+                              for name, section
+                              in Angle._tikz_sections_methods))
+    X = Point(1, 1, 'X')
+    α = Angle(X, A, E, decoration=AngleDecoration(hatchmark='doubledash'))
+    expected = α.drawn
+    α.render_cache = True
+    drawn_sections.clear()
+    assert α.drawn == expected
+    assert drawn_sections == list(Angle.tikz_sections)
+    drawn_sections.clear()
+    required.package['tikz'] = False
+    required.tikz_library['angles'] = False
+    required.tikz_library['decorations.markings'] = False
+    required.tikzset['doubledash_hatchmark'] = False
+    assert α.drawn == expected
+    assert drawn_sections == []
+    assert required.package['tikz']
+    assert required.tikz_library['angles']
+    assert required.tikz_library['decorations.markings']
+    assert required.tikzset['doubledash_hatchmark']
+    α.decoration.hatchmark = 'tripledash'
+    assert α.drawn == expected.replace('doubledash', 'tripledash')
+    assert drawn_sections == list(Angle.tikz_sections)
+    drawn_sections.clear()
+    α.drawn
+    assert drawn_sections == []
+    A.name = 'Z'
+    assert '(Z)' in α.drawn
+    assert drawn_sections == list(Angle.tikz_sections)
+    α.render_cache = False
+    assert '(Z)' in α.drawn
+    required.tikz_library['decorations.markings'] = False
+    required.tikzset['doubledash_hatchmark'] = False
+    required.tikzset['tripledash_hatchmark'] = False
+
+
+def test_versions(A, E):
+    """Check the versions of Versioned objects and of their parts."""
+    class Holder(Versioned):
+        def __init__(self, *parts):
+            self.parts = list(parts)
+
+    version = A.version
+    A.name = 'Z'
+    assert A.version == version + 1
+    h = Holder(A, E)
+    v = versions(h)
+    assert [o for o, _ in v] == [h, E, A]
+    assert same_versions(v, versions(h))
+    h.parts.pop()
+    assert not same_versions(v, versions(h))
+    h.parts.append(E)
+    assert same_versions(v, versions(h))
+    E.label = 'e'
+    assert not same_versions(v, versions(h))
+    # While drawing, the setters do not bump versions; but only in the
+    # drawing thread
+    token = _versioning_suspended.set(True)
+    try:
+        version = A.version
+        A.name = 'Y'
+        assert A.version == version
+        thread = threading.Thread(target=setattr, args=(A, 'name', 'W'))
+        thread.start()
+        thread.join()
+        assert A.version == version + 1
+    finally:
+        _versioning_suspended.reset(token)
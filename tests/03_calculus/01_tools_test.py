@@ -25,6 +25,8 @@ from decimal import Decimal
 from mathmakerlib.calculus import is_number, is_integer, is_natural
 from mathmakerlib.calculus import prime_factors, prime_decomposition
 from mathmakerlib.calculus import weighted_average
+from mathmakerlib.calculus import factorize, factorize_many
+from mathmakerlib.calculus.tools import SIEVE_LIMIT
 
 
 def test_is_number():
@@ -98,5 +100,23 @@ def test_prime_decomposition():
     assert prime_decomposition(28224) == [(2, 6), (3, 2), (7, 2)]
 
 
+def test_factorize():
+    """Check factorize() and factorize_many() results."""
+    with pytest.raises(TypeError) as excinfo:
+        factorize('a')
+    assert str(excinfo.value) == 'The argument must be an integer.'
+    assert factorize(0) == ()
+    assert factorize(1) == ()
+    assert factorize(28224) == ((2, 6), (3, 2), (7, 2))
+    assert factorize(-28224) == ((2, 6), (3, 2), (7, 2))
+    assert factorize(Decimal('16065')) == ((3, 3), (5, 1), (7, 1), (17, 1))
+    assert factorize(SIEVE_LIMIT + 3) == ((1000003, 1), )
+    assert factorize(2 ** 40 * 999983) == ((2, 40), (999983, 1))
+    assert factorize_many([12, 13, 1]) == [((2, 2), (3, 1)), ((13, 1), ), ()]
+    assert all(prime_factors(n) == [p for p, e in factorize(n)
+                                    for _ in range(e)]
+               for n in range(2, 2000))
+
+
 def test_weighted_average():
     assert weighted_average(10, 20, 3, 7) == 17
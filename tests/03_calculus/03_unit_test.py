@@ -20,11 +20,13 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import pytest
+from copy import deepcopy
 from decimal import Decimal
 
 from mathmakerlib import required
 from mathmakerlib.calculus import Unit, physical_quantity, Number
 from mathmakerlib.calculus import difference_of_orders_of_magnitude
+from mathmakerlib.calculus.unit import CONVERSION_FACTORS
 
 
 def test_physical_quantity():
@@ -98,3 +100,53 @@ def test_repr():
     """Check __repr__."""
     assert repr(Unit('cm')) == 'Unit(\'cm\')'
     assert repr(Unit('cm', exponent=2)) == 'Unit(\'cm\'^Number(\'2\'))'
+
+
+def test_interning():
+    """Check Units are interned and immutable."""
+    u = Unit('cm', exponent=2)
+    assert Unit('cm', exponent=Number(2)) is u
+    assert Unit(Unit('cm'), exponent=2) is u
+    assert Unit(u) is u
+    assert deepcopy(u) is u
+    assert Number(4, unit=u).unit is u
+    assert (Number(2, unit='cm') * Number(2, unit='cm')).unit is u
+    assert Unit('cm') is not u
+    with pytest.raises(AttributeError) as excinfo:
+        u.exponent = 3
+    assert str(excinfo.value) == 'Unit objects are immutable.'
+    assert {u: 'area'}[Unit('cm', exponent=2)] == 'area'
+
+
+def test_interning_equal_exponents():
+    """Check Units having equal exponents are the same Unit."""
+    u = Unit('cm', 2)
+    assert Unit('cm', Number('2.0')) is u
+    assert Unit('cm', Number('2.0')) == u
+    assert Number(3, unit=Unit('cm', 2)) \
+        + Number(1, unit=Unit('cm', Number('2.0'))) == Number(4, unit=u)
+    assert Unit('cm', Number('2.50')) is Unit('cm', Number('2.5'))
+    assert Unit('cm', Number('2.5')) is not u
+
+
+def test_precomputed_attributes():
+    """Check physical quantity and magnitude index are precomputed."""
+    assert Unit('cm').physical_quantity == 'length'
+    assert Unit('cm', exponent=3).physical_quantity == 'volume'
+    assert Unit('cm').magnitude_index == 5
+    assert Unit('hL').magnitude_index == 1
+    assert Unit('undefined').physical_quantity is None
+    assert Unit('undefined').magnitude_index is None
+
+
+def test_conversion_factors():
+    """Check the precomputed conversion factors."""
+    difference_of_orders_of_magnitude('cm', 'm')
+    assert CONVERSION_FACTORS[(Unit('cm', exponent=3), Unit('L'))] \
+        == Decimal('0.001')
+    assert CONVERSION_FACTORS[(Unit('hL'), Unit('dm', exponent=3))] \
+        == Decimal('100')
+    assert (Unit('km', exponent=3), Unit('L')) not in CONVERSION_FACTORS
+    assert difference_of_orders_of_magnitude(Unit('m', exponent=2),
+                                             Unit('cm', exponent=2)) \
+        == Decimal('10000')
@@ -20,6 +20,7 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import locale
+import random
 import pytest
 from copy import copy, deepcopy
 from decimal import Decimal, ROUND_HALF_UP
@@ -29,7 +30,7 @@ from mathmakerlib.core import Signed, Printable, Evaluable
 from mathmakerlib.calculus import is_integer, Unit, Number, Sign
 from mathmakerlib.calculus import move_fracdigits_to
 from mathmakerlib.calculus import remove_fracdigits_from
-from mathmakerlib.calculus import fix_fracdigits
+from mathmakerlib.calculus import fix_fracdigits, convert_many, trig_table
 from mathmakerlib.shared import LOCALE_US, LOCALE_FR
 
 
@@ -273,6 +274,32 @@ def test_atan():
     assert Number('-0.75').atan().rounded(Decimal('1.00')) == Number('-36.87')
 
 
+def test_exact_trigonometric_values():
+    """Check notable angles give exact values, whatever their sign."""
+    assert str(Number(-45).tan()) == '-1'
+    assert str(Number(-135).tan()) == '1'
+    assert str(Number('420.0').cos()) == '0.5'
+    assert str(Number(-690).sin()) == '0.5'
+
+
+def test_trig_table():
+    """Check trig_table()."""
+    assert trig_table([0, 30, 45, -60], 'cos', Decimal('0.01')) \
+        == [1, Number('0.87'), Number('0.71'), Number('0.5')]
+    assert trig_table([0, 30, 45, -60], 'cos') \
+        == [Number(a).cos() for a in [0, 30, 45, -60]]
+    assert trig_table(['0.5', '0.75'], 'atan', Decimal('0.1')) \
+        == [Number('26.6'), Number('36.9')]
+    assert trig_table([], 'sin') == []
+    with pytest.raises(ValueError) as excinfo:
+        trig_table([1], 'cotan')
+    assert str(excinfo.value) == 'fct must belong to [\'cos\', \'sin\', ' \
+        '\'tan\', \'acos\', \'asin\', \'atan\']; got \'cotan\' instead.'
+    with pytest.raises(ValueError) as excinfo:
+        trig_table([90], 'tan', Decimal('0.1'))
+    assert str(excinfo.value) == 'Tangent of 90° or -90° is indefinite.'
+
+
 def test_conversions_errors():
     """Check numbers' conversions errors."""
     i = Number(6, unit='m')
@@ -353,6 +380,19 @@ def test_convert_dL_to_cm3():
     assert j == Number(600, unit=Unit('cm', exponent=3))
 
 
+def test_convert_many():
+    """Check bulk conversions."""
+    numbers = [Number(6, unit='m'), Number('0.5', unit='dm'),
+               Number(12, unit='m')]
+    assert [n.uiprinted for n in convert_many(numbers, 'cm')] \
+        == ['600 cm', '5.0 cm', '1200 cm']
+    assert convert_many([Number(6, unit='dL')], Unit('cm', exponent=3)) \
+        == [Number(600, unit=Unit('cm', exponent=3))]
+    with pytest.raises(TypeError) as excinfo:
+        convert_many(numbers, 'g')
+    assert str(excinfo.value) == 'Cannot convert 6 m into g.'
+
+
 def test_rounded():
     """Check rounding is good."""
     assert Number(4.2).rounded(0) == 4
@@ -882,6 +922,33 @@ def test_split_exceptions():
         == 'Cannot split at unit the non integer Number 0.25'
 
 
+def test_split_sampling():
+    """Check split() picks its results directly, with the given generator."""
+    assert Number('9999.99').split(dig=2, rng=random.Random(1)) \
+        == Number('9999.99').split(dig=2, rng=random.Random(1))
+    for _ in range(20):
+        a, b = Number('9999.99').split(dig=2)
+        assert a + b == Number('9999.99')
+        assert Number(a).fracdigits_nb() == 4
+        assert Number(b).fracdigits_nb() == 4
+        a, b = Number('-4.5').split(operation='-', dig=1)
+        assert a - b == Number('-4.5')
+        assert Number(b).fracdigits_nb() == 2
+
+
+def test_iter_splits():
+    """Check iter_splits() lazily yields the same results as split()."""
+    assert list(Number(3).iter_splits(dig=1)) \
+        == Number(3).split(return_all=True, dig=1)
+    assert list(Number(70).iter_splits(operation='-')) \
+        == Number(70).split(operation='-', return_all=True)
+    splits = Number('9999.99').iter_splits(dig=2)
+    assert next(splits) == (Number('0.0001'), Number('9999.9899'))
+    assert next(splits) == (Number('0.0002'), Number('9999.9898'))
+    with pytest.raises(RuntimeError):
+        Number(1).iter_splits(at_unit=True)
+
+
 def test_split():
     """Check split() in different cases."""
     result = Number(14).split()
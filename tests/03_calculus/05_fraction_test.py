@@ -88,6 +88,46 @@ def test_comparisons():
     assert Fraction(5, 8) <= 1
     assert Fraction(9, 8) > 1
     assert Fraction(9, 8) >= 1
+    assert Fraction(1, 3) < Fraction(334, 1000)
+    assert Fraction(1, 3) > Number('0.3333333333333333333333333333')
+    assert Fraction('-', 1, 3) < Fraction(1, -4)
+    assert Fraction(2, 4) <= Fraction(1, 2)
+    assert Fraction(2, 4) >= Number('0.5')
+    assert Fraction(1, 2) < 0.75
+    assert Fraction(1, 2) < Number(1, unit='cm')
+    assert Fraction(3, 2) > Number(1, unit='cm')
+    assert Fraction(1, 2) <= Number('0.5', unit='cm')
+    assert Fraction(1, 2) >= Number('0.5', unit='cm')
+    with pytest.raises(TypeError):
+        Fraction(1, 2) < 'a'
+
+
+def test_arithmetic():
+    """Check Fraction's arithmetic is exact and gives reduced Fractions."""
+    assert Fraction(1, 2) + Fraction(1, 3) == Fraction(5, 6)
+    assert Fraction(1, 2) + 1 == Fraction(3, 2)
+    assert 1 + Fraction(1, 2) == Fraction(3, 2)
+    assert Fraction(1, 2) + Number('0.25') == Fraction(3, 4)
+    assert Fraction(1, 2) - Fraction(5, 6) == Fraction('-', 1, 3)
+    assert 1 - Fraction(1, 3) == Fraction(2, 3)
+    assert Fraction(2, 3) * Fraction(3, 4) == Fraction(1, 2)
+    assert Fraction('-', 2, 3) * -3 == Fraction(2, 1)
+    assert 3 * Fraction(1, 6) == Fraction(1, 2)
+    assert Fraction(2, 3) / Fraction(4, 9) == Fraction(3, 2)
+    assert 1 / Fraction(-2, 3) == Fraction('-', 3, 2)
+    assert Fraction(6, -8) / 3 == Fraction('-', 1, 4)
+    assert Fraction(1, 3) - Fraction(1, 3) == Fraction(0, 1)
+    assert -Fraction(1, 3) == Fraction('-', 1, 3)
+    assert -Fraction('-', 1, 3) == Fraction(1, 3)
+    assert Fraction(1, 3) + Fraction(1, 6) + Fraction(1, 2) == Fraction(1, 1)
+    assert Fraction(1, 3) + 0.1 == Fraction(13, 30)
+    assert 0.5 * Fraction(1, 3) == Fraction(1, 6)
+    with pytest.raises(ZeroDivisionError):
+        Fraction(1, 3) / 0
+    with pytest.raises(TypeError):
+        Fraction(1, 3) + 'a'
+    with pytest.raises(TypeError):
+        Fraction(1, 3) * Number(2, unit='cm')
 
 
 def test_hash():
@@ -96,6 +136,18 @@ def test_hash():
     hash(Fraction(3, 4))
 
 
+def test_hash_consistency():
+    """Check equal Fractions have the same hash."""
+    assert hash(Fraction(3, 4)) == hash(Fraction('+', Number(3), 4))
+    assert len({Fraction(3, 4), Fraction('+', 3, 4), Fraction('-', 3, 4)}) \
+        == 2
+
+
+def test_slots():
+    """Check Fraction does not carry a __dict__."""
+    assert not hasattr(Fraction(3, 4), '__dict__')
+
+
 def test_equality():
     """Check Fraction __eq__ and __ne__."""
     assert Fraction(Sign('+'), 5, 8) == Fraction(5, 8)
@@ -108,6 +160,7 @@ def test__repr__():
     """Check __repr__ is correct."""
     assert repr(Fraction(3, 4)) == 'Fraction(3, 4)'
     assert repr(Fraction('-', 3, 4)) == 'Fraction(\'-\', 3, 4)'
+    assert repr(Fraction(Number('3.0'), 4)) == 'Fraction(3.0, 4)'
 
 
 def test_printing():
@@ -117,6 +170,11 @@ def test_printing():
     assert Fraction(5, 8).imprint(start_expr=False, variant='user_input') \
         == '+5/8'
     assert Fraction(5, 8).uiprinted == '5/8'
+    assert Fraction(Number('3.0'), 4).printed == r'\dfrac{3.0}{4}'
+    assert Fraction('-', 3, Number('4.0')).uiprinted == '-3/4.0'
+    assert Fraction(Number('6.0'), 4).reduce().printed == r'\dfrac{3.0}{2}'
+    assert Fraction(Number('3.0'), 4) == Fraction(3, 4)
+    assert hash(Fraction(Number('3.0'), 4)) == hash(Fraction(3, 4))
 
 
 def test_evaluation():
@@ -160,3 +218,11 @@ def test_reducing():
     assert str(excinfo.value) == 'Fraction(3, 4) can no further be reduced.'
     assert Fraction(6, 8).reduce() == Fraction(3, 4)
     assert Fraction(9, 3).reduce() == 3
+    assert Fraction(12, 18).gcd == 6
+    assert Fraction(12, 18).reduce() == Fraction(6, 9)
+    assert Fraction(6, -3).reduce() == Fraction(2, -1)
+    assert Fraction(6, -3).reduced_by(3) == -2
+    assert Fraction(6, 8).reduced_by(Number(2)) == Fraction(3, 4)
+    with pytest.raises(ValueError) as excinfo:
+        Fraction(6, 8).reduced_by(-4)
+    assert str(excinfo.value) == 'Cannot divide 6 by -4 and get an integer.'
@@ -19,6 +19,8 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import io
+
 import pytest
 
 from mathmakerlib import required
@@ -100,3 +102,12 @@ def test_imprint(mocker):
     assert 'v8' in output
     assert 'SOME_CONTENT' in output
     assert 'baseline=3pt' in output
+
+
+def test_imprint_to():
+    t3 = Table([(1, 2), (3, 4), (5, 6)], bubble_value='?', baseline='3pt')
+    fp = io.StringIO()
+    required.package['tikz'] = False
+    t3.imprint_to(fp)
+    assert required.package['tikz']
+    assert fp.getvalue() == t3.printed
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import locale
+import pytest
+from decimal import Decimal, ROUND_DOWN
+
+from mathmakerlib import required
+from mathmakerlib.calculus import Number, NumberArray, Unit
+from mathmakerlib.shared import LOCALE_US, LOCALE_FR
+
+
+def test_instanciation_errors():
+    """Check NumberArray's instanciation exceptions."""
+    with pytest.raises(ValueError) as excinfo:
+        NumberArray([Number(1, unit='cm'), Number(2, unit='mm')])
+    assert str(excinfo.value) == 'All values of a NumberArray must share ' \
+        'the same unit.'
+    with pytest.raises(ValueError) as excinfo:
+        NumberArray([Number(1, unit='cm'), 2])
+    assert str(excinfo.value) == 'All values of a NumberArray must share ' \
+        'the same unit.'
+
+
+def test_instanciation():
+    """Check NumberArray's instanciation."""
+    a = NumberArray([1, '2.5', 3.75])
+    assert a.unit is None
+    assert a.values == [Decimal(1), Decimal('2.5'), Decimal('3.75')]
+    a = NumberArray([1, 2], unit='cm')
+    assert a.unit is Unit('cm')
+    numbers = [Number(1, unit='cm'), Number('2.5', unit='cm')]
+    a = NumberArray.from_numbers(numbers)
+    assert a.unit is Unit('cm')
+    assert a.to_numbers() == numbers
+    assert list(a) == numbers
+    assert a[1] == Number('2.5', unit='cm')
+    assert a[1:].to_numbers() == numbers[1:]
+    assert len(a) == 2
+    assert len(NumberArray()) == 0
+    assert repr(a) == 'NumberArray([Number(\'1 cm\'), Number(\'2.5 cm\')])'
+
+
+def test_arithmetic_errors():
+    """Check wrong operations raise errors."""
+    a = NumberArray([1, 2], unit='cm')
+    with pytest.raises(ValueError) as excinfo:
+        a + NumberArray([1, 2], unit='mm')
+    assert str(excinfo.value) == 'Cannot add two NumberArrays having ' \
+        'different Units (cm and mm).'
+    with pytest.raises(ValueError) as excinfo:
+        a - 1
+    assert str(excinfo.value) == 'Cannot subtract two NumberArrays having ' \
+        'different Units (cm and None).'
+    with pytest.raises(ValueError) as excinfo:
+        a * NumberArray([1, 2, 3])
+    assert str(excinfo.value) == 'Cannot operate on two NumberArrays of ' \
+        'different lengths (2 and 3).'
+
+
+def test_arithmetic():
+    """Check elementwise operations match Number's ones."""
+    x = [Number('1.5', unit='cm'), Number(4, unit='cm'),
+         Number('0.2', unit='cm')]
+    y = [Number(2, unit='cm'), Number('0.5', unit='cm'),
+         Number(8, unit='cm')]
+    a, b = NumberArray(x), NumberArray(y)
+    assert (a + b).to_numbers() == [i + j for i, j in zip(x, y)]
+    assert (a - b).to_numbers() == [i - j for i, j in zip(x, y)]
+    assert (a * b).to_numbers() == [i * j for i, j in zip(x, y)]
+    assert (a * b).unit is Unit('cm', exponent=2)
+    assert (a / b).to_numbers() == [i / j for i, j in zip(x, y)]
+    assert (a / b).unit is None
+    assert (a * 3).to_numbers() == [i * 3 for i in x]
+    assert (3 * a).to_numbers() == [3 * i for i in x]
+    assert (a / 2).to_numbers() == [i / 2 for i in x]
+    assert (1 / a).to_numbers() == [1 / i for i in x]
+    assert (1 / a).unit is Unit('cm', exponent=-1)
+    c = NumberArray([1, 2, 3])
+    assert (1 - c).to_numbers() == [1 - i for i in c]
+    assert (-a).to_numbers() == [-i for i in x]
+    assert abs(-a) == a
+
+
+def test_rounding():
+    """Check rounded(), standardized() and fracdigits_nb()."""
+    x = [Number('4.25', unit='cm'), Number('8.0', unit='cm'),
+         Number('1E+1', unit='cm'), Number('-0.04', unit='cm'),
+         Number('1234.5', unit='cm')]
+    a = NumberArray(x)
+    for precision in [Decimal('1'), Decimal('0.1'), Decimal('100')]:
+        assert a.rounded(precision).to_numbers() \
+            == [n.rounded(precision) for n in x]
+    assert a.rounded(Decimal('0.1'), rounding=ROUND_DOWN).to_numbers() \
+        == [n.rounded(Decimal('0.1'), rounding=ROUND_DOWN) for n in x]
+    assert [n.uiprinted for n in a.standardized()] \
+        == [n.standardized().uiprinted for n in x]
+    assert [n.uiprinted for n in a.rounded(Decimal('1'))] \
+        == [n.rounded(Decimal('1')).uiprinted for n in x]
+    for unit in [None, 'cm']:
+        values = ['-0.0', '-0', '0', '1E+1', '100', '2.50', '8.0']
+        assert [n.uiprinted
+                for n in NumberArray(values, unit=unit).standardized()] \
+            == [Number(v, unit=unit).standardized().uiprinted
+                for v in values]
+    # Values having a unit are only normalized, as by Number.standardized()
+    assert [n.uiprinted for n in NumberArray(['-0', '100', '8.0'],
+                                             unit='cm').standardized()] \
+        == ['-0 cm', '1E+2 cm', '8 cm']
+    assert [n.uiprinted for n in NumberArray(['-0', '100', '8.0'])
+            .standardized()] == ['0', '100', '8']
+    assert a.fracdigits_nb() == [n.fracdigits_nb() for n in x]
+    assert a.fracdigits_nb(ignore_trailing_zeros=False) \
+        == [n.fracdigits_nb(ignore_trailing_zeros=False) for n in x]
+
+
+def test_imprint_errors():
+    """Check wrong variant raises an error."""
+    with pytest.raises(ValueError) as excinfo:
+        NumberArray([1]).imprint(variant='undefined')
+    assert str(excinfo.value) == 'variant must belong to [\'latex\', ' \
+        '\'siunitx\', \'user_input\']; got \'undefined\' instead.'
+
+
+def test_imprint():
+    """Check imprint() matches Number.imprint()."""
+    for unit in [None, 'cm', Unit('cm', exponent=2), r'\degree',
+                 r'\officialeuro']:
+        x = [Number('4.25', unit=unit), Number('-8.0', unit=unit),
+             Number(0, unit=unit)]
+        a = NumberArray(x, unit=unit)
+        for variant in ['latex', 'siunitx', 'user_input']:
+            for start_expr in [True, False]:
+                assert a.imprint(start_expr=start_expr, variant=variant) \
+                    == [n.imprint(start_expr=start_expr, variant=variant)
+                        for n in x]
+        assert a.printed == [n.printed for n in x]
+        assert a.uiprinted == [n.uiprinted for n in x]
+    required.package['eurosym'] = False
+    NumberArray([1], unit=r'\officialeuro').printed
+    assert required.package['eurosym']
+    locale.setlocale(locale.LC_ALL, LOCALE_FR)
+    a = NumberArray([Number('4.25'), Number('2.5')])
+    assert a.printed == ['4,25', '2,5']
+    assert a.imprint(dot=True) == ['4.25', '2.5']
+    locale.setlocale(locale.LC_ALL, LOCALE_US)
@@ -19,9 +19,14 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+from copy import deepcopy
+from decimal import Decimal
+
 import pytest
 
-from mathmakerlib.geometry.tools import convex_hull
+from mathmakerlib import config
+from mathmakerlib.geometry.tools import convex_hull, point_in_hull
+from mathmakerlib.geometry.tools import convex_hull_coordinates
 from mathmakerlib.calculus import Number
 from mathmakerlib.geometry import Point, Vector, LineSegment
 
@@ -63,32 +68,138 @@ def test_instanciation():
 def test_automatic_naming():
     """Check automatic naming of Points."""
     Point.reset_names()
-    Point(0, 0, 'A')
+    p = Point(0, 0, 'A')
     q = Point(1, 1)
     assert q.name == 'B'
     Point.reset_names()
-    q = Point(1, 1)
-    assert q.name == 'A'
-    q = Point(1, 1, 'C')
-    q = Point(1, 1)
-    assert q.name == 'B'
-    q = Point(1, 1)
-    assert q.name == 'D'
+    points = [Point(1, 1)]
+    assert points[-1].name == 'A'
+    points.append(Point(1, 1, 'C'))
+    points.append(Point(1, 1))
+    assert points[-1].name == 'B'
+    points.append(Point(1, 1))
+    assert points[-1].name == 'D'
     for _ in range(23):
-        q = Point(1, 1)
-    assert q.name == 'A$_1$'
+        points.append(Point(1, 1))
+    assert points[-1].name == 'A$_1$'
     for _ in range(26):
-        q = Point(1, 1)
-    assert q.name == 'A$_2$'
+        points.append(Point(1, 1))
+    assert points[-1].name == 'A$_2$'
     Point.reset_names()
     p = Point(1, 1)  # 'A'
     q = Point(1, 1)  # 'B'
     assert q.name == 'B'
     p.name = 'C'  # 'A' is free
+    r = Point(1, 1)
+    assert r.name == 'A'
+    s = Point(1, 1)
+    assert s.name == 'D'
+    del q  # 'B' is free
     q = Point(1, 1)
-    assert q.name == 'A'
-    q = Point(1, 1)
-    assert q.name == 'D'
+    assert q.name == 'B'
+
+
+def test_names_release():
+    """Check names are released when Points are garbage-collected."""
+    Point.reset_names()
+    p = Point(0, 0)
+    assert p.name == 'A'
+    assert 'A' in Point.names_in_use
+    del p
+    assert 'A' not in Point.names_in_use
+    assert Point(0, 0).name == 'A'
+    points = [Point(1, 1) for _ in range(27)]
+    assert points[-1].name == 'A$_1$'
+    del points[1]
+    assert Point(1, 1).name == 'B'
+    points = None
+    assert len(Point.names_in_use) == 0
+    p = Point(0, 0, 'A')
+    q = Point(1, 1, 'A')
+    p.name = 'E'
+    assert 'A' in Point.names_in_use
+    r = deepcopy(q)
+    del q
+    assert 'A' in Point.names_in_use
+    assert r.name == 'A'
+    del r
+    assert 'A' not in Point.names_in_use
+
+
+def test_naming_scope():
+    """Check Points can be named apart, in a naming scope."""
+    Point.reset_names()
+    p = Point(0, 0)
+    with Point.naming_scope():
+        q = Point(1, 1)
+        r = Point(1, 1)
+        assert 'A' in Point.names_in_use
+    assert (p.name, q.name, r.name) == ('A', 'A', 'B')
+    assert 'B' not in Point.names_in_use
+    assert Point(2, 2).name == 'B'
+
+
+def test_reserve_names():
+    """Check names can be reserved for Points yet to be created."""
+    Point.reset_names()
+    p = Point(0, 0)
+    names = Point.reserve_names(3)
+    assert names == ['B', 'C', 'D']
+    assert Point(1, 1).name == 'E'
+    q = Point(1, 1, 'C')
+    assert 'C' in Point.names_in_use
+    del q
+    assert 'C' not in Point.names_in_use
+    assert 'B' in Point.names_in_use
+    assert Point.automatic_names() == ['Z', 'Y', 'X', 'W', 'V', 'U', 'T',
+                                       'S', 'R', 'Q', 'P', 'O', 'N', 'M',
+                                       'L', 'K', 'J', 'I', 'H', 'G', 'F',
+                                       'E', 'C']
+    assert p.name == 'A'
+
+
+def test_release_names():
+    """Check unused reserved names can be released."""
+    Point.reset_names()
+    names = Point.reserve_names(3)
+    assert names == ['A', 'B', 'C']
+    p = Point(0, 0, 'A')
+    Point.release_names(names)
+    assert list(Point.names_in_use) == ['A']
+    assert not Point.names_in_use._reserved
+    assert Point(1, 1).name == 'B'
+    del p
+    assert 'A' not in Point.names_in_use
+
+
+def test_names_in_use_as_a_set():
+    """Check Point.names_in_use still behaves like a set."""
+    Point.reset_names()
+    Point.names_in_use.add('A')
+    Point.names_in_use.add('A')
+    assert list(Point.names_in_use) == ['A']
+    q = Point(0, 0)
+    assert q.name == 'B'
+    p = Point(0, 0, 'C')
+    Point.names_in_use.discard('C')
+    Point.names_in_use.discard('D')
+    assert 'C' not in Point.names_in_use
+    assert Point(1, 1).name == 'C'
+    Point.names_in_use.clear()
+    assert len(Point.names_in_use) == 0
+    assert Point(2, 2).name == 'A'
+    assert (p.name, q.name) == ('C', 'B')
+
+
+def test_automatic_naming_of_many_points():
+    """Check automatic naming goes through the layers in order."""
+    Point.reset_names()
+    points = [Point(0, 0) for _ in range(26 * 40)]
+    assert points[26 * 39 + 1].name == 'B$_39$'
+    del points[26 * 3 + 25]
+    del points[5]
+    new_points = [Point(0, 0) for _ in range(3)]
+    assert [p.name for p in new_points] == ['F', 'Z$_3$', 'A$_40$']
 
 
 def test_str():
@@ -114,6 +225,32 @@ def test_equality():
     assert p.coordinates == Point(0, 0, 'B').coordinates
     assert len(set([p, Point(0, 0, 'B')])) == 1
     assert len(set([Point(0, 0, 0, 'A'), Point(0, 0, 0, 'B')])) == 1
+    assert len(set([Point(0, 0, 'A'), Point(0, 0, 0, 'B')])) == 1
+    assert Point('0.0004', 1) == Point(0, '1.0001')
+    assert hash(Point('0.0004', 1)) == hash(Point(0, '1.0001'))
+    assert Point('0.0005', 1) != Point(0, 1)
+
+
+def test_position_key():
+    """Check the position key follows the coordinates and the precision."""
+    p = Point(1, '0.5', 'A')
+    assert p.position_key == (1000, 500, 0)
+    p.x = '-2.0005'
+    assert p.position_key == (-2001, 500, 0)
+    p.z = 3
+    assert p.position_key == (-2001, 500, 3000)
+    q = Point(-2, '0.504', 3, 'B')
+    assert p != q
+    config.points.DEFAULT_POSITION_PRECISION = Decimal('0.1')
+    try:
+        assert p.position_key == (-20, 5, 30)
+        assert p == q
+        assert hash(p) == hash(q)
+        config.points.DEFAULT_POSITION_PRECISION = Decimal('100')
+        assert Point(150, 250, 'C').position_key == (2, 2, 0)
+    finally:
+        config.points.DEFAULT_POSITION_PRECISION = Decimal('1.000')
+    assert p.position_key == (-2001, 500, 3000)
 
 
 def test_rotation():
@@ -156,6 +293,30 @@ def test_rotation3D():
         == (Number('0.866'), Number('0'), Number('-0.5'))
 
 
+def test_float_backend_rotation():
+    """Check rotating with the float backend gives the same Points."""
+    pointO = Point(0, 0, 'O')
+    pointA = Point(Number('1.5'), Number('-0.25'), 'A')
+    pointB = Point(1, 2, 3, 'B')
+    axis = Vector(1, 1, 1)
+    expected = [pointA.rotate(pointO, 30),
+                pointA.rotate(pointO, Number('127.5'), rename='keep_name'),
+                pointB.rotate(pointO, 37, axis),
+                Point(Number('0.0005'), 0, 'C').rotate(pointO, 0)]
+    with config.geometry.use_backend('float'):
+        results = [pointA.rotate(pointO, 30),
+                   pointA.rotate(pointO, Number('127.5'),
+                                 rename='keep_name'),
+                   pointB.rotate(pointO, 37, axis),
+                   Point(Number('0.0005'), 0, 'C').rotate(pointO, 0)]
+    assert config.geometry.BACKEND == 'decimal'
+    for e, r in zip(expected, results):
+        assert r.coordinates == e.coordinates
+        assert r.name == e.name
+        assert r.three_dimensional == e.three_dimensional
+    assert results[3].x == Number('0.001')
+
+
 def test_drawing():
     """Check drawing is correct."""
     p = Point(0, 0, None)
@@ -230,6 +391,32 @@ def test_convex_hull():
     assert cv == [Point(0, 0)]
 
 
+def test_convex_hull_coordinates():
+    assert convex_hull_coordinates([]) == []
+    assert convex_hull_coordinates([(1, 1), (1, 1)]) == [(1, 1)]
+    assert convex_hull_coordinates([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2),
+                                    (1, 0)]) \
+        == [(0, 0), (2, 0), (2, 2), (0, 2)]
+    assert convex_hull_coordinates([(0, 0), (1, 1), (2, 2)]) \
+        == [(0, 0), (2, 2)]
+    A, B = Point(0, 0, 'A'), Point(0, 0, 'B')
+    assert convex_hull(A, B, Point(1, 0))[0].name == 'A'
+
+
+def test_point_in_hull():
+    square = convex_hull(Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2))
+    assert point_in_hull([Point(1, 1), Point(2, 1), Point(0, 0),
+                          Point(Number('2.001'), 1), Point(-1, -1)],
+                         square) == [True, True, True, False, False]
+    segment = convex_hull(Point(0, 0), Point(2, 2))
+    assert point_in_hull([Point(1, 1), Point(3, 3), Point(1, 0)],
+                         segment) == [True, False, False]
+    assert point_in_hull([Point(0, 0), Point(0, 1)], [Point(0, 0)]) \
+        == [True, False]
+    assert point_in_hull([Point(0, 0)], []) == [False]
+    assert point_in_hull([], square) == []
+
+
 def test_belongs_to():
     s = LineSegment(Point(0, 0), Point(4, 4))
     assert Point(1, 1).belongs_to(s)
@@ -19,16 +19,20 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
 from mathmakerlib import required, config
+from mathmakerlib.exceptions import ZeroVector
 from mathmakerlib.calculus import Number, Unit
 from mathmakerlib.geometry import Point, Bipoint
 from mathmakerlib.geometry.angle import AngleDecoration, Angle, AnglesSet
 from mathmakerlib.geometry.angle import AVAILABLE_NAMING_MODES
 from mathmakerlib.geometry.angle import autosize_decoration_radius
+from mathmakerlib.geometry.tools import delta, slope360, bisector_slope360
+from mathmakerlib.geometry.tools import angle_measure
 
 DATA_PATH = Path(__file__).parent.parent.parent \
     / 'tests_compilations/data/angles'
@@ -340,6 +344,9 @@ def test_measures_2D():
     Y = Point(-6, -1, 'Y')
     α = Angle(X, Ω, Y)
     assert α.measure.rounded(Number('0.001')) == 180
+    assert α.midslope == Number('99.462')
+    α = Angle(Point(3, 1, 'X'), Ω, Point(-6, -2, 'Y'))
+    assert α.midslope == Number('108.435')
 
     β = Angle(X, Ω, Point(1, -6, 'Z'))
     assert β.winding == 'clockwise'
@@ -359,6 +366,38 @@ def test_measures_3D():
     D = Point(0, 1, 1, 'D')
     γ = Angle(A, Ω, D)
     assert γ.measure.rounded(Number('0.001')) == Number(90)
+    assert γ.midslope == Number(45)
+    assert Angle(Point(1, 2, 3), Point(0, 1, 0), Point(-1, 1, 2)).midslope \
+        == Number('94.567')
+    γ.midslope = 30
+    assert γ.midslope == Number(30)
+
+
+def test_geometry_kernel():
+    """Check the arithmetic functions used to compute Angles."""
+    Ω = Point(0, 0, 'Ω')
+    u = delta(Ω, Point(Number('0.5'), -1))
+    assert u == (Number('0.5'), Number(-1), Number(0))
+    assert all(type(c) is Decimal for c in u)
+    assert slope360((1, 0)) == 0
+    assert slope360((0, -2)) == 270
+    assert slope360((-1, -1)) == 225
+    assert slope360((1, 2)) == 63.435
+    with pytest.raises(ZeroVector):
+        slope360((0, 0))
+    assert bisector_slope360((1, 0), (0, 1)) == 45
+    assert bisector_slope360((0, 1), (1, 0)) == 225
+    assert bisector_slope360((1, 0), (-1, 0)) == 90
+    assert slope360((0, -1, 1)) == 270
+    assert slope360((1, 0, 1)) == 45
+    assert bisector_slope360((1, 0, 0), (0, 1, 1)) == 45
+    assert angle_measure((Decimal(1), Decimal(0)),
+                         (Decimal(0), Decimal(1))) == 90
+    assert angle_measure((Decimal(0), Decimal(1)),
+                         (Decimal(1), Decimal(0))) == 270
+    assert angle_measure((Decimal(1), Decimal(0), Decimal(0)),
+                         (Decimal(0), Decimal(1), Decimal(1)),
+                         three_dimensional=True) == 90
 
 
 def test_naming():
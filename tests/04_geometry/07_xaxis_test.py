@@ -19,6 +19,7 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import io
 import locale
 
 from mathmakerlib.calculus import Number, Fraction
@@ -116,3 +117,10 @@ def test_disabled_methods():
     assert a.tikz_drawing_comment() is None
     assert a.tikz_label() == ''
     assert a.tikz_points_labels() is None
+
+
+def test_draw_to():
+    a = XAxis(2, 4, subdivisions=3)
+    fp = io.StringIO()
+    a.draw_to(fp)
+    assert fp.getvalue() == a.drawn
@@ -155,6 +155,30 @@ def test_instanciation(pointO, pointA, pointB, pointC):
     assert q.vertices[3] == Point(1, -1)
 
 
+def test_lazy_sides_and_angles(pointO, pointA, pointB, pointC):
+    """Check sides and angles are only built when needed."""
+    p = Polygon(pointO, pointA, pointB, pointC, sloped_sides_labels=False)
+    assert p._sides is None
+    assert p._angles is None
+    assert not p._label_positions_ready
+    assert p.type == 'Quadrilateral'
+    assert p.name == 'OABC'
+    assert p == Polygon(pointA, pointB, pointC, pointO)
+    assert p._sides is None
+    assert p._angles is None
+    assert not p._label_positions_ready
+    sides = p.sides
+    assert p.sides is sides
+    assert p._angles is not None
+    assert all(not s.sloped_label for s in p.sides)
+    assert [v.label_position for v in p.vertices] \
+        == ['below left', 'below right', 'above right', 'above left']
+    assert p.sides[1].points[0] is p.vertices[1]
+    assert p.angles[1].vertex is p.vertices[1]
+    p.sloped_sides_labels = True
+    assert all(s.sloped_label for s in p.sides)
+
+
 def test_isobarycenter2D(pointO, pointA, pointB, pointC):
     """Check isobarycenter for 2D Polygons."""
     p = Polygon(pointO, pointA, pointB, pointC)
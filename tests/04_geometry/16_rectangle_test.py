@@ -32,6 +32,8 @@ def test_default_instanciation():
     assert r.width == Number(1)
     assert r.length == Number(2)
     assert r.area == Number(2)
+    assert r._angles is None
+    assert all(a.mark_right for a in r.angles)
 
 
 def test_instanciation_from_points():
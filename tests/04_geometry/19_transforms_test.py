@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import pytest
+
+from mathmakerlib import config
+from mathmakerlib.calculus import Number
+from mathmakerlib.geometry import Point, Vector
+from mathmakerlib.geometry import rotation_matrix, transform_points
+
+
+def test_transform_points_errors():
+    """Check wrong arguments are detected."""
+    points = [Point(0, 0, 'A'), Point(1, 0, 'B')]
+    with pytest.raises(ValueError) as excinfo:
+        transform_points(points, [[1, 0, 0, 0], [0, 1, 0, 0]],
+                         rename=['C'])
+    assert str(excinfo.value) == 'Expected 2 names to rename the '\
+        'transformed Points, got 1 instead.'
+    with pytest.raises(ValueError) as excinfo:
+        transform_points(points, [[1, 0, 0], [0, 1, 0]])
+    assert str(excinfo.value) == 'The matrix must have two or three rows '\
+        'of four numbers each.'
+
+
+def test_transform_points():
+    """Check transforming several Points at once."""
+    points = [Point(0, 0, 'A'), Point(1, 0, 'B'), Point(1, 1, 'C')]
+    translated = transform_points(points, [[1, 0, 0, 2], [0, 1, 0, -1]])
+    assert [p.name for p in translated] == ['A', 'B', 'C']
+    assert translated == [Point(2, -1), Point(3, -1), Point(3, 0)]
+    assert not any(p.three_dimensional for p in translated)
+    assert [p.name for p in transform_points(points, [[1, 0, 0, 2],
+                                                      [0, 1, 0, -1]],
+                                             rename='auto')] \
+        == ["A'", "B'", "C'"]
+    assert [p.name for p in transform_points(points, [[1, 0, 0, 2],
+                                                      [0, 1, 0, -1]],
+                                             rename=['D', 'E', None])] \
+        == ['D', 'E', None]
+    lifted = transform_points(points, [[1, 0, 0, 0], [0, 1, 0, 0],
+                                       [1, 1, 0, 0]])
+    assert all(p.three_dimensional for p in lifted)
+    assert lifted[2].coordinates == (1, 1, 2)
+
+
+def test_rotation_matrix():
+    """Check transforming Points is the same as rotating them."""
+    Ω = Point(1, -1, 'O')
+    points = [Point(0, 0, 'A'), Point(Number('2.5'), 3, 'B'),
+              Point(-4, Number('0.75'), 'C')]
+    expected = [p.rotate(Ω, 37, rename='keep_name') for p in points]
+    for backend in ['decimal', 'float']:
+        with config.geometry.use_backend(backend):
+            assert transform_points(points, rotation_matrix(Ω, 37),
+                                    precision=Number('1.000')) == expected
+    Ω = Point(0, 0, 0, 'O')
+    points = [Point(1, 2, 3, 'A'), Point(-1, 0, 2, 'B')]
+    axis = Vector(1, 1, 1)
+    expected = [p.rotate(Ω, 50, axis, rename='keep_name') for p in points]
+    for backend in ['decimal', 'float']:
+        with config.geometry.use_backend(backend):
+            result = transform_points(points, rotation_matrix(Ω, 50, axis),
+                                      precision=Number('1.000'))
+            assert [r.coordinates for r in result] \
+                == [e.coordinates for e in expected]
@@ -22,6 +22,7 @@
 import pytest
 
 from mathmakerlib.geometry import Point, Polyhedron, Triangle, LineSegment
+from mathmakerlib.geometry import Mesh
 
 
 class Tetrahedron(Polyhedron):
@@ -109,3 +110,52 @@ def test_instanciation():
     assert t.name == 'SABC'
     t = Tetrahedron(Point(0, 0, 0, label='?'), Point(1, 0, 0), Point(0, 1, 0),
                     Point(0, 0, 1), name='SABC')
+
+
+def test_edges_index():
+    """Check the edges' index of Polyhedrons."""
+    t = Tetrahedron(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0),
+                    Point(0, 0, 1), name='SABC')
+    assert t.edges_keys == [(0, 1), (1, 2), (2, 0), (2, 3), (3, 0), (3, 1)]
+    assert t.edge(1, 0) is t.edges[0]
+    assert t.face_edge(2, 1) is t.edge(3, 1)
+    assert t.faces_indices == [(0, 1, 2), (0, 2, 3), (0, 3, 1), (1, 2, 3)]
+    assert t.adjacent_faces(0, 1) == [0, 2]
+    assert t.adjacent_faces(3, 2) == [1, 3]
+    assert sorted(t.neighbours(0)) == [1, 2, 3]
+    with pytest.raises(ValueError) as excinfo:
+        t.edge(0, 0)
+    assert str(excinfo.value) == 'Vertices #0 and #0 are not joined by an '\
+        'edge.'
+
+
+def test_mesh():
+    """Check Meshes, and Polyhedrons defined by their faces' indices."""
+    with pytest.raises(ValueError) as excinfo:
+        Mesh([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [(0, 1)])
+    assert str(excinfo.value) == 'A face must have at least three '\
+        'vertices. Found (0, 1) as face #0.'
+    with pytest.raises(ValueError) as excinfo:
+        Mesh([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [(0, 1, 3)])
+    assert str(excinfo.value) == 'The vertices of face #0 must be '\
+        'identified by their indices, between 0 and 2. Found (0, 1, 3) '\
+        'instead.'
+
+    class IndexedTetrahedron(Polyhedron):
+        def _init_faces(self):
+            self._faces_indices = [(0, 1, 2), (0, 2, 3), (0, 3, 1),
+                                   (1, 2, 3)]
+
+        def _face_polygon(self, *vertices):
+            return Triangle(*vertices)
+
+    t = IndexedTetrahedron(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0),
+                           Point(0, 0, 1), name='SABC')
+    assert t._faces is None and t._edges is None
+    assert t.mesh.coordinates[1] == (1, 0, 0)
+    assert t.edges_keys == [(0, 1), (1, 2), (2, 0), (2, 3), (3, 0), (3, 1)]
+    assert t._edges is None and t._faces is None
+    assert t.edges[1] == LineSegment(Point(1, 0, 0), Point(0, 1, 0))
+    assert t._faces is None
+    assert t.faces[3] == Triangle(Point(1, 0, 0, 'A'), Point(0, 1, 0, 'B'),
+                                  Point(0, 0, 1, 'C'))
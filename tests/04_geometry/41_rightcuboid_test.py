@@ -19,10 +19,13 @@
 # along with Mathmaker Lib; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import gc
+from decimal import InvalidOperation
+
 import pytest
 
 from mathmakerlib.calculus import Number
-from mathmakerlib.geometry import Point, RightCuboid
+from mathmakerlib.geometry import Point, RightCuboid, Rectangle
 
 
 @pytest.fixture()
@@ -45,6 +48,16 @@ def test_instanciation_2D_start_vertex_error():
         'Point. Found this two-dimensional Point instead: Point A(2, 3).'
 
 
+def test_instanciation_wrong_dimensions_names():
+    """Check a failed instanciation does not keep names reserved."""
+    Point.reset_names()
+    with pytest.raises(InvalidOperation):
+        RightCuboid(dimensions=('a', 1, 1))
+    gc.collect()
+    assert not Point.names_in_use._reserved
+    assert len(Point.names_in_use) == 0
+
+
 def test_instanciation_dimension_error():
     """Check errors when instanciating a new RightCuboid."""
     with pytest.raises(TypeError) as excinfo:
@@ -67,6 +80,13 @@ def test_instanciation(rc):
     assert rc.depth == 3
     assert rc.height == 2
     assert rc.vertices[0] == Point(0, 0, 0)
+    assert rc.faces_indices[1] == (0, 1, 5, 4)
+    assert len(rc.edges) == 12
+    assert rc.neighbours(0) == [1, 3, 4]
+    assert rc.adjacent_faces(1, 5) == [1, 2]
+    assert rc.face_edge(2, 2) is rc.edge(5, 6)
+    assert rc._faces is None
+    assert all(isinstance(f, Rectangle) for f in rc.faces)
 
 
 def test_unset_labels_width_error(rc):
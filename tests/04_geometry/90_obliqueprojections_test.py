@@ -22,7 +22,10 @@
 import pytest
 
 from mathmakerlib import config
+from mathmakerlib.calculus import Number
 from mathmakerlib.geometry import RightCuboid, ObliqueProjection
+from mathmakerlib.geometry.projections.oblique_projection \
+    import DIRECTION_VALUES
 
 
 @pytest.fixture()
@@ -459,3 +462,21 @@ def test_draw_thick_and_blue(rc):
 % Label Points
 
 \end{tikzpicture}"""
+
+
+def test_float_backend(rc):
+    """Check the float backend draws the same projections."""
+    assert config.geometry.BACKEND == 'decimal'
+    expected = {d: ObliqueProjection(rc, direction=d).drawn
+                for d in DIRECTION_VALUES}
+    with config.geometry.use_backend('float'):
+        for d in DIRECTION_VALUES:
+            assert ObliqueProjection(rc, direction=d).drawn == expected[d]
+    # Two ordinates, 6.2675 with floats, are actually a bit lower
+    rc = RightCuboid(dimensions=(4, 7, Number('2.93')), name='ABCDEFGH')
+    expected = ObliqueProjection(rc, direction='bottom-right',
+                                 k=Number('0.5'), α=60).drawn
+    assert '6.267);' in expected and '6.268' not in expected
+    with config.geometry.use_backend('float'):
+        assert ObliqueProjection(rc, direction='bottom-right',
+                                 k=Number('0.5'), α=60).drawn == expected
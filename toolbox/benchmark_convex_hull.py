@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# # -*- coding: utf-8 -*-
+# Mathmaker Lib offers lualatex-printable mathematical objects.
+# Copyright 2006-2019 Nicolas Hainaux <nh.techn@gmail.com>
+
+# This file is part of Mathmaker Lib.
+
+# Mathmaker Lib is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# any later version.
+
+# Mathmaker Lib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Mathmaker Lib; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""
+Compare the convex hull engine of geometry.tools with the former one.
+
+The former implementation, working directly on the Points and their Number
+coordinates, is reproduced below as reference_convex_hull(). Both are run on
+the same random clouds of Points and must return the same hulls. Each timed
+run gets fresh copies of the Points, so the cost of calculating their
+position_keys is included.
+
+Usage: python3 toolbox/benchmark_convex_hull.py [SIZE ...]
+"""
+
+import sys
+import random
+import timeit
+
+from mathmakerlib.calculus import Number
+from mathmakerlib.geometry import Point
+from mathmakerlib.geometry.tools import convex_hull, point_in_hull
+
+SIZES = [10, 100, 1000]
+REPEAT = 5
+
+
+def reference_convex_hull(*points):
+    """The convex hull, as it was calculated before, on Number coordinates."""
+    points = sorted(set(points), key=lambda point: point.coordinates)
+    if len(points) <= 1:
+        return points
+
+    def cross(o, a, b):
+        return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+
+    lower = []
+    for p in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def reference_point_in_hull(points, hull):
+    """Check the points one by one, like it was done before."""
+    def cross(o, a, b):
+        return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+    return [all(cross(hull[i - 1], hull[i], p) >= 0
+                for i in range(len(hull)))
+            for p in points]
+
+
+def random_cloud(size):
+    return [Point(Number(random.randint(-5000, 5000)) / 1000,
+                  Number(random.randint(-5000, 5000)) / 1000, None)
+            for _ in range(size)]
+
+
+def fresh(points):
+    """
+    Copy points, so that none of their position_keys is cached yet.
+
+    Otherwise, the cost of the position_keys' calculation would only show up
+    in the first timed run.
+    """
+    return [Point(p.x, p.y, None) for p in points]
+
+
+def best_time(func, *args):
+    """Best time of func(*fresh(arg) for arg in args), over REPEAT runs."""
+    times = []
+    for _ in range(REPEAT):
+        fresh_args = [fresh(arg) for arg in args]
+        start = timeit.default_timer()
+        func(*fresh_args)
+        times.append(timeit.default_timer() - start)
+    return min(times)
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1:]] or SIZES
+    random.seed(0)
+    print('{:>8} {:>12} {:>12} {:>8}'
+          .format('points', 'former (s)', 'current (s)', 'ratio'))
+    for size in sizes:
+        cloud = random_cloud(size)
+        hull = convex_hull(*fresh(cloud))
+        if hull != reference_convex_hull(*fresh(cloud)):
+            sys.exit('Different hulls for {} points!'.format(size))
+        if (point_in_hull(fresh(cloud), fresh(hull))
+            != reference_point_in_hull(fresh(cloud), fresh(hull))):
+            sys.exit('Different inclusion tests for {} points!'.format(size))
+        for label, former, current, args in [
+            ('hull', lambda c: reference_convex_hull(*c),
+             lambda c: convex_hull(*c), (cloud, )),
+            ('in hull', reference_point_in_hull, point_in_hull,
+             (cloud, hull))]:
+            t0 = best_time(former, *args)
+            t1 = best_time(current, *args)
+            print('{:>8} {:>12.6f} {:>12.6f} {:>7.1f}x  ({})'
+                  .format(size, t0, t1, t0 / t1, label))
+
+
+if __name__ == '__main__':
+    main()